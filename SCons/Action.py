@@ -102,12 +102,12 @@ way for wrapping up the functions.
 
 from __future__ import annotations
 
-import inspect
 import os
 import pickle
 import re
 import subprocess
 import sys
+import types
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from subprocess import DEVNULL, PIPE
@@ -338,6 +338,9 @@ def _object_instance_content(obj):
     Returns:
         bytearray or bytes representing the obj suitable for generating a signature from.
     """
+    # inspect is costly to import and only needed here, so defer it
+    import inspect  # pylint: disable=import-outside-toplevel
+
     retval = bytearray()
 
     if obj is None:
@@ -968,7 +971,7 @@ def _subproc(scons_env, cmd, error='ignore', **kw):
     finally:
         # clean up open file handles stored in parent's kw
         for k, v in kw.items():
-            if inspect.ismethod(getattr(v, 'close', None)):
+            if isinstance(getattr(v, 'close', None), types.MethodType):
                 v.close()
 
     return pobj
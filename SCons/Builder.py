@@ -330,6 +330,16 @@ def _node_errors(builder, env, tlist, slist):
         if len(slist) > 1:
             raise UserError("More than one source given for single-source builder: targets=%s sources=%s" % (list(map(str,tlist)), list(map(str,slist))))
 
+def _batch_size(env) -> int:
+    """Return the limit on target groups per batch ($BATCH_SIZE), or 0."""
+    size = env.subst('$BATCH_SIZE')
+    if not size:
+        return 0
+    try:
+        return int(size)
+    except ValueError:
+        raise UserError("BATCH_SIZE must be an integer, not %r" % size)
+
 class EmitterProxy:
     """This is a callable class that can act as a
     Builder emitter.  It holds on to a string that
@@ -613,7 +623,13 @@ class BuilderBase:
                 except KeyError:
                     pass
                 else:
-                    executor.add_batch(tlist, slist)
+                    batch_size = _batch_size(env or self.env)
+                    if batch_size and len(executor.batches) >= batch_size:
+                        # This batch is full: start a new one.
+                        SCons.Executor.CloseBatchExecutor(key)
+                        executor = None
+                    else:
+                        executor.add_batch(tlist, slist)
 
         if executor is None:
             executor = SCons.Executor.Executor(self.action, env, [],
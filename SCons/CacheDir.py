@@ -37,6 +37,7 @@ import SCons.Errors
 # import SCons.Node.FS  # used for hash_chunksice, but causes import loop
 import SCons.Warnings
 import SCons.Util
+from SCons.Util.stats import trace_stats
 
 CACHE_PREFIX_LEN = 2  # first two characters used as subdirectory name
 CACHE_TAG = (
@@ -378,20 +379,22 @@ class CacheDir:
             return False
 
         env = node.get_build_env()
-        if cache_show:
-            if CacheRetrieveSilent(node, [], env, execute=1) == 0:
-                node.build(presub=0, execute=0)
-                return True
-        else:
-            if CacheRetrieve(node, [], env, execute=1) == 0:
-                return True
+        with trace_stats.span('cache', 'retrieve', node):
+            if cache_show:
+                if CacheRetrieveSilent(node, [], env, execute=1) == 0:
+                    node.build(presub=0, execute=0)
+                    return True
+            else:
+                if CacheRetrieve(node, [], env, execute=1) == 0:
+                    return True
 
         return False
 
     def push(self, node):
         if self.is_readonly() or not self.is_enabled():
             return
-        return CachePush(node, [], node.get_build_env())
+        with trace_stats.span('cache', 'push', node):
+            return CachePush(node, [], node.get_build_env())
 
     def push_if_forced(self, node):
         if cache_force:
@@ -34,7 +34,6 @@ import os
 import sys
 import time
 import weakref
-import inspect
 
 # Global variable that gets set to 'True' by the Main script,
 # when the creation of class instances should get tracked.
@@ -75,7 +74,7 @@ def listLoggedInstances(classes, file=sys.stdout) -> None:
     for classname in string_to_classes(classes):
         file.write('\n%s:\n' % classname)
         for ref in tracked_classes[classname]:
-            if inspect.isclass(ref):
+            if isinstance(ref, type):
                 obj = ref()
             else:
                 obj = ref
@@ -2821,10 +2821,18 @@ class Base(SubstitutionEnvironment):
             t.set_pseudo()
         return tlist
 
-    def Repository(self, *dirs: str | DirNode | list[str | DirNode]) -> None:
-        """Specify Repository directories to search."""
+    def Repository(
+        self, *dirs: str | DirNode | list[str | DirNode], manifest: bool | str = False
+    ) -> None:
+        """Specify Repository directories to search.
+
+        .. versionchanged:: 4.12.0
+           The *manifest* parameter was added.
+        """
         dirs = self.arg2nodes(dirs, self.fs.Dir)
-        self.fs.Repository(*dirs)
+        if is_String(manifest):
+            manifest = self.subst(manifest)
+        self.fs.Repository(*dirs, manifest=manifest)
 
     def Requires(
         self,
@@ -2859,6 +2867,7 @@ class Base(SubstitutionEnvironment):
 
     def SConsignFile(
         self, name: str | None = "", dbm_module: ModuleType | None = None,
+        sharded: bool = False,
     ) -> None:
         """Specify the base name of the signature database.
 
@@ -2874,12 +2883,19 @@ class Base(SubstitutionEnvironment):
         The module must follow the Python Database API specification
         described in PEP 249. The defaut is :mod:`SCons.dblite`.
 
+        If *sharded* is true, the database is split by top-level
+        directory into separate files, which are only read when a
+        directory they cover is used and are written concurrently.
+
         For historical reasons, if *name* is ``None``, the signatures are
         stored as one file per directory, rather than in a single project-wide
         database.
 
         .. deprecated:: 4.11.0
            The signature-file-per-directory mode is deprecated.
+
+        .. versionchanged:: 4.12.0
+           The *sharded* parameter was added.
         """
         if name is not None:
             if not name:
@@ -2892,7 +2908,7 @@ class Base(SubstitutionEnvironment):
             sconsign_dir = os.path.dirname(name)
             if sconsign_dir and not os.path.exists(sconsign_dir):
                 self.Execute(SCons.Defaults.Mkdir(sconsign_dir))
-        SCons.SConsign.File(name, dbm_module)
+        SCons.SConsign.File(name, dbm_module, sharded)
 
     def SideEffect(
         self,
@@ -2981,17 +2997,22 @@ class Base(SubstitutionEnvironment):
         mynode = self.arg2nodes(node, self.fs.Entry)[0]
         sources = []
 
-        def build_source(ss) -> None:
-            for s in ss:
+        # Walk iteratively, visiting each node once: derived files
+        # and directories are commonly shared by many parents.
+        seen = set()
+        pending = [mynode.all_children()]
+        while pending:
+            for s in pending.pop():
+                if s in seen:
+                    continue
+                seen.add(s)
                 if isinstance(s, SCons.Node.FS.Dir):
-                    build_source(s.all_children())
+                    pending.append(s.all_children())
                 elif s.has_builder():
-                    build_source(s.sources)
+                    pending.append(s.sources)
                 elif isinstance(s.disambiguate(), SCons.Node.FS.File):
                     sources.append(s)
 
-        build_source(mynode.all_children())
-
         def final_source(node):
             while node != node.srcnode():
                 node = node.srcnode()
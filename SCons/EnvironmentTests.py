@@ -3462,8 +3462,10 @@ def generate(env):
         class MyFS:
             def __init__(self) -> None:
                 self.list = []
-            def Repository(self, *dirs) -> None:
+                self.manifests = []
+            def Repository(self, *dirs, manifest=False) -> None:
                 self.list.extend(list(dirs))
+                self.manifests.append(manifest)
             def Dir(self, name):
                 return name
         env = self.TestEnvironment(FOO='rrr', BAR='sss')
@@ -3472,6 +3474,10 @@ def generate(env):
         env.Repository('/tmp/$FOO', '/tmp/$BAR/foo')
         expect = ['/tmp/foo', '/tmp/rrr', '/tmp/sss/foo']
         assert env.fs.list == expect, env.fs.list
+        env.Repository('/tmp/bar', manifest=True)
+        env.Repository('/tmp/baz', manifest='${FOO}_manifest')
+        expect = [False, False, True, 'rrr_manifest']
+        assert env.fs.manifests == expect, env.fs.manifests
 
     def test_Scanner(self) -> None:
         """Test the Scanner() method"""
@@ -3508,9 +3514,11 @@ def generate(env):
         try:
             fnames = []
             dbms = []
-            def capture(name, dbm_module, fnames=fnames, dbms=dbms) -> None:
+            shards = []
+            def capture(name, dbm_module, sharded=False, fnames=fnames, dbms=dbms) -> None:
                 fnames.append(name)
                 dbms.append(dbm_module)
+                shards.append(sharded)
 
             save_SConsign_File = SCons.SConsign.File
             SCons.SConsign.File = capture
@@ -3546,6 +3554,12 @@ def generate(env):
             env.SConsignFile(None)
             assert fnames[-1] is None, fnames
             assert dbms[-1] is None, dbms
+            assert not shards[-1], shards
+
+            env.SConsignFile('foo', sharded=True)
+            assert fnames[-1] == os.path.join(os.sep, 'dir', 'foo'), fnames
+            assert dbms[-1] is None, dbms
+            assert shards[-1], shards
         finally:
             SCons.SConsign.File = save_SConsign_File
 
@@ -560,6 +560,15 @@ def AddBatchExecutor(key: str, executor: Executor) -> None:
     assert key not in _batch_executors
     _batch_executors[key] = executor
 
+def CloseBatchExecutor(key: str) -> None:
+    """Stop collecting targets into the batch Executor for *key*.
+
+    The next target with the same batch key starts a new Executor.
+
+    .. versionadded:: 4.12.0
+    """
+    _batch_executors.pop(key, None)
+
 nullenv = None
 
 
@@ -35,6 +35,7 @@ from __future__ import annotations
 import fnmatch
 import importlib.util
 import os
+import pickle
 import re
 import shutil
 import stat
@@ -1264,6 +1265,8 @@ class FS(LocalFS):
         self.Root: dict[str, RootDir] = {}
         self.SConstruct_dir: DirNode | None = None
         self.max_drift: int = default_max_drift
+        self.glob_cache: GlobCache | None = None
+        self.repository_manifests: list[RepositoryManifest] = []
 
         self.pathTop = path or os.getcwd()
         if do_splitdrive:
@@ -1288,6 +1291,47 @@ class FS(LocalFS):
     def set_max_drift(self, max_drift: int) -> None:
         self.max_drift = max_drift
 
+    def enable_glob_cache(self) -> None:
+        """Start using the persistent cache of directory listings for Glob.
+
+        The cache is kept in :data:`GLOB_CACHE_FILE` in the top directory.
+
+        .. versionadded:: 4.12.0
+        """
+        if self.glob_cache is None:
+            self.glob_cache = GlobCache(
+                os.path.join(self.Top.get_abspath(), GLOB_CACHE_FILE), self
+            )
+
+    def _repository_manifest(self, path: str) -> RepositoryManifest | None:
+        """Return the manifest of the repository holding *path*, if any."""
+        for manifest in self.repository_manifests:
+            if manifest.contains(path):
+                return manifest
+        return None
+
+    def stat(self, path: str):
+        if self.repository_manifests:
+            manifest = self._repository_manifest(path)
+            if manifest is not None:
+                return manifest.stat(path)
+        return os.stat(path)
+
+    def listdir(self, path: str) -> list[str]:
+        if self.repository_manifests:
+            manifest = self._repository_manifest(path)
+            if manifest is not None:
+                return manifest.listdir(path)
+        return os.listdir(path)
+
+    def refresh_repository_manifests(self) -> None:
+        """Re-read any repository manifest that changed on disk.
+
+        .. versionadded:: 4.12.0
+        """
+        for manifest in self.repository_manifests:
+            manifest.refresh()
+
     def getcwd(self) -> DirNode:
         if hasattr(self, "_cwd"):
             return self._cwd
@@ -1516,12 +1560,40 @@ class FS(LocalFS):
             raise SCons.Errors.UserError("'%s' already has a source directory: '%s'."%(variant_dir, variant_dir.srcdir))
         variant_dir.link(src_dir, duplicate)
 
-    def Repository(self, *dirs: str | DirNode) -> None:
-        """Specify Repository directories to search."""
+    def Repository(self, *dirs: str | DirNode, manifest: bool | str = False) -> None:
+        """Specify Repository directories to search.
+
+        If *manifest* is true, lookups in the repositories are answered
+        from a :class:`RepositoryManifest` instead of the file system:
+        from the :data:`REPOSITORY_MANIFEST` file in each repository,
+        or from the file *manifest* names, for a single repository.
+
+        .. versionchanged:: 4.12.0
+           The *manifest* parameter was added.
+        """
+        if isinstance(manifest, str) and len(dirs) != 1:
+            raise SCons.Errors.UserError(
+                "A manifest file can only be given for a single Repository."
+            )
         for d in dirs:
             if not isinstance(d, SCons.Node.Node):
                 d = self.Dir(d)
             self.Top.addRepository(d)
+            if manifest:
+                root = d.get_abspath()
+                if isinstance(manifest, str):
+                    path = os.path.join(self.getcwd().get_abspath(), manifest)
+                else:
+                    path = os.path.join(root, REPOSITORY_MANIFEST)
+                if not os.path.isfile(path):
+                    raise SCons.Errors.UserError(
+                        "Repository manifest `%s' not found." % path
+                    )
+                top = self.Top.get_abspath()
+                exclude = top if self.Top.is_under(d) else None
+                self.repository_manifests.append(
+                    RepositoryManifest(root, path, exclude)
+                )
 
     def PyPackageDir(self, modulename: str) -> DirNode | None:
         r"""Locate the directory of Python module *modulename*.
@@ -1611,6 +1683,221 @@ glob_magic_check = re.compile('[*?[]')
 def has_glob_magic(s: str) -> bool:
     return glob_magic_check.search(s) is not None
 
+def _glob_filter(names: list[str], pattern: str) -> list[str]:
+    """Return the *names* matching a single Glob *pattern*."""
+    if pattern[0] != '.':
+        names = [x for x in names if x[0] != '.']
+    return fnmatch.filter(names, pattern)
+
+# Name of the --glob-cache file, in the top directory.
+GLOB_CACHE_FILE = '.glob_cache'
+
+# Listings of directories modified less than this many nanoseconds
+# before they were read are not cached: a change made within the same
+# tick of the file system clock would not change the modification time.
+GLOB_CACHE_RACY_NS = 2 * 1000000000
+
+
+class GlobCache:
+    """A persistent cache of the directory listings used by Glob.
+
+    Maps the absolute path of each directory globbed on disk to its
+    modification time, the names of its entries and, for each pattern
+    matched in it, the matching names. While the modification time is
+    unchanged, the directory doesn't need listing and the patterns don't
+    need matching again, in this run or the following ones.  The
+    directories are read through *fs*, so a repository manifest is used.
+
+    .. versionadded:: 4.12.0
+    """
+
+    version = 1
+
+    def __init__(self, path: str, fs: FS) -> None:
+        self.path = path
+        self.fs = fs
+        self.dirty = False
+        try:
+            with open(path, 'rb') as f:
+                version, self.entries = pickle.load(f)
+            if version != self.version:
+                self.entries = {}
+        except Exception:  # pylint: disable=broad-except
+            # missing, corrupt or from another version: start over
+            self.entries = {}
+
+    def matches(self, path: str, pattern: str) -> list[str] | None:
+        """Return the names in directory *path* matching *pattern*.
+
+        Returns ``None`` if the directory can't be read.
+        """
+        try:
+            mtime = self.fs.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        entry = self.entries.get(path)
+        if entry is None or entry[0] != mtime:
+            try:
+                names = self.fs.listdir(path)
+            except OSError:
+                return None
+            entry = (mtime, names, {})
+            if time.time_ns() - mtime >= GLOB_CACHE_RACY_NS:
+                self.entries[path] = entry
+                self.dirty = True
+            elif self.entries.pop(path, None) is not None:
+                self.dirty = True
+        try:
+            return entry[2][pattern]
+        except KeyError:
+            result = entry[2][pattern] = _glob_filter(entry[1], pattern)
+            if self.entries.get(path) is entry:
+                self.dirty = True
+            return result
+
+    def write(self) -> None:
+        """Write the cache out, if anything changed."""
+        if not self.dirty:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump((self.version, self.entries), f)
+            os.replace(tmp, self.path)
+        except OSError:
+            # can't write the cache, just skip it
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        self.dirty = False
+
+
+# Name of the manifest file in the top directory of a Repository.
+REPOSITORY_MANIFEST = '.scons_manifest'
+
+
+class RepositoryManifest:
+    """A listing of the files and directories in a repository.
+
+    The manifest is a text file with one line per entry below the
+    repository directory, in the form ``TYPE SIZE MTIME PATH``: ``d`` for
+    a directory or anything else for a file, the size in bytes, the
+    modification time in seconds and the path relative to the repository,
+    with ``/`` separators.  Lines starting with ``#`` are ignored.
+    That is the output of::
+
+        find -L REPOSITORY -mindepth 1 -printf '%y %s %T@ %P\\n'
+
+    While a manifest is in use, paths in the repository are looked up in
+    it rather than on disk, so :meth:`FS.stat` and :meth:`FS.listdir`
+    become dictionary probes; anything missing from it doesn't exist,
+    and the sizes and modification times it records are trusted, so it
+    must be regenerated whenever anything in the repository changes.
+    It is not generated by SCons: checking that a generated manifest is
+    still up to date would take as many stats as it saves.  The file is
+    read again whenever its own size or modification time changes.
+
+    .. versionadded:: 4.12.0
+    """
+
+    def __init__(self, root: str, path: str, exclude: str | None = None) -> None:
+        self.root = root
+        self.prefix = _my_normcase(root.rstrip(OS_SEP) + OS_SEP)
+        self.path = path
+        # a directory inside the repository which is not covered
+        # (the local tree, when it lives in the repository)
+        self.exclude = _my_normcase(exclude + OS_SEP) if exclude else None
+        self.signature: tuple[int, int] | None = None
+        self.stats: dict[str, os.stat_result] | None = None
+        self.listings: dict[str, list[str]] = {}
+
+    def contains(self, path: str) -> bool:
+        path = _my_normcase(path)
+        if not path.startswith(self.prefix) and path + OS_SEP != self.prefix:
+            return False
+        if self.exclude is None:
+            return True
+        return not (path.startswith(self.exclude) or path + OS_SEP == self.exclude)
+
+    def _signature(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def refresh(self) -> None:
+        """Read the manifest if it changed."""
+        signature = self._signature()
+        if signature is not None and signature == self.signature:
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError as e:
+            raise SCons.Errors.UserError(
+                "Cannot read repository manifest `%s': %s" % (self.path, e.strerror)
+            ) from None
+        self.signature = signature
+        self.parse(lines)
+
+    def parse(self, lines: list[str]) -> None:
+        """Build the lookup tables from the lines of a manifest."""
+        root = self.prefix[:-1]
+        # the manifest doesn't list the repository directory itself:
+        # it changes with the manifest
+        root_ns = self.signature[1] if self.signature else 0
+        root_mtime = root_ns / 1000000000
+        stats = {root: os.stat_result(
+            (stat.S_IFDIR | 0o755, 0, 0, 1, 0, 0, 0) + (int(root_mtime),) * 3,
+            {'st_atime': root_mtime, 'st_mtime': root_mtime,
+             'st_ctime': root_mtime, 'st_mtime_ns': root_ns},
+        )}
+        listings: dict[str, list[str]] = {root: []}
+        for line in lines:
+            if line.startswith('#'):
+                continue
+            try:
+                kind, size, mtime, relpath = line.rstrip('\n').split(' ', 3)
+                size, mtime = int(size), float(mtime)
+            except ValueError:
+                continue
+            path = _my_normcase(os.path.join(root, relpath.replace('/', OS_SEP)))
+            if kind == 'd':
+                mode = stat.S_IFDIR | 0o755
+                listings.setdefault(path, [])
+            else:
+                mode = stat.S_IFREG | 0o644
+            mtime_ns = int(mtime * 1000000000)
+            stats[path] = os.stat_result(
+                (mode, 0, 0, 1, 0, 0, size, int(mtime), int(mtime), int(mtime)),
+                {'st_atime': mtime, 'st_mtime': mtime, 'st_ctime': mtime,
+                 'st_mtime_ns': mtime_ns},
+            )
+            dirname, name = os.path.split(relpath.replace('/', OS_SEP))
+            parent = os.path.join(root, dirname) if dirname else root
+            listings.setdefault(_my_normcase(parent), []).append(name)
+        self.stats = stats
+        self.listings = listings
+
+    def stat(self, path: str) -> os.stat_result:
+        if self.stats is None:
+            self.refresh()
+        try:
+            return self.stats[_my_normcase(path)]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def listdir(self, path: str) -> list[str]:
+        if self.stats is None:
+            self.refresh()
+        try:
+            return list(self.listings[_my_normcase(path)])
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+
 class Dir(Base):
     """A class for directories in a file system.
     """
@@ -2047,7 +2334,7 @@ class Dir(Base):
         except AttributeError:
             d = {}
             try:
-                entries = os.listdir(self._abspath)
+                entries = self.fs.listdir(self._abspath)
             except OSError:
                 pass
             else:
@@ -2273,7 +2560,8 @@ class Dir(Base):
             for dir in list:
                 r = dir._glob1(basename, ondisk, source, strings)
                 if strings:
-                    r = [os.path.join(str(dir), x) for x in r]
+                    dirname = str(dir)
+                    r = [os.path.join(dirname, x) for x in r]
                 result.extend(r)
         if exclude:
             excludes = []
@@ -2303,6 +2591,7 @@ class Dir(Base):
             search_dir_list.extend(srcdir.get_all_rdirs())
 
         selfEntry = self.Entry
+        glob_cache = self.fs.glob_cache
         names = []
         for dir in search_dir_list:
             # We use the .name attribute from the Node because the keys of
@@ -2316,38 +2605,46 @@ class Dir(Base):
                 # entries for all Nodes in repositories or variant dirs.
                 for name in node_names: selfEntry(name)
             if ondisk:
-                try:
-                    disk_names = os.listdir(dir._abspath)
-                except os.error:
-                    continue
-                names.extend(disk_names)
+                if glob_cache is not None:
+                    # the names already filtered by the pattern
+                    disk_names = glob_cache.matches(dir._abspath, pattern)
+                    if disk_names is None:
+                        continue
+                    names.extend(disk_names)
+                else:
+                    try:
+                        disk_names = self.fs.listdir(dir._abspath)
+                    except os.error:
+                        continue
+                    names.extend(disk_names)
+                    if not strings:
+                        # We're going to return corresponding Nodes in
+                        # the local directory, so we need to make sure
+                        # those Nodes exist.  We only want to create
+                        # Nodes for the entries that will match the
+                        # specified pattern, though, which means we
+                        # need to filter the list here, even though
+                        # the overall list will also be filtered later,
+                        # after we exit this loop.
+                        disk_names = _glob_filter(disk_names, pattern)
                 if not strings:
-                    # We're going to return corresponding Nodes in
-                    # the local directory, so we need to make sure
-                    # those Nodes exist.  We only want to create
-                    # Nodes for the entries that will match the
-                    # specified pattern, though, which means we
-                    # need to filter the list here, even though
-                    # the overall list will also be filtered later,
-                    # after we exit this loop.
-                    if pattern[0] != '.':
-                        disk_names = [x for x in disk_names if x[0] != '.']
-                    disk_names = fnmatch.filter(disk_names, pattern)
                     dirEntry = dir.Entry
                     for name in disk_names:
-                        # Add './' before disk filename so that '#' at
-                        # beginning of filename isn't interpreted.
-                        name = './' + name
-                        node = dirEntry(name).disambiguate()
-                        n = selfEntry(name)
+                        # Nodes found already disambiguated (by an earlier
+                        # Glob, say) don't need looking up again.
+                        node = dir.entries.get(_my_normcase(name))
+                        if node is None or node.__class__ is Entry:
+                            # Add './' before disk filename so that '#' at
+                            # beginning of filename isn't interpreted.
+                            node = dirEntry('./' + name).disambiguate()
+                        if dir is self:
+                            continue
+                        n = selfEntry('./' + name)
                         if n.__class__ != node.__class__:
                             n.__class__ = node.__class__
                             n._morph()
 
-        names = set(names)
-        if pattern[0] != '.':
-            names = [x for x in names if x[0] != '.']
-        names = fnmatch.filter(names, pattern)
+        names = _glob_filter(list(set(names)), pattern)
 
         if strings:
             return names
@@ -2584,8 +2881,12 @@ class FileBuildInfo(SCons.Node.BuildInfoBase):
             by order they appeared in bdepends, bsources, or bimplicit,
             and so a change in order or count of any of these could
             yield writing wrong csig, and then false positive rebuilds
+        emitter_cache : Results computed from a source file's contents
+            by emitters (e.g. the class names in a .java file), keyed
+            by emitter name.  Each value is a (signature, result) tuple;
+            see :meth:`File.get_emitter_cache`.
     """
-    __slots__ = ['dependency_map', ]
+    __slots__ = ['dependency_map', 'emitter_cache']
     current_version_id = 2
 
     def __setattr__(self, key: str, value: Any | None) -> None:
@@ -2954,6 +3255,50 @@ class File(Base):
 
         return sconsign_entry
 
+    def get_emitter_cache(self, name: str, sig):
+        """Return the result an emitter cached for this file.
+
+        Emitters which have to read a source file to find out what
+        targets it produces can keep that result in the file's
+        .sconsign entry (see :meth:`set_emitter_cache`) and skip the
+        work on later runs; actions can keep state for their targets
+        the same way.  *sig* identifies the inputs the result
+        was computed from, typically the content signature plus any
+        relevant settings; ``None`` is returned if nothing was cached
+        under *name* or if it was cached for a different *sig*.
+
+        .. versionadded:: 4.12.0
+        """
+        binfo = self.get_stored_info().binfo
+        cache = getattr(binfo, 'emitter_cache', None)
+        if cache is not None:
+            try:
+                cached_sig, result = cache[name]
+            except KeyError:
+                pass
+            else:
+                if cached_sig == sig:
+                    return result
+        return None
+
+    def set_emitter_cache(self, name: str, sig, result) -> None:
+        """Cache an emitter *result* for this file, computed from *sig*.
+
+        The result is written out with the file's .sconsign entry
+        when the file is visited during the build.
+
+        .. versionadded:: 4.12.0
+        """
+        entry = self.get_stored_info()
+        cache = getattr(entry.binfo, 'emitter_cache', None)
+        if cache is None:
+            cache = entry.binfo.emitter_cache = {}
+        cache[name] = (sig, result)
+        # Make sure a newly created entry is the one later looked up
+        # again, as the memoized stored info may be cleared before the
+        # file is visited.
+        self.dir.sconsign().set_entry(self.name, entry)
+
     def get_stored_implicit(self) -> list[Node] | None:
         binfo = self.get_stored_info().binfo
         binfo.prepare_dependencies()
@@ -3046,6 +3046,46 @@ class GlobTestCase(_tempdirTestCase):
         expect = ['disk-aaa', 'disk-bbb', 'disk-ccc', 'disk-sub']
         assert g == expect, str(g) + " is not sorted, but should be!"
 
+    def test_glob_cache(self) -> None:
+        """Test globbing with the cache of directory listings"""
+        join = os.path.join
+        path = self.test.workpath('disk-sub')
+        past = time.time() - 60
+        os.utime(path, (past, past))
+
+        self.fs.enable_glob_cache()
+        g = self.fs.Glob('disk-sub/*', strings=True)
+        expect = [join('disk-sub', x) for x in ('disk-ddd', 'disk-eee', 'disk-fff')]
+        assert g == expect, g
+        assert path in self.fs.glob_cache.entries
+        self.fs.glob_cache.write()
+        assert os.path.exists(self.test.workpath('.glob_cache'))
+
+        # a later run reads the listings back, and uses them while
+        # the directory is unchanged
+        fs = SCons.Node.FS.FS()
+        fs.enable_glob_cache()
+        entries = fs.glob_cache.entries
+        assert sorted(entries[path][2]['*']) == ['disk-ddd', 'disk-eee', 'disk-fff']
+        entries[path][2]['*'] = ['disk-ddd']
+        g = fs.Glob('disk-sub/*', strings=True)
+        assert g == [join('disk-sub', 'disk-ddd')], g
+        g = fs.Glob('disk-sub/*-eee', strings=True)
+        assert g == [join('disk-sub', 'disk-eee')], g
+
+        # a changed directory is listed again
+        self.test.write(['disk-sub', 'disk-ggg'], "disk-sub/disk-ggg\n")
+        os.utime(path, (past + 1, past + 1))
+        g = fs.Glob('disk-sub/*', strings=True)
+        assert g == expect + [join('disk-sub', 'disk-ggg')], g
+        assert path in entries
+
+        # but not cached if it has just changed
+        self.test.write(['disk-sub', 'disk-hhh'], "disk-sub/disk-hhh\n")
+        g = fs.Glob('disk-sub/*', strings=True)
+        assert join('disk-sub', 'disk-hhh') in g, g
+        assert path not in entries
+
 
 class RepositoryTestCase(_tempdirTestCase):
 
@@ -3349,6 +3389,75 @@ class RepositoryTestCase(_tempdirTestCase):
         f2 = fs.File(os.path.join('build', 'f2'))
         assert f2.rexists()
 
+    def test_manifest(self) -> None:
+        """Test Repository lookups answered from a manifest"""
+        test = self.test
+        test.subdir(['rep4'], ['rep4', 'sub'])
+        test.write(['rep4', 'listed.c'], "listed.c\n")
+        test.write(['rep4', 'sub', 'listed.h'], "listed.h\n")
+        rep4 = test.workpath('rep4')
+        manifest = os.path.join(rep4, SCons.Node.FS.REPOSITORY_MANIFEST)
+
+        # the manifest must exist, SCons doesn't generate it
+        fs = SCons.Node.FS.FS()
+        with self.assertRaises(SCons.Errors.UserError):
+            fs.Repository(rep4, manifest=True)
+        test.write(manifest, "f 9 0 listed.c\nd 0 0 sub\nf 9 0 sub/listed.h\n")
+        fs.Repository(rep4, manifest=True)
+
+        f = fs.File('listed.c')
+        r = f.rfile()
+        assert str(r) == os.path.join(rep4, 'listed.c'), r
+        assert r.getsize() == len("listed.c\n"), r.getsize()
+        node, dir = fs.Dir('sub').srcdir_find_file('listed.h')
+        assert str(node) == os.path.join(rep4, 'sub', 'listed.h'), node
+        assert fs.Dir('sub').rentry_exists_on_disk('listed.h')
+
+        # files missing from the manifest are not looked for on disk
+        test.write(['rep4', 'unlisted.c'], "unlisted.c\n")
+        assert not fs.Top.rentry_exists_on_disk('unlisted.c')
+        f = fs.File('unlisted.c')
+        assert f.rfile() is f
+
+        # a changed manifest is read again
+        with open(manifest, 'a') as f:
+            f.write("f 11 1234567890.5 unlisted.c\n")
+        fs.refresh_repository_manifests()
+        st = fs.stat(os.path.join(rep4, 'unlisted.c'))
+        assert st.st_size == 11, st
+        assert st.st_mtime == 1234567890.5, st.st_mtime
+
+        # paths outside the repository still go to disk
+        test.write(['work', 'local.c'], "local.c\n")
+        assert fs.File('local.c').exists()
+
+        # Glob reads the repository directories from the manifest
+        past = time.time() - 60
+        os.utime(manifest, (past, past))
+        fs.refresh_repository_manifests()
+        fs.enable_glob_cache()
+        g = fs.Glob('*.c', strings=True)
+        assert g == ['listed.c', 'local.c', 'unlisted.c'], g
+        # the repository directory changes with the manifest
+        entry = fs.glob_cache.entries[rep4]
+        assert entry[0] == os.stat(manifest).st_mtime_ns, entry
+
+        # a manifest which can't be read is an error
+        os.unlink(manifest)
+        test.write(manifest, "")
+        fs.refresh_repository_manifests()
+        os.unlink(manifest)
+        with self.assertRaises(SCons.Errors.UserError):
+            fs.refresh_repository_manifests()
+
+        # a manifest file may be named, but only for one repository
+        fs = SCons.Node.FS.FS()
+        test.write('other_manifest', "d 0 0 sub\nf 3 0 sub/x.h\n")
+        fs.Repository(rep4, manifest=test.workpath('other_manifest'))
+        assert fs.listdir(rep4) == ['sub'], fs.listdir(rep4)
+        with self.assertRaises(SCons.Errors.UserError):
+            fs.Repository(self.rep1, self.rep2, manifest='x')
+
     def test_FAT_timestamps(self) -> None:
         """Test repository timestamps on FAT file systems"""
         fs = self.fs
@@ -3538,6 +3647,26 @@ class stored_infoTestCase(unittest.TestCase):
         assert bi.xyzzy == 7, bi
 
 
+class emitter_cacheTestCase(unittest.TestCase):
+    def runTest(self) -> None:
+        """Test caching emitter results in the stored info"""
+        test = TestCmd(workdir='')
+        fs = SCons.Node.FS.FS(test.workpath(''))
+
+        f = fs.File('f1')
+        assert f.get_emitter_cache('javac', ('sig', '1.8')) is None
+        f.set_emitter_cache('javac', ('sig', '1.8'), ('pkg', ['A', 'B']))
+        result = f.get_emitter_cache('javac', ('sig', '1.8'))
+        assert result == ('pkg', ['A', 'B']), result
+        assert f.get_emitter_cache('javac', ('sig', '1.4')) is None
+        assert f.get_emitter_cache('other', ('sig', '1.8')) is None
+
+        # The cached value survives the memoized stored info being reset.
+        f.clear_memoized_values()
+        result = f.get_emitter_cache('javac', ('sig', '1.8'))
+        assert result == ('pkg', ['A', 'B']), result
+
+
 class has_src_builderTestCase(unittest.TestCase):
     def runTest(self) -> None:
         """Test the has_src_builder() method"""
@@ -1216,6 +1216,18 @@ class NodeTestCase(unittest.TestCase):
         n = nw.get_next()
         assert nw.get_next() is None
 
+        # the lists returned by kids_func are walked in place
+        kids = {n1: [n2, n3], n2: [n4], n3: [n4], n4: []}
+        saved = {k: list(v) for k, v in kids.items()}
+        nw = SCons.Node.Walker(n1, kids_func=lambda n, p: kids[n])
+        names = []
+        n = nw.get_next()
+        while n:
+            names.append(n.name)
+            n = nw.get_next()
+        assert names == ["n4", "n2", "n4", "n3", "n1"], names
+        assert kids == saved, kids
+
     def test_abspath(self) -> None:
         """Test the get_abspath() method."""
         n = MyNode("foo")
@@ -43,7 +43,6 @@ be able to depend on any other type of "thing."
 from __future__ import annotations
 
 import collections
-import copy
 from itertools import chain, zip_longest
 from typing import Any, Callable, TYPE_CHECKING
 
@@ -1749,6 +1748,14 @@ class Walker:
 
     This class does not get caught in node cycles caused, for example,
     by C header file include loops.
+
+    The list returned by *kids_func* is not copied or modified: the
+    walk keeps, for each node on the current path, the list of its
+    children and the index of the next one to visit.
+
+    .. versionchanged:: 4.12.0
+       Children are iterated by index instead of being popped from a
+       copy of the list, and ``Node.wkids`` is no longer used.
     """
     def __init__(
         self,
@@ -1760,8 +1767,11 @@ class Walker:
         self.kids_func = kids_func
         self.cycle_func = cycle_func
         self.eval_func = eval_func
-        node.wkids = copy.copy(kids_func(node, None))
         self.stack = [node]
+        # parallel to stack: the children of each node, and the index
+        # of the next child to visit
+        self.kids = [kids_func(node, None)]
+        self.index = [0]
         self.history: dict[Node, Any | None] = {} # used to efficiently detect and avoid cycles
         self.history[node] = None
 
@@ -1771,24 +1781,28 @@ class Walker:
         This function is intentionally iterative, not recursive,
         to sidestep any issues of stack size limitations.
         """
-
-        while self.stack:
-            if self.stack[-1].wkids:
-                node = self.stack[-1].wkids.pop(0)
-                if not self.stack[-1].wkids:
-                    self.stack[-1].wkids = None
-                if node in self.history:
-                    self.cycle_func(node, self.stack)
+        stack, kids, index, history = self.stack, self.kids, self.index, self.history
+        while stack:
+            i = index[-1]
+            wkids = kids[-1]
+            if wkids and i < len(wkids):
+                node = wkids[i]
+                index[-1] = i + 1
+                if node in history:
+                    self.cycle_func(node, stack)
                 else:
-                    node.wkids = copy.copy(self.kids_func(node, self.stack[-1]))
-                    self.stack.append(node)
-                    self.history[node] = None
+                    kids.append(self.kids_func(node, stack[-1]))
+                    index.append(0)
+                    stack.append(node)
+                    history[node] = None
             else:
-                node = self.stack.pop()
-                del self.history[node]
+                node = stack.pop()
+                kids.pop()
+                index.pop()
+                del history[node]
                 if node:
-                    if self.stack:
-                        parent = self.stack[-1]
+                    if stack:
+                        parent = stack[-1]
                     else:
                         parent = None
                     self.eval_func(node, parent)
@@ -37,13 +37,17 @@ import SCons.compat
 
 import atexit
 import io
+import json
 import os
 import re
 import sys
+import tempfile
+import threading
 import traceback
 
 import SCons.Action
 import SCons.Builder
+import SCons.Environment
 import SCons.Errors
 import SCons.Taskmaster.Job
 import SCons.Node.FS
@@ -174,6 +178,133 @@ def _stringSource( target, source, env ):
     return (str(target[0]) + ' <-\n  |' +
             source[0].get_contents().decode().replace( '\n', "\n  |" ) )
 
+class ResultsCache:
+    """Content-addressed store of configure check results.
+
+    Each result is a small JSON record kept in a file named by the
+    check's key (see :func:`results_key`), under a two-character
+    prefix directory as in a :class:`~SCons.CacheDir.CacheDir`.
+    Reading and writing are best-effort: a record which cannot be
+    read is a miss, and one which cannot be written is dropped.
+
+    .. versionadded:: 4.12.0
+    """
+
+    def __init__(self, path) -> None:
+        self.path = path
+
+    def _file(self, key) -> str:
+        return os.path.join(self.path, key[:2].upper(), key + '.json')
+
+    def get(self, key):
+        """Return the record for *key*, or ``None``."""
+        try:
+            with open(self._file(key)) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or 'result' not in record:
+            return None
+        return record
+
+    def put(self, key, record) -> None:
+        """Store *record* for *key*."""
+        path = self._file(key)
+        tmp = '%s.tmp%d' % (path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(record, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+def results_key(nodes, text) -> str:
+    """Return the results cache key of the check which builds *nodes*.
+
+    The key covers the text of the check and, for every node which
+    would be built, the contents of its actions (the expanded command
+    lines, so the relevant construction variables are included) and
+    the content signatures of the programs they run.
+
+    .. versionadded:: 4.12.0
+    """
+    parts = [SCons.Util.to_bytes(text or '')]
+    seen = set()
+    pending = list(nodes)
+    while pending:
+        node = pending.pop(0)
+        if node in seen or not node.has_builder():
+            continue
+        seen.add(node)
+        executor = node.get_executor()
+        parts.append(bytes(executor.get_contents()))
+        for dep in executor.get_implicit_deps():
+            parts.append(SCons.Util.to_bytes(dep.get_csig()))
+        pending.extend(executor.get_all_sources())
+    return SCons.Util.hash_signature(b'\0'.join(parts))
+
+
+def check_dependencies(nodes):
+    """Return what the results of the check which built *nodes* depend on.
+
+    Returns the files the scanners found for the nodes (the headers
+    included, the libraries linked and so on) as a list of
+    ``(path, content signature)`` pairs, and the directories the
+    scanners searched (:cv:`CPPPATH`, :cv:`LIBPATH` and the like).
+
+    .. versionadded:: 4.12.0
+    """
+    deps = {}
+    searched = []
+    seen = set()
+    pending = list(nodes)
+    while pending:
+        node = pending.pop(0)
+        if node in seen or not node.has_builder():
+            continue
+        seen.add(node)
+        executor = node.get_executor()
+        env = executor.get_build_env()
+        kw = executor.get_kw()
+
+        def path_func(scanner, executor=executor):
+            path = executor.get_build_scanner_path(scanner)
+            searched.extend(path)
+            return path
+
+        found = []
+        sources = executor.get_all_sources()
+        for source in sources:
+            source.disambiguate()
+            found.extend(source.get_implicit_deps(
+                env, node.builder.source_scanner, path_func, kw))
+        scanner = node.get_target_scanner()
+        if scanner:
+            found.extend(node.get_implicit_deps(env, scanner, path_func, kw))
+        for dep in found:
+            if not dep.has_builder():
+                deps[str(dep)] = dep.get_csig()
+        pending.extend(sources)
+    return sorted(deps.items()), searched
+
+
+def search_signature(dirs) -> str:
+    """Return a signature of the names in the directories *dirs*.
+
+    .. versionadded:: 4.12.0
+    """
+    parts = []
+    for d in SCons.Util.uniquer_hashables(dirs):
+        try:
+            names = sorted(os.listdir(d.get_abspath()))
+        except (AttributeError, OSError):
+            names = []
+        parts.append('%s\0%s' % (d, '\0'.join(names)))
+    return SCons.Util.hash_signature('\0\0'.join(parts))
+
+
 class SConfBuildInfo(SCons.Node.FS.FileBuildInfo):
     """
     Special build info for targets of configure tests. Additional members
@@ -191,6 +322,40 @@ class SConfBuildInfo(SCons.Node.FS.FileBuildInfo):
         self.string = string
 
 
+class _ThreadStreams:
+    """Route writes to the stream registered by the writing thread.
+
+    Used as stdout, stderr and log stream while the nodes of several
+    checks are built in parallel, so each task's output is captured
+    separately; writes from threads without a stream go to *default*.
+    The piped spawn gives commands the thread's file (see :meth:`fileno`).
+    """
+    def __init__(self, default) -> None:
+        self.default = default
+        self.local = threading.local()
+
+    def _stream(self):
+        return getattr(self.local, 'stream', None) or self.default
+
+    def fileno(self) -> int:
+        file = getattr(self.local, 'file', None) or self.default
+        return file.fileno()
+
+    def write(self, str) -> None:
+        stream = self._stream()
+        if stream is not None:
+            stream.write(str)
+
+    def writelines(self, lines) -> None:
+        for l in lines:
+            self.write(l)
+
+    def flush(self) -> None:
+        stream = self._stream()
+        if stream is not None:
+            stream.flush()
+
+
 class Streamer:
     """
     'Sniffer' for a file-like writable object. Similar to the unix tool tee.
@@ -327,17 +492,15 @@ class SConfBuildTask(SCons.Taskmaster.AlwaysTask):
         elif dryrun:
             raise ConfigureDryRunError(self.targets[0])
         else:
-            # note stdout and stderr are the same here
-            s = sys.stdout = sys.stderr = Streamer(sys.stdout)
+            s = self.start_capture()
             try:
                 env = self.targets[0].get_build_env()
                 env['PSTDOUT'] = env['PSTDERR'] = s
                 try:
                     sconf.cached = 0
-                    self.targets[0].build()
+                    self.build_target()
                 finally:
-                    sys.stdout = sys.stderr = env['PSTDOUT'] = \
-                                 env['PSTDERR'] = sconf.logstream
+                    self.end_capture(env)
             except KeyboardInterrupt:
                 raise
             except SystemExit:
@@ -379,6 +542,19 @@ class SConfBuildTask(SCons.Taskmaster.AlwaysTask):
                     sconsign.set_entry(t.name, sconsign_entry)
                     sconsign.merge()
 
+    def build_target(self) -> None:
+        self.targets[0].build()
+
+    def start_capture(self):
+        """Start capturing the output of building the target."""
+        # note stdout and stderr are the same here
+        s = sys.stdout = sys.stderr = Streamer(sys.stdout)
+        return s
+
+    def end_capture(self, env) -> None:
+        sys.stdout = sys.stderr = env['PSTDOUT'] = \
+                     env['PSTDERR'] = sconf_global.logstream
+
     def make_ready_current(self) -> None:
         # We're overriding make_ready_current() call to add to the list
         # of nodes used by this task, filtering out any nodes created
@@ -398,6 +574,96 @@ class SConfBuildTask(SCons.Taskmaster.AlwaysTask):
             node.ninfo = node.new_ninfo()
         super().postprocess()
 
+
+class SConfPrebuildTask(SConfBuildTask):
+    """Builds the nodes of a batch of checks before the checks run.
+
+    Tasks run in parallel worker threads, so the build output and the
+    log messages of each task are kept in ``sconf_global.prebuilt``
+    instead of being written to the log; they are logged when the
+    check using the target runs (see :meth:`SConfBase.TryBuild`).
+    A failure does not stop the other tasks.
+
+    Unlike other tasks, these compute and store signatures in
+    :meth:`execute`, so the lock is held except while the target is
+    built, and by the callbacks the taskmaster calls in other threads.
+    """
+
+    lock = threading.RLock()
+
+    def prepare(self):
+        with self.lock:
+            return super().prepare()
+
+    def make_ready_current(self) -> None:
+        with self.lock:
+            super().make_ready_current()
+    make_ready = make_ready_current
+
+    def executed(self) -> None:
+        with self.lock:
+            super().executed()
+
+    def failed(self) -> None:
+        with self.lock:
+            super().failed()
+
+    def postprocess(self) -> None:
+        # the node info of the non-SConf nodes is reset once all the
+        # tasks are done, not under the feet of the tasks still running
+        with self.lock:
+            SCons.Taskmaster.AlwaysTask.postprocess(self)
+
+    def build_target(self) -> None:
+        self.lock.release()
+        try:
+            super().build_target()
+        finally:
+            self.lock.acquire()
+
+    def execute(self):
+        self.output = []
+        self.logfile = None
+        try:
+            with self.lock:
+                super().execute()
+        finally:
+            if self.logfile is not None:
+                self.logfile.seek(0)
+                self.output.append(self.logfile.read())
+                self.logfile.close()
+            sconf_global.prebuilt[self.targets[0]] = (
+                self.logfile is not None, "".join(self.output)
+            )
+
+    def display(self, message) -> None:
+        self.output.append("scons: Configure: " + message + "\n")
+
+    def start_capture(self):
+        # commands write to the file directly, so it keeps the log
+        self.logfile = SCons.Util.Unbuffered(tempfile.TemporaryFile('w+'))
+        s = Streamer(self.logfile)
+        local = sconf_global.threadStreams.local
+        local.stream = s
+        local.file = self.logfile
+        return s
+
+    def end_capture(self, env) -> None:
+        local = sconf_global.threadStreams.local
+        local.stream = local.file = None
+        if isinstance(env, SCons.Environment.OverrideEnvironment):
+            # leave the overrides as the check will give them when it
+            # runs, or the builder call would see two environments
+            del env['PSTDOUT']
+            del env['PSTDERR']
+        else:
+            # the environment is shared with the tasks of other threads
+            env['PSTDOUT'] = env['PSTDERR'] = sconf_global.threadStreams
+
+    def fail_stop(self) -> None:
+        # the nodes of the other checks do not depend on this one
+        self.fail_continue()
+
 class SConfBase:
     """This is simply a class to represent a configure context. After
     creating a SConf object, you can call any tests. After finished with your
@@ -460,6 +726,18 @@ class SConfBase:
         self.logfile = log_file
         self.logstream = None
         self.lastTarget = None
+        results_cache = env.subst('$CONFIGURECACHE')
+        if results_cache:
+            self.results_cache = ResultsCache(SConfFS.Dir(results_cache).get_abspath())
+        else:
+            self.results_cache = None
+        self.lastResultKey = None
+        self.lastResultNodes = []
+        self.lastRecord = None
+        self.lastReplayed = False
+        self.discovered = None # nodes collected while discovering a batch
+        self.prebuilt = {}     # target -> (built, log) from a batch prebuild
+        self.threadStreams = None
         self.depth = _depth
         self.cached = 0 # will be set, if all test results are cached
 
@@ -527,6 +805,14 @@ class SConfBase:
         Tries to build the given nodes immediately. Returns 1 on success,
         0 on error.
         """
+        return self._build_nodes(nodes, 1, SConfBuildTask)
+
+    def _build_nodes(self, nodes, num_jobs, task_class):
+        oldLogstream = self.logstream
+        if num_jobs > 1:
+            # route the output of each task to its own capture
+            self.threadStreams = _ThreadStreams(self.logstream)
+            self.logstream = self.threadStreams
         if self.logstream is not None:
             # override stdout / stderr to write in log file
             oldStdout = sys.stdout
@@ -571,9 +857,9 @@ class SConfBase:
             # ToDo: use user options for calc
             save_max_drift = SConfFS.get_max_drift()
             SConfFS.set_max_drift(0)
-            tm = SCons.Taskmaster.Taskmaster(nodes, SConfBuildTask)
-            # we don't want to build tests in parallel
-            jobs = SCons.Taskmaster.Job.Jobs(1, tm)
+            tm = SCons.Taskmaster.Taskmaster(nodes, task_class)
+            # tests are only built in parallel for a Batch() prebuild
+            jobs = SCons.Taskmaster.Job.Jobs(num_jobs, tm)
             jobs.run()
             for n in nodes:
                 state = n.get_state()
@@ -589,6 +875,8 @@ class SConfBase:
                 # restore stdout / stderr
                 sys.stdout = oldStdout
                 sys.stderr = oldStderr
+            self.logstream = oldLogstream
+            self.threadStreams = None
         return ret
 
     def pspawn_wrapper(self, sh, escape, cmd, args, env):
@@ -662,7 +950,18 @@ class SConfBase:
             if not SCons.Util.is_List(nodes):
                 nodes = [nodes]
             nodesToBeBuilt.extend(nodes)
-            result = self.BuildNodes(nodesToBeBuilt)
+            record = self._lookup_result(nodesToBeBuilt, text)
+            if record is not None:
+                result = record['result']
+            elif self.discovered is not None:
+                # discovering the nodes of a batch: build nothing, and
+                # fail, so the check goes through all of its fallbacks
+                self.discovered.extend(nodesToBeBuilt)
+                result = 0
+            else:
+                self._log_prebuilt(nodesToBeBuilt)
+                result = self.BuildNodes(nodesToBeBuilt)
+                self._store_result(result=result)
 
         finally:
             self.env['SPAWN'] = save_spawn
@@ -685,7 +984,17 @@ class SConfBase:
         ok = self.TryBuild(self.env.SConfActionBuilder, text, extension)
         del self.env['BUILDERS']['SConfActionBuilder']
         if ok:
+            if self.lastReplayed:
+                if 'output' in self.lastRecord:
+                    return (1, self.lastRecord['output'])
+                if self.discovered is not None:
+                    self.discovered.append(self.lastTarget)
+                    return (0, "")
+                # the record has no output: build the target after all
+                if not self.BuildNodes([self.lastTarget]):
+                    return (0, "")
             outputStr = self.lastTarget.get_text_contents()
+            self._store_result(output=outputStr)
             return (1, outputStr)
         return (0, "")
 
@@ -723,12 +1032,103 @@ class SConfBase:
                 pname = pname.replace(os.sep, os.altsep)
             output = self.confdir.File(os.path.basename(pname)+'.out')
             node = self.env.Command(output, prog, [ [ pname, ">", "${TARGET}"] ])
+            record = self._lookup_result(node, text)
+            if record is not None and 'output' in record:
+                if record['result']:
+                    return (1, record['output'])
+                return (0, "")
+            if self.discovered is not None:
+                self.discovered.extend(node)
+                return (0, "")
+            # if the program was replayed, building the output builds it
+            self._log_prebuilt(node)
             ok = self.BuildNodes(node)
             if ok:
                 outputStr = SCons.Util.to_str(output.get_contents())
+                self._store_result(result=ok, output=outputStr)
                 return( 1, outputStr)
+            self._store_result(result=ok, output="")
         return (0, "")
 
+    def _log_prebuilt(self, nodes) -> None:
+        """Log what the batch prebuild did for *nodes*, in check order."""
+        for node in nodes:
+            if not self.prebuilt:
+                return
+            # the sources were built first, e.g. the object of a program
+            self._log_prebuilt(node.children(scan=False))
+            try:
+                built, log = self.prebuilt.pop(node)
+            except KeyError:
+                continue
+            if built:
+                self.cached = 0
+            if self.logstream is not None:
+                self.logstream.write(log)
+
+    def _lookup_result(self, nodes, text):
+        """Look up the check which builds *nodes* in the results cache.
+
+        Returns the cached record, in which case the nodes are not
+        built, or ``None``.
+        """
+        self.lastResultKey = None
+        self.lastRecord = None
+        self.lastReplayed = False
+        if self.results_cache is None:
+            return None
+        if not SCons.Util.is_List(nodes):
+            nodes = [nodes]
+        self.lastResultKey = results_key(nodes, text)
+        self.lastResultNodes = nodes
+        if cache_mode == FORCE:
+            return None
+        record = self._replayable(self.results_cache.get(self.lastResultKey), nodes)
+        if record is not None:
+            self.lastRecord = record
+            self.lastReplayed = True
+            # nothing is built, the result is from a previous run
+            self.cached = 1
+            if self.logstream is not None and self.discovered is None:
+                self.logstream.write(
+                    "scons: Configure: \"%s\" replayed from the results cache.\n"
+                    % nodes[-1]
+                )
+        return record
+
+    def _replayable(self, record, nodes):
+        """Return the results cache *record* for *nodes* if still valid.
+
+        The files the check found must be unchanged and, for a failed
+        check, so must the directories it searched: a header or
+        library added there could make it succeed now.
+        """
+        if record is None:
+            return None
+        fs = self.env.fs
+        for path, csig in record.get('deps', ()):
+            if fs.File(path).get_csig() != csig:
+                return None
+        if not record['result']:
+            searched = record.get('searched')
+            if searched != search_signature(check_dependencies(nodes)[1]):
+                return None
+        return record
+
+    def _store_result(self, **fields) -> None:
+        """Add *fields* to the results cache record of the last check."""
+        if self.lastResultKey is None or dryrun:
+            return
+        record = dict(self.lastRecord or {})
+        record.update(fields)
+        if 'result' in fields:
+            deps, searched = check_dependencies(self.lastResultNodes)
+            record['deps'] = deps
+            if not fields['result']:
+                record['searched'] = search_signature(searched)
+        self.lastRecord = record
+        self.results_cache.put(self.lastResultKey, record)
+
     class TestWrapper:
         """A wrapper around Tests (to ensure sanity)"""
         def __init__(self, test, sconf) -> None:
@@ -739,11 +1139,62 @@ class SConfBase:
                 raise SCons.Errors.UserError
             context = CheckContext(self.sconf)
             ret = self.test(context, *args, **kw)
-            if self.sconf.config_h is not None:
+            if self.sconf.config_h is not None and self.sconf.discovered is None:
                 self.sconf.config_h_text = self.sconf.config_h_text + context.config_h
             context.Result("error: no result")
             return ret
 
+    def Batch(self, num_jobs: int | None = None) -> CheckBatch:
+        """Return a batch in which checks are queued to run together.
+
+        Checks are called on the batch like on the context and return
+        a :class:`DeferredCheck`; they run when the batch is used as a
+        context manager and the ``with`` block ends, or when its
+        :meth:`~CheckBatch.run` method is called.  The test programs
+        the checks would build are first built in parallel, using
+        *num_jobs* jobs (default: the ``-j`` option), then the checks
+        run in the order they were queued, finding their results up
+        to date, so the output, the log and the ``config.h`` contents
+        are the same as for checks called one after another.
+
+        .. versionadded:: 4.12.0
+        """
+        return CheckBatch(self, num_jobs)
+
+    def _discover(self, checks):
+        """Return the nodes the queued *checks* would build.
+
+        Each check is called without building anything, with every
+        build failing, so it goes through all of its fallbacks; the
+        construction environment, the ``config.h`` text, the numbering
+        of test files and the ``cached`` flag are restored afterwards,
+        so the checks do the same (and say the same) when they really
+        run.
+        """
+        global _ac_build_counter
+        saved_counter = _ac_build_counter.copy()
+        saved_config_h = self.config_h_text
+        saved_cached = self.cached
+        saved_env = SCons.Util.semi_deepcopy_dict(self.env.Dictionary(), ['BUILDERS'])
+        self.discovered = []
+        try:
+            for _, test, args, kw in checks:
+                try:
+                    test(*args, **kw)
+                except Exception:
+                    # the check will raise again when it really runs
+                    pass
+                for key in list(self.env.Dictionary()):
+                    if key not in saved_env and key != 'BUILDERS':
+                        del self.env[key]
+                self.env.Replace(**saved_env)
+        finally:
+            discovered, self.discovered = self.discovered, None
+            _ac_build_counter = saved_counter
+            self.config_h_text = saved_config_h
+            self.cached = saved_cached
+        return list(dict.fromkeys(discovered))
+
     def AddTest(self, test_name, test_instance) -> None:
         """Adds test_class to this SConf instance. It can be called with
         self.test_name(...)"""
@@ -973,6 +1424,8 @@ class CheckContext:
         return oldLIBS
 
     def Display(self, msg) -> None:
+        if self.sconf.discovered is not None:
+            return
         if self.sconf.cached:
             # We assume that Display is called twice for each test here
             # once for the Checking for ... message and once for the result.
@@ -983,12 +1436,94 @@ class CheckContext:
         self.Log("scons: Configure: " + msg + "\n")
 
     def Log(self, msg) -> None:
-        if self.sconf.logstream is not None:
+        if self.sconf.logstream is not None and self.sconf.discovered is None:
             self.sconf.logstream.write(msg)
 
     #### End of stuff used by Conftest.py.
 
 
+class DeferredCheck:
+    """The result of a check queued in a :class:`CheckBatch`.
+
+    .. versionadded:: 4.12.0
+    """
+
+    def __init__(self, name) -> None:
+        self.name = name
+        self.done = False
+        self._result = None
+
+    @property
+    def result(self):
+        """The value returned by the check, once the batch has run."""
+        if not self.done:
+            raise SCons.Errors.UserError(
+                "The result of %s is not available until its batch has run"
+                % self.name
+            )
+        return self._result
+
+    def set_result(self, result) -> None:
+        self._result = result
+        self.done = True
+
+
+class CheckBatch:
+    """Checks queued to run together, see :meth:`SConfBase.Batch`.
+
+    .. versionadded:: 4.12.0
+    """
+
+    def __init__(self, sconf, num_jobs=None) -> None:
+        self.sconf = sconf
+        self.num_jobs = num_jobs
+        self.checks = []
+
+    def __getattr__(self, name):
+        test = getattr(self.sconf, name, None)
+        if not isinstance(test, SConfBase.TestWrapper):
+            raise AttributeError("CheckBatch instance has no check '%s'" % name)
+
+        def queue(*args, **kw):
+            deferred = DeferredCheck(name)
+            self.checks.append((deferred, test, args, kw))
+            return deferred
+        return queue
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.run()
+
+    def run(self) -> None:
+        """Build the queued checks' test programs in parallel, then run the checks."""
+        checks, self.checks = self.checks, []
+        sconf = self.sconf
+        num_jobs = self.num_jobs
+        if num_jobs is None:
+            # pylint: disable=import-outside-toplevel
+            from SCons.Script import GetOption
+            num_jobs = GetOption('num_jobs')
+        if num_jobs > 1 and len(checks) > 1 and cache_mode != CACHE and not dryrun:
+            nodes = sconf._discover(checks)
+            if nodes:
+                save_spawn = sconf.env['SPAWN']
+                sconf.env['SPAWN'] = sconf.pspawn_wrapper
+                try:
+                    sconf._build_nodes(nodes, num_jobs, SConfPrebuildTask)
+                finally:
+                    sconf.env['SPAWN'] = save_spawn
+                for node in SConfBuildTask.non_sconf_nodes:
+                    node.ninfo = node.new_ninfo()
+        try:
+            for deferred, test, args, kw in checks:
+                deferred.set_result(test(*args, **kw))
+        finally:
+            sconf.prebuilt.clear()
+
+
 def SConf(*args, **kw):
     if kw.get(build_type, True):
         kw['_depth'] = kw.get('_depth', 0) + 1
@@ -316,6 +316,18 @@ int main(void) {
         finally:
             sconf.Finish()
 
+    def test_ResultsCache(self) -> None:
+        """Test the configure results cache
+        """
+        import SCons.SConf
+        cache = SCons.SConf.ResultsCache(self.test.workpath('results'))
+        assert cache.get('abcdef') is None
+        cache.put('abcdef', {'result': 1, 'output': 'RUN OK'})
+        assert cache.get('abcdef') == {'result': 1, 'output': 'RUN OK'}
+        assert os.path.exists(self.test.workpath('results', 'AB', 'abcdef.json'))
+        self.test.write(['results', 'AB', 'abcdef.json'], "not json")
+        assert cache.get('abcdef') is None
+
     def _test_check_compilers(self, comp, func, name) -> None:
         """This is the implementation for CheckCC and CheckCXX tests."""
         from copy import deepcopy
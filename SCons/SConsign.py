@@ -25,14 +25,18 @@
 
 import SCons.compat  # pylint: disable=wrong-import-order
 
+import copy
 import os
 import pickle
 import time
 
 import SCons.dblite
+import SCons.Errors
+import SCons.Util
 import SCons.Warnings
 from SCons.compat import PICKLE_PROTOCOL
 from SCons.Util import print_time
+from SCons.Util.stats import trace_stats
 
 
 def corrupt_dblite_warning(filename) -> None:
@@ -58,6 +62,31 @@ DB_Module = SCons.dblite
 DB_Name = None
 DB_sync_list = []
 
+# Checkpointing: signature entries stored during the build are appended
+# to a journal next to the writable database every checkpoint_interval
+# seconds and/or every checkpoint_tasks built tasks, and the journal is
+# replayed when the database is next opened, so an interrupted build
+# keeps the signatures of what it already built.
+checkpoint_interval = None
+checkpoint_tasks = None
+Journal_Name = None
+_checkpoint_time = None
+_checkpoint_count = 0
+JOURNAL_SUFFIX = ".journal"
+RDEPS_SUFFIX = ".rdeps"
+
+
+class ShardedDB:
+    """Database module interface for the sharded signature database.
+
+    The database is split by top-level directory into separate files,
+    see :func:`SCons.dblite.open_sharded`.
+
+    .. versionadded:: 4.12.0
+    """
+    open = staticmethod(SCons.dblite.open_sharded)
+
+
 def current_sconsign_filename():
     hash_format = SCons.Util.get_hash_format()
     current_hash_algorithm = SCons.Util.get_current_hash_algorithm_used()
@@ -71,6 +100,16 @@ def current_sconsign_filename():
         return ".sconsign"
     return ".sconsign_" + current_hash_algorithm
 
+def _db_path(top) -> str:
+    """Return the path of the top directory's signature database."""
+    if os.path.isabs(DB_Name):
+        return DB_Name
+    topdir = top.get_abspath()
+    if os.getcwd() == topdir:
+        return DB_Name
+    return os.path.join(topdir, DB_Name)
+
+
 def Get_DataBase(dir):
     global DB_Name
 
@@ -92,13 +131,20 @@ def Get_DataBase(dir):
                     else:
                         if mode != "r":
                             DB_sync_list.append(db)
+                            replay_journal(db, path + JOURNAL_SUFFIX)
                         return db, mode
             mode = "r"
     try:
         return DataBase[top], "c"
     except KeyError:
-        db = DataBase[top] = DB_Module.open(DB_Name, "c")
+        # The database may first be needed while a subsidiary SConscript
+        # is read (by an emitter, say), with that SConscript's directory
+        # as the current directory: a relative name is always relative
+        # to the top directory.
+        path = _db_path(top)
+        db = DataBase[top] = DB_Module.open(path, "c")
         DB_sync_list.append(db)
+        replay_journal(db, path + JOURNAL_SUFFIX)
         return db, "c"
     except TypeError:
         print("DataBase =", DataBase)
@@ -108,9 +154,15 @@ def Get_DataBase(dir):
 def Reset() -> None:
     """Reset global state.  Used by unit tests that end up using
     SConsign multiple times to get a clean slate for each test."""
-    global sig_files, DB_sync_list
+    global sig_files, DB_sync_list, Journal_Name, _reverse_index
+    global checkpoint_interval, checkpoint_tasks
     sig_files = []
     DB_sync_list = []
+    Journal_Name = None
+    _reverse_index = None
+    _replayed_dependencies.clear()
+    checkpoint_interval = None
+    checkpoint_tasks = None
 
 
 normcase = os.path.normcase
@@ -120,27 +172,164 @@ def write() -> None:
     if print_time():
         start_time = time.perf_counter()
 
-    for sig_file in sig_files:
-        sig_file.write(sync=0)
-    for db in DB_sync_list:
-        try:
-            syncmethod = db.sync
-        except AttributeError:
-            pass # Not all dbm modules have sync() methods.
-        else:
-            syncmethod()
-        try:
-            closemethod = db.close
-        except AttributeError:
-            pass # Not all dbm modules have close() methods.
-        else:
-            closemethod()
+    with trace_stats.span('sconsign', 'write'):
+        for sig_file in sig_files:
+            sig_file.write(sync=0)
+        if _reverse_index is not None:
+            _reverse_index.write()
+        for db in DB_sync_list:
+            try:
+                syncmethod = db.sync
+            except AttributeError:
+                pass # Not all dbm modules have sync() methods.
+            else:
+                syncmethod()
+            try:
+                closemethod = db.close
+            except AttributeError:
+                pass # Not all dbm modules have close() methods.
+            else:
+                closemethod()
+        if Journal_Name is not None:
+            # everything in the journal is in the database now
+            try:
+                os.unlink(Journal_Name)
+            except OSError:
+                pass
 
     if print_time():
         elapsed = time.perf_counter() - start_time
         print('Total SConsign sync time: %f seconds' % elapsed)
 
 
+def replay_journal(db, journal_name) -> None:
+    """Apply the checkpoint journal *journal_name* to the database *db*.
+
+    The journal holds the signature entries stored by an earlier build
+    which did not get to write the database, see :func:`checkpoint`.
+    A truncated last record, from a build killed in mid-checkpoint,
+    is ignored.  The journal is removed by :func:`write` once the
+    database has been written.
+
+    .. versionadded:: 4.12.0
+    """
+    global Journal_Name
+    Journal_Name = journal_name
+    updates = {}
+    try:
+        with open(journal_name, 'rb') as f:
+            while True:
+                try:
+                    path, entries = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception:
+                    corrupt_dblite_warning(journal_name)
+                    break
+                try:
+                    updates[path].update(entries)
+                except KeyError:
+                    updates[path] = entries
+    except OSError:
+        return
+
+    for path, entries in updates.items():
+        try:
+            stored = pickle.loads(db[path])
+            if not isinstance(stored, dict):
+                stored = {}
+        except KeyError:
+            stored = {}
+        except Exception:
+            corrupt_dblite_warning(journal_name)
+            stored = {}
+        stored.update(entries)
+        db[path] = pickle.dumps(stored, PICKLE_PROTOCOL)
+        for name, entry in entries.items():
+            binfo = getattr(entry, 'binfo', None)
+            if binfo is not None:
+                _replayed_dependencies[os.path.normpath(os.path.join(path, name))] = \
+                    _dependency_paths(binfo)
+
+
+def _sconsign_copy(entry):
+    """Return a copy of *entry* converted for writing.
+
+    The entry itself stays in use for the rest of the build, so it
+    must not be converted in place.
+    """
+    entry = copy.copy(entry)
+    entry.binfo = copy.copy(entry.binfo)
+    entry.convert_to_sconsign()
+    return entry
+
+
+def checkpoint() -> None:
+    """Append the signature entries stored since the last checkpoint to the journal.
+
+    Only the single-database mode is journaled; the per-directory
+    ``.sconsign`` files of ``SConsignFile(None)`` are not.
+
+    .. versionadded:: 4.12.0
+    """
+    if Journal_Name is None:
+        return
+    records = []
+    for sig_file in sig_files:
+        if not isinstance(sig_file, DB) or not sig_file.to_be_merged:
+            continue
+        names = list(sig_file.to_be_merged)
+        sig_file.merge()
+        entries = {}
+        for name in names:
+            try:
+                entries[name] = _sconsign_copy(sig_file.entries[name])
+            except AttributeError:
+                pass
+        path = normcase(sig_file.dir.get_internal_path())
+        records.append((path, entries))
+    if not records:
+        return
+    with trace_stats.span('sconsign', 'checkpoint'):
+        with open(Journal_Name, 'ab') as f:
+            for record in records:
+                pickle.dump(record, f, PICKLE_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def set_checkpoint(interval=None, tasks=None) -> None:
+    """Checkpoint every *interval* seconds and/or every *tasks* built tasks.
+
+    .. versionadded:: 4.12.0
+    """
+    global checkpoint_interval, checkpoint_tasks, _checkpoint_time, _checkpoint_count
+    checkpoint_interval = interval or None
+    checkpoint_tasks = tasks or None
+    _checkpoint_time = time.monotonic()
+    _checkpoint_count = 0
+
+
+def task_done() -> None:
+    """Note that a task was built, and checkpoint if one is due.
+
+    .. versionadded:: 4.12.0
+    """
+    global _checkpoint_time, _checkpoint_count
+    if checkpoint_interval is None and checkpoint_tasks is None:
+        return
+    _checkpoint_count += 1
+    now = time.monotonic()
+    if (
+        (checkpoint_tasks is not None and _checkpoint_count >= checkpoint_tasks)
+        or (checkpoint_interval is not None
+            and now - _checkpoint_time >= checkpoint_interval)
+    ):
+        checkpoint()
+        _checkpoint_time = now
+        _checkpoint_count = 0
+
+
 class SConsignEntry:
     """
     Wrapper class for the generic entry in a .sconsign file.
@@ -284,6 +473,17 @@ class DB(Base):
 
         sig_files.append(self)
 
+    def store_info(self, filename, node) -> None:
+        index = _get_reverse_index(self.dir.fs.Top)
+        if index.exists:
+            # only targets whose dependencies changed update the index
+            old = _dependency_paths(getattr(node.get_stored_info(), 'binfo', None))
+            new = _dependency_paths(node.get_binfo())
+            if new != old:
+                path = normcase(self.dir.get_internal_path())
+                index.note(os.path.normpath(os.path.join(path, filename)), new)
+        super().store_info(filename, node)
+
     def write(self, sync: int=1) -> None:
         if not self.dirty:
             return
@@ -420,10 +620,169 @@ class DirFile(Dir):
 ForDirectory = DB
 
 
-def File(name, dbm_module=None) -> None:
+def _dependency_paths(binfo) -> tuple:
+    """Returns the paths of the dependencies recorded in *binfo*.
+
+    *binfo* may hold Nodes (while building) or their stored string form
+    (as read from the database); both give the same paths.
+    """
+    paths = []
+    for attr in ('bsources', 'bdepends', 'bimplicit'):
+        for dep in getattr(binfo, attr, None) or ():
+            try:
+                dep = dep.get_internal_path()
+            except AttributeError:
+                dep = str(dep)
+            paths.append(os.path.normpath(dep))
+    return tuple(paths)
+
+
+class ReverseIndex:
+    """The reverse dependencies of the targets in the .sconsign database.
+
+    Maps the path of each node (relative to the top directory, or
+    absolute if outside it) to the paths of the targets which depended
+    on it directly the last time they were built, according to their
+    stored sources, explicit dependencies and implicit dependencies.
+
+    The index is kept in a file next to the database (with an added
+    ``.rdeps`` suffix), made by :func:`reverse_dependencies` the first
+    time it is needed.  From then on, as the signature entries of
+    targets are stored, those whose dependencies changed are noted and
+    applied to the index when the database is written, so keeping it
+    up to date costs in proportion to what changed, and it is only read
+    when there is such a change or a lookup.
+
+    .. versionadded:: 4.12.0
+    """
+
+    def __init__(self, top) -> None:
+        self.top = top
+        self.path = _db_path(top) + RDEPS_SUFFIX
+        self.exists = os.path.exists(self.path)
+        self.targets = None     # target path -> dependency paths
+        self.rdeps = None       # dependency path -> set of target paths
+        # the targets built by an interrupted build, see replay_journal()
+        self.pending = dict(_replayed_dependencies)
+        self.dirty = False
+
+    def note(self, target, deps) -> None:
+        """Records that *target* now depends on the paths *deps*."""
+        if self.targets is None:
+            self.pending[target] = deps
+        else:
+            self._set(target, deps)
+
+    def _set(self, target, deps) -> None:
+        old = self.targets.get(target, ())
+        if old == deps:
+            return
+        for dep in old:
+            parents = self.rdeps.get(dep)
+            if parents is not None:
+                parents.discard(target)
+                if not parents:
+                    del self.rdeps[dep]
+        for dep in deps:
+            self.rdeps.setdefault(dep, set()).add(target)
+        self.targets[target] = deps
+        self.dirty = True
+
+    def load(self) -> None:
+        """Reads the index, or makes it from the whole database."""
+        if self.targets is not None:
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                self.targets, self.rdeps = pickle.load(f)
+        except Exception:
+            self.targets, self.rdeps = {}, {}
+            db, _ = Get_DataBase(self.top)
+            for dirkey in db.keys():
+                try:
+                    entries = pickle.loads(db[dirkey])
+                except Exception:
+                    continue
+                if isinstance(dirkey, bytes):
+                    # some dbm modules hand back bytes keys
+                    dirkey = dirkey.decode()
+                if isinstance(entries, dict):
+                    for name, entry in entries.items():
+                        binfo = getattr(entry, 'binfo', None)
+                        if binfo is not None:
+                            target = os.path.normpath(os.path.join(dirkey, name))
+                            self._set(target, _dependency_paths(binfo))
+            self.dirty = True
+        pending, self.pending = self.pending, {}
+        for target, deps in pending.items():
+            self._set(target, deps)
+
+    def write(self) -> None:
+        if self.pending:
+            self.load()
+        if not self.dirty:
+            return
+        try:
+            with open(self.path, 'wb') as f:
+                pickle.dump((self.targets, self.rdeps), f, PICKLE_PROTOCOL)
+        except OSError:
+            return
+        self.exists = True
+        self.dirty = False
+
+    def __contains__(self, path) -> bool:
+        return path in self.rdeps
+
+    def get(self, path, default=()):
+        """Returns the targets which depend directly on *path*."""
+        return self.rdeps.get(path, default)
+
+
+_reverse_index = None
+_replayed_dependencies = {}
+
+
+def _get_reverse_index(top) -> ReverseIndex:
+    global _reverse_index
+    if _reverse_index is None:
+        Get_DataBase(top)   # sets DB_Name
+        _reverse_index = ReverseIndex(top)
+    return _reverse_index
+
+
+def reverse_dependencies(fs) -> ReverseIndex:
+    """Returns the reverse dependency index of the .sconsign database.
+
+    The index is made and saved if it does not exist yet; from then on
+    it is kept up to date by every build.
+
+    Raises:
+        UserError: if signatures are not kept in a single database
+           (``SConsignFile(None)``).
+
+    .. versionadded:: 4.12.0
+    """
+    if ForDirectory is not DB:
+        raise SCons.Errors.UserError(
+            "The reverse dependency index needs a single .sconsign "
+            "database, but SConsignFile(None) is in effect"
+        )
+    index = _get_reverse_index(fs.Top)
+    index.load()
+    index.write()
+    return index
+
+
+def File(name, dbm_module=None, sharded: bool = False) -> None:
     """
     Arrange for all signatures to be stored in a global .sconsign.db*
     file.
+
+    If *sharded* is true, the database is split into one file per
+    top-level directory, see :class:`ShardedDB`.
+
+    .. versionchanged:: 4.12.0
+       The *sharded* parameter was added.
     """
     global ForDirectory, DB_Name, DB_Module
     if name is None:
@@ -432,5 +791,14 @@ def File(name, dbm_module=None) -> None:
     else:
         ForDirectory = DB
         DB_Name = name
-        if dbm_module is not None:
+        if sharded:
+            if dbm_module not in (None, SCons.dblite, ShardedDB):
+                raise SCons.Errors.UserError(
+                    "A sharded signature database can only use the "
+                    "default dblite format"
+                )
+            DB_Module = ShardedDB
+        elif dbm_module is not None:
             DB_Module = dbm_module
+        elif DB_Module is ShardedDB:
+            DB_Module = SCons.dblite
@@ -27,6 +27,7 @@ import unittest
 import TestCmd
 
 import SCons.dblite
+import SCons.Errors
 import SCons.SConsign
 from SCons.Util import get_hash_format, get_current_hash_algorithm_used
 
@@ -62,6 +63,9 @@ class DummyNode:
         return self.path
     def get_tpath(self):
         return self.tpath
+    def get_abspath(self):
+        # only used as the top directory, which the tests run in
+        return os.getcwd()
 
 class SConsignTestCase(unittest.TestCase):
     def setUp(self) -> None:
@@ -341,6 +345,102 @@ class SConsignFileTestCase(SConsignTestCase):
         assert fake_dbm.mode == "c", fake_dbm.mode
 
 
+class ShardedDBTestCase(SConsignTestCase):
+
+    def test_sharded(self) -> None:
+        """Test a signature database sharded by top-level directory"""
+        file = self.test.workpath('sconsign_file')
+        save = (SCons.SConsign.DataBase, SCons.SConsign.DB_Name,
+                SCons.SConsign.DB_Module, SCons.SConsign.ForDirectory)
+        SCons.SConsign.DataBase = {}
+        try:
+            SCons.SConsign.File(file, sharded=True)
+            assert SCons.SConsign.DB_Module is SCons.SConsign.ShardedDB
+
+            top = DummyNode('.')
+            for path in ('.', 'dir1', os.path.join('dir1', 'sub'), 'dir2'):
+                node = DummyNode(path)
+                node.fs = top.fs
+                d = SCons.SConsign.DB(node)
+                d.set_entry('foo', DummySConsignEntry(path))
+            SCons.SConsign.write()
+
+            shards = sorted(os.listdir(file + '.shards'))
+            assert shards == ['d_dir1.dblite', 'd_dir2.dblite', 'keys.index',
+                              'root.dblite'], shards
+
+            db = SCons.dblite.open_sharded(file, 'r')
+            assert 'dir2' in db
+            assert list(db._shards) == ['d_dir2'], db._shards
+            assert 'dir3' not in db
+            # the keys come from the index, without reading the shards
+            assert sorted(db.keys()) == sorted(
+                ['.', 'dir1', os.path.join('dir1', 'sub'), 'dir2']
+            ), db.keys()
+            loaded = [name for name, shard in db._shards.items() if shard is not None]
+            assert loaded == ['d_dir2'], db._shards
+
+            # a shard changed behind the index's back is read
+            other = SCons.dblite.open_sharded(file, 'c')
+            other['dir1'] = b'x'
+            other['dir1/new'] = b'y'
+            other._shards['d_dir1'].sync()
+            db = SCons.dblite.open_sharded(file, 'r')
+            assert 'dir1/new' in db.keys(), db.keys()
+
+            self.assertRaises(SCons.Errors.UserError, SCons.SConsign.File,
+                              file, sharded=True, dbm_module=object())
+            SCons.SConsign.File(file)
+            assert SCons.SConsign.DB_Module is SCons.dblite
+        finally:
+            (SCons.SConsign.DataBase, SCons.SConsign.DB_Name,
+             SCons.SConsign.DB_Module, SCons.SConsign.ForDirectory) = save
+
+    def test_shard_name(self) -> None:
+        """Test which shard a directory's entries go to"""
+        shard_name = SCons.dblite._shard_name
+        assert shard_name('.') == 'root'
+        assert shard_name('') == 'root'
+        assert shard_name('dir1') == 'd_dir1'
+        assert shard_name(os.path.join('dir1', 'sub')) == 'd_dir1'
+        assert shard_name(os.path.join('..', 'other')) == 'external'
+        assert shard_name(os.path.abspath('elsewhere')) == 'external'
+
+
+class checkpointTestCase(SConsignTestCase):
+
+    def test_checkpoint(self) -> None:
+        """Test replaying the checkpoint journal of an interrupted build"""
+        file = self.test.workpath('sconsign_file')
+        journal = file + SCons.SConsign.JOURNAL_SUFFIX
+        save = (SCons.SConsign.DataBase, SCons.SConsign.DB_Name,
+                SCons.SConsign.DB_Module, SCons.SConsign.ForDirectory)
+        SCons.SConsign.DataBase = {}
+        try:
+            SCons.SConsign.File(file, SCons.dblite)
+            d = SCons.SConsign.DB(DummyNode('dir1'))
+            foo = DummySConsignEntry('foo')
+            d.store_info('foo', DummyNode('dir1/foo', foo))
+            SCons.SConsign.checkpoint()
+            assert os.path.exists(journal)
+            assert not hasattr(foo, 'c_to_s'), "entry converted in place"
+
+            # start over as if the build had been killed
+            SCons.SConsign.DataBase = {}
+            SCons.SConsign.Reset()
+            d = SCons.SConsign.DB(DummyNode('dir1'))
+            assert d.get_entry('foo').name == 'foo'
+            SCons.SConsign.write()
+            assert not os.path.exists(journal)
+
+            SCons.SConsign.DataBase = {}
+            d = SCons.SConsign.DB(DummyNode('dir1'))
+            assert d.get_entry('foo').name == 'foo'
+        finally:
+            (SCons.SConsign.DataBase, SCons.SConsign.DB_Name,
+             SCons.SConsign.DB_Module, SCons.SConsign.ForDirectory) = save
+
+
 class writeTestCase(SConsignTestCase):
 
     def test_write(self) -> None:
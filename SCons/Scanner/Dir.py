@@ -82,6 +82,16 @@ skip_entry_list = [
    '.sconsign_sha256.dat',
    '.sconsign_sha256.bak',
    '.sconsign_sha256.db',
+   # reverse dependency index used by --changed-files
+   '.sconsign.rdeps',
+   '.sconsign_md5.rdeps',
+   '.sconsign_sha1.rdeps',
+   '.sconsign_sha256.rdeps',
+   # checkpoint journal used by --checkpoint-interval/--checkpoint-tasks
+   '.sconsign.journal',
+   '.sconsign_md5.journal',
+   '.sconsign_sha1.journal',
+   '.sconsign_sha256.journal',
 ]
 
 for skip in skip_entry_list:
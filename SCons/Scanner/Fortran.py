@@ -31,6 +31,29 @@ import SCons.Util
 import SCons.Warnings
 from . import Classic, Current, FindPathDirs
 
+# The module files (.mod) the Fortran object emitters have seen being
+# produced, by file name.  The scanner falls back to this when a USE'd
+# module is not found on the search path, so that the object which
+# produces a module is still built before the ones which use it.  A
+# name produced by more than one source maps to None, as it is not
+# clear which of them is meant.
+_module_producers = {}
+
+def add_module_producer(module) -> None:
+    """Record *module*, a .mod File node, as produced by the build.
+
+    .. versionadded:: 4.12.0
+    """
+    if _module_producers.setdefault(module.name, module) is not module:
+        _module_producers[module.name] = None
+
+def find_module_producer(name):
+    """Return the .mod File node produced under *name*, or None.
+
+    .. versionadded:: 4.12.0
+    """
+    return _module_producers.get(name)
+
 class F90Scanner(Classic):
     """
     A Classic Scanner subclass for Fortran source files which takes
@@ -53,6 +76,8 @@ class F90Scanner(Classic):
         self.cre_use = re.compile(use_regex, re.M)
         self.cre_incl = re.compile(incl_regex, re.M)
         self.cre_def = re.compile(def_regex, re.M)
+        self.parse_sig = SCons.Util.hash_signature(
+            '\n'.join((use_regex, incl_regex, def_regex)))
 
         def _scan(node, env, path, self=self):
             node = node.rfile()
@@ -71,18 +96,39 @@ class F90Scanner(Classic):
         # bypasses the parent Classic initializer
         Current.__init__(self, *args, **kwargs)
 
+    def parse(self, node):
+        """Return the included files, used and defined modules of *node*.
+
+        Running the regexes over the sources is most of the work of
+        scanning a large Fortran tree, so for source files the result
+        is cached in the .sconsign entry of *node*, keyed by its content
+        signature and the regexes, and reused while neither changes.
+
+        .. versionadded:: 4.12.0
+        """
+        cacheable = not node.is_derived() and node.exists()
+        if cacheable:
+            sig = (node.get_csig(), self.parse_sig)
+            result = node.get_emitter_cache('fortran', sig)
+            if result is not None:
+                return result
+        contents = node.get_text_contents()
+        result = (self.cre_incl.findall(contents),
+                  self.cre_use.findall(contents),
+                  self.cre_def.findall(contents))
+        if cacheable:
+            node.set_emitter_cache('fortran', sig, result)
+        return result
+
     def scan(self, node, env, path=()):
 
         # cache the includes list in node so we only scan it once:
         if node.includes is not None:
             mods_and_includes = node.includes
         else:
-            # retrieve all included filenames
-            includes = self.cre_incl.findall(node.get_text_contents())
-            # retrieve all USE'd module names
-            modules = self.cre_use.findall(node.get_text_contents())
-            # retrieve all defined module names
-            defmodules = self.cre_def.findall(node.get_text_contents())
+            # retrieve all included filenames, USE'd module names
+            # and defined module names
+            includes, modules, defmodules = self.parse(node)
 
             # Remove all USE'd module names that are defined in the same file
             # (case-insensitively)
@@ -109,6 +155,8 @@ class F90Scanner(Classic):
             path = path()
         for dep in mods_and_includes:
             n, i = self.find_include(dep, source_dir, path)
+            if n is None:
+                n = find_module_producer(dep)
 
             if n is None:
                 SCons.Warnings.warn(SCons.Warnings.DependencyWarning,
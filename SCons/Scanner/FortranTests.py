@@ -528,5 +528,66 @@ class FortranScannerTestCase16(unittest.TestCase):
 
 
 
+class FortranScannerParseCache(unittest.TestCase):
+    def runTest(self) -> None:
+        test.write('fffcache.f90', """\
+module mod_cache
+  use mod_other
+  include 'f1.f'
+end module mod_cache
+""")
+        env = DummyEnvironment([])
+        s = SCons.Scanner.Fortran.FortranScan()
+        node = env.File('fffcache.f90')
+        result = s.parse(node)
+        self.assertEqual(result, (['f1.f'], ['mod_other'], ['mod_cache']))
+
+        # A fresh node for the same (unchanged) file uses the cached
+        # result rather than reading the file.
+        node = DummyEnvironment([]).File('fffcache.f90')
+        node.get_stored_info().binfo.emitter_cache = {
+            'fortran': ((node.get_csig(), s.parse_sig), (['x.f'], [], [])),
+        }
+        self.assertEqual(s.parse(node), (['x.f'], [], []))
+
+        # ...but not once the contents have changed.
+        test.write('fffcache.f90', "      INCLUDE 'f2.f'\n")
+        node = DummyEnvironment([]).File('fffcache.f90')
+        node.get_stored_info().binfo.emitter_cache = {
+            'fortran': (('stale', s.parse_sig), (['x.f'], [], [])),
+        }
+        self.assertEqual(s.parse(node), (['f2.f'], [], []))
+        test.unlink('fffcache.f90')
+
+
+class FortranScannerModuleProducer(unittest.TestCase):
+    def runTest(self) -> None:
+        test.write('fffprod.f90', "      USE mod_made\n")
+        env = DummyEnvironment([])
+        s = SCons.Scanner.Fortran.FortranScan()
+        path = s.path(env)
+        producers = SCons.Scanner.Fortran._module_producers
+        try:
+            # Not on the search path, and not known to be produced.
+            deps = s(env.File('fffprod.f90'), env, path)
+            deps_match(self, deps, [])
+
+            module = env.File('build/mods/mod_made.mod')
+            SCons.Scanner.Fortran.add_module_producer(module)
+            env.File('fffprod.f90').includes = None
+            deps = s(env.File('fffprod.f90'), env, path)
+            deps_match(self, deps, ['build/mods/mod_made.mod'])
+
+            # Ambiguous producers are not used.
+            SCons.Scanner.Fortran.add_module_producer(
+                env.File('other/mod_made.mod'))
+            self.assertIsNone(
+                SCons.Scanner.Fortran.find_module_producer('mod_made.mod'))
+        finally:
+            producers.clear()
+            test.unlink('fffprod.f90')
+
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,7 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import os
+import time
 
 import SCons.Node
 import SCons.Node.FS
@@ -58,6 +59,88 @@ def _collect_classes(classlist, dirname, files) -> None:
             classlist.append(os.path.join(str(dirname), fname))
 
 
+# Index of on-disk classpath directories, shared by all scans in a run:
+#   _classpath_dirs maps a directory path to (mtime, class files, subdirs)
+#   _classpath_trees maps a classpath directory to (dir mtimes, class paths)
+# A directory's mtime changes whenever an entry is added to or removed
+# from it, so the index stays valid as long as none of the mtimes of
+# the directories it was built from has changed.  As for the Glob
+# cache, directories modified less than GLOB_CACHE_RACY_NS before they
+# were read are not remembered, since a later change within the same
+# tick of the file system clock would leave their mtime unchanged.
+_classpath_dirs = {}
+_classpath_trees = {}
+
+
+def _index_classpath_dir(path, mtime):
+    """List *path* (the way :func:`os.walk` does) and remember it."""
+    classes, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # os.walk does not descend into symlinked dirs either
+                    if not entry.is_symlink():
+                        subdirs.append(entry.name)
+                elif entry.name.endswith(".class"):
+                    classes.append(entry.name)
+    except OSError:
+        pass
+    if not _is_racy(mtime):
+        _classpath_dirs[path] = (mtime, classes, subdirs)
+    return classes, subdirs
+
+
+def _is_racy(mtime) -> bool:
+    """Return whether a directory with *mtime* may still change unseen."""
+    return time.time_ns() - mtime < SCons.Node.FS.GLOB_CACHE_RACY_NS
+
+
+def _disk_classes(top) -> list:
+    """Return the paths of the .class files on disk below *top*.
+
+    Equivalent to collecting the ``.class`` files from ``os.walk(top)``,
+    but the directory listings are indexed and only re-read for
+    directories whose mtime has changed, so scanning many Java targets
+    against a large classpath directory costs one ``stat`` per
+    directory rather than a full walk each time.
+    """
+    tree = _classpath_trees.get(top)
+    if tree is not None:
+        dir_mtimes, result = tree
+        try:
+            if all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes):
+                return result
+        except OSError:
+            pass
+
+    dir_mtimes = []
+    result = []
+    todo = [top]
+    while todo:
+        path = todo.pop()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        dir_mtimes.append((path, mtime))
+        cached = _classpath_dirs.get(path)
+        if cached is not None and cached[0] == mtime:
+            _, classes, subdirs = cached
+        else:
+            classes, subdirs = _index_classpath_dir(path, mtime)
+        result.extend(os.path.join(path, fname) for fname in classes)
+        # visit subdirectories top-down, in listing order
+        todo.extend(os.path.join(path, d) for d in reversed(subdirs))
+    if not any(_is_racy(m) for _, m in dir_mtimes):
+        _classpath_trees[top] = (dir_mtimes, result)
+    return result
+
+
 def scan(node, env, libpath=()) -> list:
     """Scan for files both on JAVACLASSPATH and JAVAPROCESSORPATH.
 
@@ -89,8 +172,7 @@ def scan(node, env, libpath=()) -> list:
                 # grab the in-memory nodes
                 env.Dir(lib).walk(_collect_classes, result)
                 # now the on-disk ones
-                for root, dirs, files in os.walk(str(lib)):
-                    _collect_classes(result, root, files)
+                result.extend(_disk_classes(str(lib)))
             else:
                 result.append(lib)
 
@@ -24,6 +24,8 @@
 import unittest
 import collections
 import os
+import time
+from unittest import mock
 
 import TestCmd
 
@@ -243,5 +245,46 @@ class JavaScannerSearchPathProcessorpath(unittest.TestCase):
         deps_match(self, deps, expected)
 
 
+class JavaScannerClasspathIndex(unittest.TestCase):
+    def runTest(self) -> None:
+        idx = TestCmd.TestCmd(workdir='')
+        idx.subdir('pkg')
+        idx.write(['pkg', 'A.class'], "\n")
+        a_class = idx.workpath('pkg', 'A.class')
+        b_class = idx.workpath('pkg', 'B.class')
+        s = SCons.Scanner.Java.JavaScanner()
+
+        def scan():
+            env = DummyEnvironment(JAVASUFFIXES=['.java'],
+                                   JAVACLASSPATH=[idx.workpath()])
+            return s(DummyNode('dummy'), env)
+
+        # directories modified just now are listed again every time,
+        # as a change in the same clock tick keeps their mtime
+        c_class = idx.workpath('pkg', 'C.class')
+        deps_match(self, scan(), [a_class])
+        mtime = os.stat(idx.workpath('pkg')).st_mtime_ns
+        idx.write(['pkg', 'C.class'], "\n")
+        os.utime(idx.workpath('pkg'), ns=(mtime, mtime))
+        deps_match(self, scan(), [a_class, c_class])
+        os.unlink(c_class)
+
+        # older directories are indexed
+        old = time.time() - 3600
+        for d in (idx.workpath(), idx.workpath('pkg')):
+            os.utime(d, (old, old))
+        deps_match(self, scan(), [a_class])
+
+        # unchanged directories are not listed again
+        with mock.patch.object(SCons.Scanner.Java, '_index_classpath_dir',
+                               side_effect=AssertionError("re-listed")):
+            deps_match(self, scan(), [a_class])
+
+        # a new class file changes the directory mtime and is found
+        idx.write(['pkg', 'B.class'], "\n")
+        mtime = os.stat(idx.workpath('pkg')).st_mtime + 10
+        os.utime(idx.workpath('pkg'), (mtime, mtime))
+        deps_match(self, scan(), [a_class, b_class])
+
 if __name__ == "__main__":
     unittest.main()
@@ -263,6 +263,7 @@ version                 Prints SCons version information.
         # to .SConsign.
         # Pretty sure commenting this out is the correct fix.
         # SCons.SConsign.Reset()
+        self.fs.refresh_repository_manifests()
         SCons.Script.Main.progress_display("scons: done clearing node information.")
 
     def do_clean(self, argv):
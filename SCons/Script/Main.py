@@ -52,17 +52,18 @@ import SCons.Environment
 import SCons.Errors
 import SCons.Taskmaster.Job
 import SCons.Node
+import SCons.Node.Alias
 import SCons.Node.FS
 import SCons.Platform
 import SCons.Platform.virtualenv
 import SCons.SConf
+import SCons.SConsign
 import SCons.Script
 import SCons.Taskmaster
 import SCons.Util
 import SCons.Warnings
-import SCons.Script.Interactive
 from .SConsOptions import SConsOption
-from SCons.Util.stats import count_stats, memory_stats, time_stats, ENABLE_JSON, write_scons_stats_file, JSON_OUTPUT_FILE
+from SCons.Util.stats import count_stats, memory_stats, time_stats, trace_stats, ENABLE_JSON, write_scons_stats_file, JSON_OUTPUT_FILE
 
 from SCons import __version__ as SConsVersion
 
@@ -282,6 +283,8 @@ class BuildTask(SCons.Taskmaster.OutOfDateTask):
                 SCons.Taskmaster.OutOfDateTask.executed(self)
         else:
             SCons.Taskmaster.OutOfDateTask.executed(self)
+            if t.get_state() == SCons.Node.executed:
+                SCons.SConsign.task_done()
 
     def failed(self) -> None:
         # Handle the failure of a build task.  The primary purpose here
@@ -460,11 +463,14 @@ class QuestionTask(SCons.Taskmaster.AlwaysTask):
 
 
 class TreePrinter:
-    def __init__(self, derived: bool=False, prune: bool=False, status: bool=False, sLineDraw: bool=False) -> None:
+    def __init__(self, derived: bool=False, prune: bool=False, status: bool=False, sLineDraw: bool=False,
+                 ids: bool=False, format: str='text') -> None:
         self.derived = derived
         self.prune = prune
         self.status = status
         self.sLineDraw = sLineDraw
+        self.ids = ids
+        self.format = format
 
     def get_all_children(self, node):
         return node.all_children()
@@ -479,14 +485,20 @@ class TreePrinter:
         else:
             func = self.get_all_children
         s = 2 if self.status else 0
-        SCons.Util.print_tree(
-            t,
-            func,
-            prune=self.prune,
-            showtags=s,
-            lastChild=True,
-            singleLineDraw=self.sLineDraw,
-        )
+        if self.format == 'json':
+            SCons.Util.print_tree_json(t, func, showtags=self.status)
+        elif self.format == 'dot':
+            SCons.Util.print_tree_dot(t, func)
+        else:
+            SCons.Util.print_tree(
+                t,
+                func,
+                prune=self.prune,
+                showtags=s,
+                lastChild=True,
+                singleLineDraw=self.sLineDraw,
+                ids=self.ids,
+            )
 
 def python_version_string():
     return sys.version.split()[0]
@@ -562,15 +574,18 @@ def SetOption(name: str, value):
     """Set the value of an option - Public API."""
     return OptionsParser.values.set_option(name, value)
 
-def DebugOptions(json: str | None = None) -> None:
+def DebugOptions(json: str | None = None, trace: str | None = None) -> None:
     """Specify options to SCons debug logic - Public API.
 
-    Currently only *json* is supported, which changes the JSON file
-    written to if the ``--debug=json`` command-line option is specified
-    to the value supplied.
+    *json* changes the JSON file written to if the ``--debug=json``
+    command-line option is specified to the value supplied.
+    *trace* likewise changes the trace-event file written to if the
+    ``--debug=trace`` command-line option is specified.
 
     .. versionadded:: 4.6.0
 
+    .. versionchanged:: 4.12.0
+       Added the *trace* keyword argument.
     """
     if json is not None:
         json_node = SCons.Defaults.DefaultEnvironment().arg2nodes(json)
@@ -585,6 +600,15 @@ def DebugOptions(json: str | None = None) -> None:
                 pass
         except OSError as e:
             raise SCons.Errors.UserError(f"Unable to create directory for JSON debug output file: {SCons.Util.stats.JSON_OUTPUT_FILE}")
+    if trace is not None:
+        trace_node = SCons.Defaults.DefaultEnvironment().arg2nodes(trace)
+        SCons.Util.stats.TRACE_OUTPUT_FILE = trace_node[0].get_abspath()
+        trace_dir = os.path.dirname(SCons.Util.stats.TRACE_OUTPUT_FILE)
+        try:
+            if not os.path.isdir(trace_dir):
+                os.makedirs(trace_dir, exist_ok=True)
+        except OSError as e:
+            raise SCons.Errors.UserError(f"Unable to create directory for trace debug output file: {SCons.Util.stats.TRACE_OUTPUT_FILE}")
 
 
 def ValidateOptions(throw_exception: bool = False) -> None:
@@ -774,6 +798,8 @@ def _set_debug_values(options) -> None:
         ENABLE_JSON = True
     if "sconscript" in debug_values:
         SCons.Debug.sconscript_trace = True
+    if "trace" in debug_values:
+        trace_stats.enable()
 
 def _create_path(plist):
     path = '.'
@@ -1038,6 +1064,8 @@ def _main(parser):
     fs.set_SConstruct_dir(d)
 
     _set_debug_values(options)
+    if options.glob_cache:
+        fs.enable_glob_cache()
     SCons.Node.implicit_cache = options.implicit_cache
     SCons.Node.implicit_deps_changed = options.implicit_deps_changed
     SCons.Node.implicit_deps_unchanged = options.implicit_deps_unchanged
@@ -1054,7 +1082,7 @@ def _main(parser):
     SCons.SConf.SetCacheMode(options.config)
     SCons.SConf.SetProgressDisplay(progress_display)
 
-    if options.no_progress or options.silent:
+    if options.no_progress or options.silent or options.query:
         progress_display.set_mode(0)
 
     # if site_dir unchanged from default None, neither --site-dir
@@ -1116,8 +1144,9 @@ def _main(parser):
     if print_time:
         start_time = time.time()
     try:
-        for script in scripts:
-            SCons.Script._SConscript._SConscript(fs, script)
+        with trace_stats.span('phase', 'read SConscript files'):
+            for script in scripts:
+                SCons.Script._SConscript._SConscript(fs, script)
     except SCons.Errors.StopError as e:
         # We had problems reading an SConscript file, such as it
         # couldn't be copied in to the VariantDir.  Since we're just
@@ -1127,6 +1156,8 @@ def _main(parser):
         revert_io()
         sys.stderr.write("scons: *** %s  Stop.\n" % e)
         sys.exit(2)
+    finally:
+        SCons.Script._SConscript.finish_reading()
     if print_time:
         global sconscript_time
         sconscript_time = time.time() - start_time
@@ -1214,8 +1245,20 @@ def _main(parser):
     platform = SCons.Platform.platform_module()
 
     if options.interactive:
-        SCons.Script.Interactive.interact(fs, OptionsParser, options,
-                                          targets, target_top)
+        from . import Interactive  # pylint: disable=import-outside-toplevel
+        Interactive.interact(fs, OptionsParser, options, targets, target_top)
+
+    elif options.query:
+        from . import Query  # pylint: disable=import-outside-toplevel
+        # Query the graph below the command-line targets, if any,
+        # else below every node the SConscript files set up.
+        roots = None
+        if targets:
+            roots = [fs.Entry(t) if SCons.Util.is_String(t) else t
+                     for t in SCons.Script.BUILD_TARGETS]
+        for node in Query.query(fs, options.query, roots):
+            print(node)
+        exit_status = 0
 
     else:
 
@@ -1223,8 +1266,87 @@ def _main(parser):
         nodes = _build_targets(fs, options, targets, target_top)
         if not nodes:
             revert_io()
-            print('Found nothing to build')
-            exit_status = 2
+            if options.changed_files and nodes is not None:
+                print('No targets are affected by the changed files')
+            else:
+                print('Found nothing to build')
+                exit_status = 2
+
+def _affected_targets(fs, changed_files, requested):
+    """Returns the requested targets affected by a list of changed files.
+
+    *changed_files* names a file listing one path (relative to the top
+    directory) per line.  The targets which depend on any of them,
+    directly or indirectly, are looked up in the reverse dependency
+    index of the .sconsign database, which records the sources,
+    explicit and implicit dependencies of each target as of its last
+    build, starting from the changed files, so the cost depends on the
+    number of targets affected rather than on the size of the tree.
+    Those which are among the *requested* nodes (or under a requested
+    directory or alias), and not themselves a dependency of another
+    such target, are returned.
+
+    A change to an SConscript file can change the dependency graph, and
+    a change to a file which is not a known dependency of anything
+    (a new source, or a Python module in ``site_scons``) can affect any
+    target, so *requested* is then returned as is.
+    """
+    try:
+        with open(changed_files) as f:
+            lines = [line.strip() for line in f]
+    except OSError as e:
+        raise SCons.Errors.UserError("Cannot read changed files list %s: %s"
+                                     % (changed_files, e.strerror))
+    changed = [fs.Entry(line) for line in lines if line and not line.startswith('#')]
+    for node in changed:
+        if node in SCons.Node.SConscriptNodes:
+            progress_display("scons: %s changed, considering all targets." % node)
+            return requested
+
+    def path_of(node):
+        return os.path.normpath(node.get_internal_path())
+
+    rdeps = SCons.SConsign.reverse_dependencies(fs)
+
+    todo = [path_of(n) for n in changed]
+    for path in todo:
+        if path not in rdeps:
+            progress_display("scons: %s is not a known dependency, "
+                             "considering all targets." % path)
+            return requested
+    seen = set(todo)
+    affected = set()
+    while todo:
+        for target in rdeps.get(todo.pop()):
+            affected.add(target)
+            if target not in seen:
+                seen.add(target)
+                todo.append(target)
+
+    # Directories and aliases stand for what is under or in them.
+    wanted = set()
+    dirs = []
+    todo = list(requested)
+    while todo:
+        node = todo.pop()
+        if node in wanted:
+            continue
+        wanted.add(node)
+        if isinstance(node, SCons.Node.Alias.Alias):
+            todo.extend(node.sources + node.depends)
+        elif isinstance(node, SCons.Node.FS.Dir):
+            dirs.append(node)
+
+    selected = {}
+    for path in sorted(affected):
+        node = fs.Entry(path)
+        if node in wanted or any(node.is_under(d) for d in dirs):
+            selected[path] = node
+    # leave out the targets that are built anyway as a dependency of
+    # another selected target
+    return [node for path, node in selected.items()
+            if not any(t in selected for t in rdeps.get(path))]
+
 
 def _build_targets(fs, options, targets, target_top):
 
@@ -1326,6 +1448,11 @@ def _build_targets(fs, options, targets, target_top):
 
     nodes = [_f for _f in map(Entry, targets) if _f]
 
+    if options.changed_files:
+        nodes = _affected_targets(fs, options.changed_files, nodes)
+        if not nodes:
+            return nodes
+
     task_class = BuildTask      # default action is to build targets
     opening_message = "Building targets ..."
     closing_message = "done building targets."
@@ -1408,8 +1535,13 @@ def _build_targets(fs, options, targets, target_top):
                 progress_display("scons: writing .sconsign file.")
             SCons.SConsign.write()
 
+    if not options.no_exec:
+        SCons.SConsign.set_checkpoint(options.checkpoint_interval,
+                                      options.checkpoint_tasks)
+
     progress_display("scons: " + opening_message)
-    jobs.run(postfunc = jobs_postfunc)
+    with trace_stats.span('phase', 'build targets'):
+        jobs.run(postfunc = jobs_postfunc)
 
     memory_stats.append('after building targets:')
     count_stats.append(('post-', 'build'))
@@ -1551,6 +1683,7 @@ def main() -> None:
 
     memory_stats.print_stats()
     count_stats.print_stats()
+    trace_stats.print_stats()
 
     if print_objects:
         SCons.Debug.listLoggedInstances('*')
@@ -0,0 +1,412 @@
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""SCons dependency graph queries.
+
+Implements the ``--query`` option: a small expression language over
+the dependency graph, in the spirit of ``bazel query``::
+
+    scons -Q --query='rdeps(//src/foo.h)'
+    scons -Q --query='somepath(prog, include/config.h)'
+    scons -Q --query='kind(Program, rdeps(src/*.h))'
+
+Target literals are paths relative to the top directory (a leading
+``//`` is accepted as a synonym for ``#``) and may contain shell-style
+wildcards, which are matched against every node in the graph.  The
+functions are:
+
+``deps(x [, depth])``
+    *x* and everything it depends on.
+``rdeps(x [, depth])``
+    *x* and everything which depends on it.
+``somepath(x, y)``
+    One dependency path from a node in *x* to a node in *y*.
+``allpaths(x, y)``
+    All the nodes on some dependency path from *x* to *y*.
+``kind(pattern, x)``
+    The nodes of *x* whose kind (see :func:`node_kind`) matches the
+    regular expression *pattern*.
+``filter(pattern, x)``
+    The nodes of *x* whose path matches the regular expression *pattern*.
+
+Results can be combined with the ``+`` (union), ``-`` (difference) and
+``^`` (intersection) operators, which must be surrounded by whitespace,
+are left-associative and have equal precedence.
+
+The graph is built once, with a reverse-edge index, by walking the
+children of the roots.  Stored implicit dependencies are taken from
+the .sconsign file where available, so targets which were built before
+are not rescanned.
+"""
+
+import fnmatch
+import re
+from collections import deque
+
+import SCons.Errors
+import SCons.Node
+import SCons.Node.Alias
+import SCons.Node.FS
+
+
+class QueryError(SCons.Errors.UserError):
+    pass
+
+
+class DependencyGraph:
+    """An indexed snapshot of the dependency graph below some root nodes.
+
+    Nodes are numbered in the order they are found; :attr:`children`
+    holds the numbers of each node's children and :attr:`parents`
+    (built on first use) the reverse edges.
+    """
+
+    def __init__(self, roots) -> None:
+        self.nodes = []
+        self.index = {}
+        self.children = []
+        self._parents = None
+        for root in roots:
+            self._add(root)
+        nodes, index, add = self.nodes, self.index, self._add
+        todo = deque(range(len(nodes)))
+        dirs = deque()
+        while todo or dirs:
+            if todo:
+                i = todo.popleft()
+                if isinstance(nodes[i], SCons.Node.FS.Dir):
+                    # The children of a directory are the entries known
+                    # when it is scanned, so expand directories last.
+                    dirs.append(i)
+                    continue
+            else:
+                i = dirs.popleft()
+            kids = []
+            for child in nodes[i].children():
+                j = index.get(child)
+                if j is None:
+                    j = add(child)
+                    todo.append(j)
+                kids.append(j)
+            self.children[i] = list(dict.fromkeys(kids))
+
+    def _add(self, node) -> int:
+        j = self.index.get(node)
+        if j is None:
+            if isinstance(node, SCons.Node.FS.Entry):
+                # Entries know nothing about stored implicit deps (the
+                # node object stays the same, only its class changes).
+                node.disambiguate()
+            j = self.index[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.children.append(None)
+        return j
+
+    @property
+    def parents(self):
+        if self._parents is None:
+            parents = [[] for _ in self.nodes]
+            for i, kids in enumerate(self.children):
+                for j in kids:
+                    parents[j].append(i)
+            self._parents = parents
+        return self._parents
+
+    def reach(self, start, edges, depth=None) -> dict:
+        """Returns the node numbers reachable from *start* along *edges*.
+
+        The result is an insertion-ordered dict (used as an ordered set)
+        in breadth-first order, including *start* itself.
+        """
+        seen = dict.fromkeys(start)
+        level = list(seen)
+        while level and (depth is None or depth > 0):
+            following = []
+            for i in level:
+                for j in edges[i]:
+                    if j not in seen:
+                        seen[j] = None
+                        following.append(j)
+            level = following
+            if depth is not None:
+                depth -= 1
+        return seen
+
+    def deps(self, start, depth=None) -> dict:
+        return self.reach(start, self.children, depth)
+
+    def rdeps(self, start, depth=None) -> dict:
+        return self.reach(start, self.parents, depth)
+
+    def somepath(self, start, end) -> dict:
+        end = set(end)
+        previous = dict.fromkeys(start)
+        level = list(previous)
+        while level:
+            following = []
+            for i in level:
+                if i in end:
+                    path = []
+                    while i is not None:
+                        path.append(i)
+                        i = previous[i]
+                    return dict.fromkeys(reversed(path))
+                for j in self.children[i]:
+                    if j not in previous:
+                        previous[j] = i
+                        following.append(j)
+            level = following
+        return {}
+
+    def allpaths(self, start, end) -> dict:
+        reaching = self.rdeps(end)
+        return {i: None for i in self.deps(start) if i in reaching}
+
+
+def node_kind(node) -> str:
+    """Returns a description of the kind of *node* for ``kind()``.
+
+    For a derived node this is the name of its builder (if it has one;
+    builders made by Command() do not), ``"derived"`` and its class,
+    e.g. ``"Program derived file"`` or ``"derived file"``.  Other nodes
+    are ``"source"`` followed by their class, e.g. ``"source file"`` or
+    ``"source dir"``.
+    """
+    kind = node.__class__.__name__.lower()
+    if not node.has_builder():
+        return 'source ' + kind
+    name = node.get_builder().get_name(node.get_build_env())
+    if name.startswith('<'):
+        # an unnamed builder, get_name() gave its class
+        return 'derived ' + kind
+    return '%s derived %s' % (name, kind)
+
+
+_token_re = re.compile(r"""\s*(?:([(),])|"([^"]*)"|'([^']*)'|([^\s(),'"]+))""")
+
+
+def tokenize(expression):
+    """Splits a query into (kind, value) tuples.
+
+    The kinds are ``'('``, ``')'``, ``','``, ``'op'``, ``'word'`` and
+    ``'string'``.
+    """
+    tokens = []
+    pos = 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        m = _token_re.match(expression, pos)
+        if not m:
+            raise QueryError("query: syntax error at %r" % expression[pos:])
+        punct, dq, sq, word = m.groups()
+        if punct:
+            tokens.append((punct, punct))
+        elif word is None:
+            tokens.append(('string', dq if dq is not None else sq))
+        elif word in ('+', '-', '^'):
+            tokens.append(('op', word))
+        else:
+            tokens.append(('word', word))
+        pos = m.end()
+    return tokens
+
+
+class Query:
+    """Parses and evaluates query expressions against a DependencyGraph."""
+
+    functions = {
+        # name: argument types ('expr', 'int', 'pattern'), the number
+        # of required arguments
+        'deps': (('expr', 'int'), 1),
+        'rdeps': (('expr', 'int'), 1),
+        'somepath': (('expr', 'expr'), 2),
+        'allpaths': (('expr', 'expr'), 2),
+        'kind': (('pattern', 'expr'), 2),
+        'filter': (('pattern', 'expr'), 2),
+    }
+
+    def __init__(self, graph, fs) -> None:
+        self.graph = graph
+        self.fs = fs
+
+    def evaluate(self, expression):
+        """Returns the list of nodes matching the query *expression*."""
+        self.tokens = tokenize(expression)
+        self.pos = 0
+        if not self.tokens:
+            raise QueryError("query: empty query")
+        result = self._expression()
+        if self.pos < len(self.tokens):
+            raise QueryError("query: unexpected %r" % self.tokens[self.pos][1])
+        return [self.graph.nodes[i] for i in result]
+
+    def _next(self, expected=None):
+        try:
+            kind, value = self.tokens[self.pos]
+        except IndexError:
+            raise QueryError("query: unexpected end of query")
+        if expected and kind != expected:
+            raise QueryError("query: expected %r, found %r" % (expected, value))
+        self.pos += 1
+        return kind, value
+
+    def _peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][0]
+        return None
+
+    def _expression(self) -> dict:
+        result = self._term()
+        while self._peek() == 'op':
+            _, op = self._next()
+            other = self._term()
+            if op == '+':
+                result = {**result, **other}
+            elif op == '-':
+                result = {i: None for i in result if i not in other}
+            else:
+                result = {i: None for i in result if i in other}
+        return result
+
+    def _term(self) -> dict:
+        kind, value = self._next()
+        if kind == '(':
+            result = self._expression()
+            self._next(')')
+            return result
+        if kind == 'word' and self._peek() == '(' and value in self.functions:
+            return self._call(value)
+        if kind in ('word', 'string'):
+            return self._literal(value)
+        raise QueryError("query: unexpected %r" % value)
+
+    def _call(self, name) -> dict:
+        types, required = self.functions[name]
+        self._next('(')
+        args = []
+        for n, argtype in enumerate(types):
+            if n:
+                if self._peek() != ',':
+                    break
+                self._next(',')
+            if argtype == 'expr':
+                args.append(self._expression())
+            else:
+                _, value = self._next()
+                if argtype == 'int':
+                    try:
+                        value = int(value)
+                    except ValueError:
+                        raise QueryError("query: %s() depth must be an integer, not %r"
+                                         % (name, value))
+                args.append(value)
+        self._next(')')
+        if len(args) < required:
+            raise QueryError("query: %s() takes %d arguments" % (name, required))
+        return getattr(self, '_' + name)(*args)
+
+    def _deps(self, expr, depth=None) -> dict:
+        return self.graph.deps(expr, depth)
+
+    def _rdeps(self, expr, depth=None) -> dict:
+        return self.graph.rdeps(expr, depth)
+
+    def _somepath(self, start, end) -> dict:
+        return self.graph.somepath(start, end)
+
+    def _allpaths(self, start, end) -> dict:
+        return self.graph.allpaths(start, end)
+
+    def _kind(self, pattern, expr) -> dict:
+        match = re.compile(pattern).search
+        nodes = self.graph.nodes
+        return {i: None for i in expr if match(node_kind(nodes[i]))}
+
+    def _filter(self, pattern, expr) -> dict:
+        match = re.compile(pattern).search
+        nodes = self.graph.nodes
+        return {i: None for i in expr if match(str(nodes[i]))}
+
+    def _literal(self, name) -> dict:
+        if name.startswith('//'):
+            name = '#' + name[2:]
+        graph = self.graph
+        if any(c in name for c in '*?['):
+            pattern = name[1:].lstrip('/') if name.startswith('#') else name
+            return {i: None for i, node in enumerate(graph.nodes)
+                    if fnmatch.fnmatchcase(str(node), pattern)}
+        try:
+            node = self.fs.Entry(name, create=False)
+        except (SCons.Errors.UserError, TypeError):
+            node = None
+        i = graph.index.get(node) if node is not None else None
+        if i is None:
+            raise QueryError("query: %r is not in the dependency graph" % name)
+        return {i: None}
+
+
+def project_nodes(fs):
+    """Returns the nodes known below the top directory, and all aliases.
+
+    These are the nodes the SConscript files have set up, which is the
+    default scope of a query.
+    """
+    nodes = []
+    dirs = deque([fs.Top])
+    while dirs:
+        directory = dirs.popleft()
+        nodes.append(directory)
+        for name, entry in sorted(directory.entries.items()):
+            if name in ('.', '..'):
+                continue
+            if isinstance(entry, SCons.Node.FS.Entry):
+                entry = entry.disambiguate()
+            if isinstance(entry, SCons.Node.FS.Dir):
+                dirs.append(entry)
+            else:
+                nodes.append(entry)
+    aliases = SCons.Node.Alias.default_ans
+    nodes.extend(aliases[name] for name in sorted(aliases))
+    return nodes
+
+
+def query(fs, expression, roots=None):
+    """Evaluates *expression* over the graph below *roots*.
+
+    Without *roots*, the graph below all the :func:`project_nodes` is
+    used.
+
+    Stored implicit dependencies are used as if ``--implicit-cache``
+    and ``--implicit-deps-unchanged`` were given, unless
+    ``--implicit-deps-changed`` was, so only nodes with no stored
+    information are scanned.
+
+    Returns the list of matching nodes.
+    """
+    if not SCons.Node.implicit_deps_changed:
+        SCons.Node.implicit_cache = True
+        SCons.Node.implicit_deps_unchanged = True
+    if not roots:
+        roots = project_nodes(fs)
+    graph = DependencyGraph(roots)
+    return Query(graph, fs).evaluate(expression)
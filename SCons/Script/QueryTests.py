@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+
+import SCons.Errors
+from SCons.Script.Query import DependencyGraph, Query, QueryError, tokenize
+
+
+class FakeNode:
+    def __init__(self, name, children=()) -> None:
+        self.name = name
+        self.kids = list(children)
+
+    def children(self):
+        return self.kids
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class FakeFS:
+    def __init__(self, nodes) -> None:
+        self.nodes = {n.name: n for n in nodes}
+
+    def Entry(self, name, create=True):
+        try:
+            return self.nodes[name.lstrip('#')]
+        except KeyError:
+            raise SCons.Errors.UserError("no such node")
+
+
+def make_graph():
+    """prog -> (a.o -> (a.c, x.h), b.o -> (b.c, x.h, y.h))"""
+    x = FakeNode('x.h')
+    y = FakeNode('y.h')
+    a_c = FakeNode('a.c')
+    b_c = FakeNode('b.c')
+    a_o = FakeNode('a.o', [a_c, x])
+    b_o = FakeNode('b.o', [b_c, x, y, x])
+    prog = FakeNode('prog', [a_o, b_o])
+    nodes = [prog, a_o, b_o, a_c, b_c, x, y]
+    return DependencyGraph([prog]), FakeFS(nodes)
+
+
+class QueryTestCase(unittest.TestCase):
+
+    def query(self, expression):
+        graph, fs = make_graph()
+        return [str(n) for n in Query(graph, fs).evaluate(expression)]
+
+    def test_tokenize(self) -> None:
+        """Test splitting queries into tokens"""
+        self.assertEqual(tokenize("kind('a b', deps(//x-y.h)) - z"), [
+            ('word', 'kind'), ('(', '('), ('string', 'a b'), (',', ','),
+            ('word', 'deps'), ('(', '('), ('word', '//x-y.h'), (')', ')'),
+            (')', ')'), ('op', '-'), ('word', 'z'),
+        ])
+
+    def test_graph(self) -> None:
+        """Test the graph and its reverse index"""
+        graph, _ = make_graph()
+        self.assertEqual([str(n) for n in graph.nodes],
+                         ['prog', 'a.o', 'b.o', 'a.c', 'x.h', 'b.c', 'y.h'])
+        self.assertEqual(graph.children[2], [5, 4, 6])
+        self.assertEqual(graph.parents[4], [1, 2])
+
+    def test_functions(self) -> None:
+        """Test the query functions"""
+        self.assertEqual(self.query('deps(a.o)'), ['a.o', 'a.c', 'x.h'])
+        self.assertEqual(self.query('deps(prog, 1)'), ['prog', 'a.o', 'b.o'])
+        self.assertEqual(self.query('rdeps(x.h)'), ['x.h', 'a.o', 'b.o', 'prog'])
+        self.assertEqual(self.query('rdeps(x.h, 1)'), ['x.h', 'a.o', 'b.o'])
+        self.assertEqual(self.query('somepath(prog, y.h)'), ['prog', 'b.o', 'y.h'])
+        self.assertEqual(self.query('somepath(a.o, y.h)'), [])
+        self.assertEqual(self.query('allpaths(prog, x.h)'),
+                         ['prog', 'a.o', 'b.o', 'x.h'])
+        self.assertEqual(self.query('filter("\\.h$", deps(prog))'), ['x.h', 'y.h'])
+        self.assertEqual(self.query('*.c'), ['a.c', 'b.c'])
+
+    def test_operators(self) -> None:
+        """Test the set operators"""
+        self.assertEqual(self.query('deps(a.o) + deps(b.o)'),
+                         ['a.o', 'a.c', 'x.h', 'b.o', 'b.c', 'y.h'])
+        self.assertEqual(self.query('deps(a.o) ^ deps(b.o)'), ['x.h'])
+        self.assertEqual(self.query('deps(prog) - deps(b.o) - prog'), ['a.o', 'a.c'])
+        self.assertEqual(self.query('deps(prog) - (deps(b.o) - x.h)'),
+                         ['prog', 'a.o', 'a.c', 'x.h'])
+
+    def test_errors(self) -> None:
+        """Test malformed queries"""
+        for expression in ['', 'deps(', 'deps(prog', 'deps(prog, x)',
+                           'somepath(prog)', 'prog )', 'nonesuch', '+']:
+            with self.assertRaises(QueryError, msg=expression):
+                self.query(expression)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -125,10 +125,13 @@ class SConsValues(optparse.Values):
     # keep this list in sync with the SetOption doc in SCons/Script/Main.xml
     # search for UPDATE_SETOPTION_DOCS there.
     settable = [
+        'checkpoint_interval',
+        'checkpoint_tasks',
         'clean',
         'diskcheck',
         'duplicate',
         'experimental',
+        'glob_cache',
         'hash_chunksize',
         'hash_format',
         'help',
@@ -172,6 +175,14 @@ class SConsValues(optparse.Values):
                     raise ValueError
             except ValueError:
                 raise SCons.Errors.UserError("A positive integer is required: %s" % repr(value))
+        elif name in ('checkpoint_interval', 'checkpoint_tasks'):
+            try:
+                value = int(value)
+                if value < 0:
+                    raise ValueError
+            except ValueError:
+                raise SCons.Errors.UserError(
+                    "A non-negative integer is required: %s" % repr(value))
         elif name == 'max_drift':
             try:
                 value = int(value)
@@ -229,6 +240,9 @@ class SConsValues(optparse.Values):
         elif name in ('implicit_deps_changed', 'implicit_deps_unchanged'):
             if value:
                 self.__SConscript_settings__['implicit_cache'] = True
+        elif name == 'glob_cache':
+            if value:
+                SCons.Node.FS.get_default_fs().enable_glob_cache()
 
         self.__SConscript_settings__[name] = value
 
@@ -780,6 +794,28 @@ def Parser(version):
                   action="store_true",
                   help="Print build actions for files from CacheDir")
 
+    op.add_option('--changed-files',
+                  nargs=1, type="string",
+                  dest="changed_files", default=None,
+                  action="store",
+                  help="Build only the targets affected by the files "
+                       "listed in FILE",
+                  metavar="FILE")
+
+    op.add_option('--checkpoint-interval',
+                  nargs=1, type="int",
+                  dest="checkpoint_interval", default=0,
+                  action="store",
+                  help="Save the signatures of built targets every N seconds",
+                  metavar="N")
+
+    op.add_option('--checkpoint-tasks',
+                  nargs=1, type="int",
+                  dest="checkpoint_tasks", default=0,
+                  action="store",
+                  help="Save the signatures of built targets every N tasks",
+                  metavar="N")
+
     def opt_invalid(group, value, options):
         """report an invalid option from a group"""
         errmsg = "`%s' is not a valid %s option type, try:\n" % (value, group)
@@ -819,7 +855,8 @@ def Parser(version):
     debug_options = ["count", "duplicate", "explain", "findlibs",
                      "includes", "memoizer", "memory", "objects",
                      "pdb", "prepare", "presub", "stacktrace",
-                     "time", "action-timestamps", "json", "sconscript"]
+                     "time", "action-timestamps", "json", "sconscript",
+                     "trace"]
 
     def opt_debug(option, opt, value__, parser,
                   debug_options=debug_options,
@@ -931,6 +968,11 @@ def Parser(version):
                   action="append",
                   help="Read FILE as the top-level SConstruct file")
 
+    op.add_option('--glob-cache',
+                  dest='glob_cache', default=False,
+                  action="store_true",
+                  help="Cache directory listings for Glob between runs")
+
     op.add_option('-h', '--help',
                   dest="help", default=False,
                   action="store_true",
@@ -1048,6 +1090,14 @@ def Parser(version):
                   action="store_true",
                   help="Suppress \"Reading/Building\" progress messages")
 
+    op.add_option('--query',
+                  nargs=1, type="string",
+                  dest="query", default=None,
+                  action="store",
+                  help="Don't build; print the nodes matching a "
+                       "dependency graph query",
+                  metavar="EXPRESSION")
+
     op.add_option('--random',
                   dest="random", default=False,
                   action="store_true",
@@ -1079,7 +1129,7 @@ def Parser(version):
                   help="Trace Node evaluation to FILE",
                   metavar="FILE")
 
-    tree_options = ["all", "derived", "prune", "status", "linedraw"]
+    tree_options = ["all", "derived", "prune", "status", "linedraw", "ids", "json", "dot"]
 
     def opt_tree(option, opt, value, parser, tree_options=tree_options):
         tp = Main.TreePrinter()
@@ -1094,6 +1144,10 @@ def Parser(version):
                 tp.status = True
             elif o == 'linedraw':
                 tp.sLineDraw = True
+            elif o == 'ids':
+                tp.ids = True
+            elif o in ('json', 'dot'):
+                tp.format = o
             else:
                 raise OptionValueError(opt_invalid('--tree', o, tree_options))
         parser.values.tree_printers.append(tp)
@@ -38,6 +38,7 @@ import SCons.Platform
 import SCons.SConf
 import SCons.Tool
 from SCons.Util import is_List, is_String, is_Dict, flatten
+from SCons.Util.stats import trace_stats
 from SCons.Node import Node, SConscriptNodes
 from SCons.Node.FS import FS, FileNode
 from . import Main
@@ -177,6 +178,18 @@ def handle_missing_SConscript(f: FileNode, must_exist: bool = True) -> None:
     raise SCons.Errors.UserError(msg)
 
 
+def finish_reading() -> None:
+    """Clean up after all SConscript files have been read.
+
+    Writes out the Glob cache, if in use.
+
+    .. versionadded:: 4.12.0
+    """
+    glob_cache = SCons.Node.FS.get_default_fs().glob_cache
+    if glob_cache is not None:
+        glob_cache.write()
+
+
 def _SConscript(fs: FS, *files: str | Node, **kw) -> Any | list[Any]:
     top = fs.Top
     sd = fs.SConstruct_dir.rdir()
@@ -276,14 +289,15 @@ def _SConscript(fs: FS, *files: str | Node, **kw) -> Any | list[Any]:
                         try:
                             if Main.print_time:
                                 start_time = time.perf_counter()
-                            scriptdata = _file_.read()
-                            scriptname = _file_.name
-                            _file_.close()
-                            if SCons.Debug.sconscript_trace:
-                                print("scons: Entering "+str(scriptname))
-                            exec(compile(scriptdata, scriptname, 'exec'), call_stack[-1].globals)
-                            if SCons.Debug.sconscript_trace:
-                                print("scons: Exiting "+str(scriptname))
+                            with trace_stats.span('sconscript', f.get_internal_path()):
+                                scriptdata = _file_.read()
+                                scriptname = _file_.name
+                                _file_.close()
+                                if SCons.Debug.sconscript_trace:
+                                    print("scons: Entering "+str(scriptname))
+                                exec(compile(scriptdata, scriptname, 'exec'), call_stack[-1].globals)
+                                if SCons.Debug.sconscript_trace:
+                                    print("scons: Exiting "+str(scriptname))
                         except SConscriptReturn:
                             if SCons.Debug.sconscript_trace:
                                 print("scons: Exiting "+str(scriptname))
@@ -702,8 +716,12 @@ def BuildDefaultGlobals():
         import SCons.Script
         d = SCons.Script.__dict__
         def not_a_module(m, d=d, mtype=type(SCons.Script)) -> bool:
-             return not isinstance(d[m], mtype)
+             return m in d and not isinstance(d[m], mtype)
         for m in filter(not_a_module, dir(SCons.Script)):
              GlobalDict[m] = d[m]
+        # The SConscript globals must be a real dict, so names
+        # SCons.Script imports on first use are resolved here.
+        for m in SCons.Script._lazy_attributes:
+             GlobalDict[m] = getattr(SCons.Script, m)
 
     return GlobalDict.copy()
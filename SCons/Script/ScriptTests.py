@@ -171,5 +171,36 @@ class TestScriptFunctions(unittest.TestCase):
         self.assertEqual(COMMAND_LINE_TARGETS, ['target1'])
 
 
+class TestLazyAttributes(unittest.TestCase):
+    def test_lazy_attribute(self):
+        import SCons.Script
+        import SCons.Variables
+
+        self.assertIn('PathVariable', dir(SCons.Script))
+        self.assertIs(SCons.Script.PathVariable, SCons.Variables.PathVariable)
+        with self.assertRaises(AttributeError):
+            SCons.Script.NoSuchAttribute  # noqa: B018
+
+    def test_lazy_global(self):
+        import SCons.Script
+        import SCons.Variables
+        from SCons.Script.SConscript import BuildDefaultGlobals
+
+        g = BuildDefaultGlobals()
+        for name in SCons.Script._lazy_attributes:
+            self.assertIs(g[name], getattr(SCons.Variables, name))
+
+    def test_import_star(self):
+        import SCons.Variables
+
+        ns = {}
+        exec('from SCons.Script import *', ns)
+        for name in ('BoolVariable', 'EnumVariable', 'ListVariable',
+                     'PackageVariable', 'PathVariable'):
+            self.assertIs(ns[name], getattr(SCons.Variables, name))
+        self.assertIn('Environment', ns)
+        self.assertNotIn('_lazy_attributes', ns)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -33,6 +33,7 @@ it goes here.
 from __future__ import annotations
 
 import collections
+import importlib as _importlib
 import itertools
 import os
 import sys
@@ -88,7 +89,6 @@ import SCons.SConf
 import SCons.Subst
 import SCons.Tool
 import SCons.Util
-import SCons.Variables
 import SCons.Defaults
 
 from . import Main
@@ -155,12 +155,41 @@ Scanner                 = SCons.Scanner.ScannerBase
 Tool                    = SCons.Tool.Tool
 WhereIs                 = SCons.Util.WhereIs
 
-#
-BoolVariable            = SCons.Variables.BoolVariable
-EnumVariable            = SCons.Variables.EnumVariable
-ListVariable            = SCons.Variables.ListVariable
-PackageVariable         = SCons.Variables.PackageVariable
-PathVariable            = SCons.Variables.PathVariable
+# Rarely used subsystems are imported on first access of one of
+# their names, see __getattr__ below, so every scons invocation
+# doesn't pay for them.  Maps the public name to (module, attribute).
+_lazy_attributes = {
+    'BoolVariable': ('SCons.Variables', 'BoolVariable'),
+    'EnumVariable': ('SCons.Variables', 'EnumVariable'),
+    'ListVariable': ('SCons.Variables', 'ListVariable'),
+    'PackageVariable': ('SCons.Variables', 'PackageVariable'),
+    'PathVariable': ('SCons.Variables', 'PathVariable'),
+}
+
+
+def __getattr__(name: str):
+    """Resolve a lazily imported name on first access.
+
+    ``__all__`` is computed here too, so ``from SCons.Script import *``
+    still provides the lazily imported names, along with every other
+    public name the module has at that point.
+
+    .. versionadded:: 4.12.0
+    """
+    if name == '__all__':
+        public = [n for n in globals() if not n.startswith('_')]
+        return sorted(set(public) | set(_lazy_attributes))
+    try:
+        module, attr = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
 
 
 # Action factories.
@@ -349,6 +378,7 @@ def set_missing_sconscript_error(flag: bool = True) -> bool:
 
 
 def Variables(files=None, args=ARGUMENTS):
+    import SCons.Variables  # pylint: disable=import-outside-toplevel
     return SCons.Variables.Variables(files, args)
 
 
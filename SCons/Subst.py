@@ -28,7 +28,6 @@ from __future__ import annotations
 import re
 from collections import UserList, UserString
 from functools import lru_cache
-from inspect import Parameter, signature
 from typing import Callable
 
 import SCons.Errors
@@ -377,6 +376,9 @@ def _check_callable_subst_args(s) -> bool:
     parameters must have default values (which also allows
     functools.partial objects to work).
     """
+    # inspect is costly to import, defer it until a callable is seen
+    from inspect import Parameter, signature  # pylint: disable=import-outside-toplevel
+
     try:
         params = signature(s).parameters.items()
     except (ValueError, TypeError):
@@ -56,6 +56,7 @@ import SCons.Errors
 import SCons.Node
 import SCons.Warnings
 from SCons.Util import DispatchingFormatter
+from SCons.Util.stats import trace_stats
 
 StateString = SCons.Node.StateString
 NODE_NO_STATE = SCons.Node.no_state
@@ -243,7 +244,8 @@ class Task(ABC):
                     except OSError as e:
                         SCons.Warnings.warn(SCons.Warnings.CacheCleanupErrorWarning,
                             "Failed copying all target files from cache, Error while attempting to remove file %s retrieved from cache: %s" % (t.get_internal_path(), e))
-                self.targets[0].build()
+                with trace_stats.span('execute', 'build', self.targets[0]):
+                    self.targets[0].build()
                 for t in self.targets:
                     t.push_to_cache()
             else:
@@ -301,7 +303,8 @@ class Task(ABC):
                 for side_effect in t.side_effects:
                     side_effect.set_state(NODE_NO_STATE)
                 t.set_state(NODE_EXECUTED)
-                t.built()
+                with trace_stats.span('signature', 'built', t):
+                    t.built()
                 t.visited()
                 if (not print_prepare and
                     (not hasattr(self, 'options') or not self.options.debug_includes)):
@@ -880,7 +883,8 @@ class Taskmaster:
             executor = node.get_executor()
 
             try:
-                children = executor.get_all_children()
+                with trace_stats.span('scan', 'children', node):
+                    children = executor.get_all_children()
             except SystemExit:
                 exc_value = sys.exc_info()[1]
                 e = SCons.Errors.ExplicitExit(node, exc_value.code)
@@ -1019,7 +1023,8 @@ class Taskmaster:
         This simply asks for the next Node to be evaluated, and then wraps
         it in the specific Task subclass with which we were initialized.
         """
-        node = self._find_next_ready_node()
+        with trace_stats.span('taskmaster', 'find next ready node'):
+            node = self._find_next_ready_node()
 
         if node is None:
             return None
@@ -1032,7 +1037,8 @@ class Taskmaster:
 
         task = self.tasker(self, tlist, node in self.original_top, node)
         try:
-            task.make_ready()
+            with trace_stats.span('signature', 'make ready', node):
+                task.make_ready()
         except Exception as e :
             # We had a problem just trying to get this task ready (like
             # a child couldn't be linked to a VariantDir when deciding
@@ -26,7 +26,6 @@
 
 from __future__ import annotations
 
-import re
 import os.path
 
 import SCons.Scanner.Fortran
@@ -59,6 +58,11 @@ def isfortran(env, source) -> bool:
     return False
 
 
+# Used by the emitter to find the modules a source defines, with the
+# same regexes (and so the same cached results) as the Fortran scanners.
+_module_parser = SCons.Scanner.Fortran.FortranScan()
+
+
 def _fortranEmitter(target, source, env) -> tuple:
     """Common code for Fortran emitter.
 
@@ -70,11 +74,8 @@ def _fortranEmitter(target, source, env) -> tuple:
         print("Could not locate " + str(node.name))
         return [], []
 
-    # This has to match the def_regex in the Fortran scanner
-    mod_regex = r"""(?i)^\s*MODULE\s+(?!PROCEDURE|SUBROUTINE|FUNCTION|PURE|ELEMENTAL)(\w+)"""
-    cre = re.compile(mod_regex, re.M)
-    # Retrieve all USE'd module names
-    modules = cre.findall(node.get_text_contents())
+    # Retrieve all defined module names
+    modules = _module_parser.parse(node)[2]
     # Remove unique items from the list
     modules = SCons.Util.unique(modules)
     # Convert module name to a .mod filename
@@ -82,7 +83,9 @@ def _fortranEmitter(target, source, env) -> tuple:
     moddir = env.subst('$FORTRANMODDIR', target=target, source=source)
     modules = [mod.lower() + suffix for mod in modules]
     for module in modules:
-        target.append(env.fs.File(module, moddir))
+        module = env.fs.File(module, moddir)
+        SCons.Scanner.Fortran.add_module_producer(module)
+        target.append(module)
     return target, source
 
 
@@ -31,6 +31,7 @@ import re
 import glob
 from pathlib import Path
 
+import SCons.Action
 import SCons.Util
 
 java_parsing = True
@@ -491,6 +492,51 @@ else:
         return os.path.split(fn)
 
 
+def java_batch_key(action, env, target, source):
+    """Return a key to identify batches of Java sources to compile together.
+
+    If batching is enabled (via the ``$JAVAC_BATCH`` setting), all
+    target+source pairs that use the same action, defined by the same
+    environment (and so the same class path and flags), with the same
+    class output directory and source directory, will be batched into
+    one javac invocation.
+
+    Returning None specifies that the specified target+source should not
+    be batched with other compilations.
+    """
+    if 'JAVAC_BATCH' not in env or env.subst('$JAVAC_BATCH') in ('0', 'False', '', None):
+        return None
+    attributes = target[0].attributes
+    classdir = getattr(attributes, 'java_classdir', None)
+    sourcedir = getattr(attributes, 'java_sourcedir', None)
+    if classdir is None or sourcedir is None:
+        return None
+    return (id(action), id(env), classdir, sourcedir)
+
+
+# Shared by all JavaClassFile Builders, so that Builders created for
+# different environments still compare equal.
+JavaClassFileAction = SCons.Action.Action('$JAVACCOM', '$JAVACCOMSTR',
+                                          batch_key=java_batch_key,
+                                          targets='$CHANGED_TARGETS')
+
+
+def java_batch_sources(target, source, env, for_signature) -> str:
+    """Return the sources to pass to javac.
+
+    When several JavaClassFile calls have been batched together (see
+    :func:`java_batch_key`), only the sources whose class files are out
+    of date are compiled; the others are found through the source path.
+    """
+    try:
+        batches = target[0].get_executor().batches
+    except (AttributeError, IndexError):
+        return '$SOURCES'
+    if len(batches) > 1:
+        return '$CHANGED_SOURCES'
+    return '$SOURCES'
+
+
 def get_java_install_dirs(platform, version=None) -> list[str]:
     """ Find possible java jdk installation directories.
 
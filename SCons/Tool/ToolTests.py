@@ -23,6 +23,7 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import os
+import sys
 import unittest
 
 import TestUnit
@@ -141,6 +142,65 @@ class ToolTestCase(unittest.TestCase):
         _ = SCons.Tool.find_program_path(env, 'no_tool', default_paths=PHONY_PATHS, add_path=True)
         assert env.PHONY_PATH in env['ENV']['PATH'], env['ENV']['PATH']
 
+    @unittest.skipIf(sys.platform == 'win32', "uses a POSIX executable script")
+    def test_cached_tool_probe(self) -> None:
+        """Test caching of tool probe results"""
+        import tempfile
+
+        env = DummyEnvironment()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            prog = os.path.join(tmpdir, 'fakecc')
+            with open(prog, 'w') as f:
+                f.write('#!/bin/sh\n')
+            os.chmod(prog, 0o755)
+            env['ENV'] = {'PATH': tmpdir}
+            calls = []
+
+            def probe():
+                calls.append(1)
+                return '1.2.3'
+
+            save_cache = SCons.Tool._tool_probe_cache
+            save_file = SCons.Tool.TOOL_CONFIG_CACHE
+            try:
+                SCons.Tool._tool_probe_cache = None
+                SCons.Tool.TOOL_CONFIG_CACHE = os.path.join(tmpdir, 'cache.json')
+
+                r = SCons.Tool.cached_tool_probe(env, 'fake', 'fakecc', probe)
+                assert r == '1.2.3', r
+                r = SCons.Tool.cached_tool_probe(env, 'fake', 'fakecc', probe)
+                assert r == '1.2.3', r
+                assert len(calls) == 1, calls
+
+                # a different probe name or command is a different entry
+                SCons.Tool.cached_tool_probe(env, 'other', 'fakecc', probe)
+                SCons.Tool.cached_tool_probe(env, 'fake', 'fakecc -m32', probe)
+                assert len(calls) == 3, calls
+
+                # a fresh run replays from the persisted cache,
+                # which is written once, at exit
+                assert not os.path.exists(SCons.Tool.TOOL_CONFIG_CACHE)
+                SCons.Tool._write_tool_probe_cache()
+                assert not SCons.Tool._tool_probe_pending
+                SCons.Tool._tool_probe_cache = None
+                SCons.Tool.cached_tool_probe(env, 'fake', 'fakecc', probe)
+                assert len(calls) == 3, calls
+
+                # an updated program is probed again
+                st = os.stat(prog)
+                os.utime(prog, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+                SCons.Tool.cached_tool_probe(env, 'fake', 'fakecc', probe)
+                assert len(calls) == 4, calls
+
+                # a program not found is not cached
+                SCons.Tool.cached_tool_probe(env, 'fake', 'nosuchcc', probe)
+                SCons.Tool.cached_tool_probe(env, 'fake', 'nosuchcc', probe)
+                assert len(calls) == 6, calls
+            finally:
+                SCons.Tool._tool_probe_cache = save_cache
+                SCons.Tool._tool_probe_pending.clear()
+                SCons.Tool.TOOL_CONFIG_CACHE = save_file
+
 
 if __name__ == "__main__":
     loader = unittest.TestLoader()
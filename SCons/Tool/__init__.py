@@ -51,9 +51,11 @@ without needing to integrate with this subsystem.
 
 from __future__ import annotations
 
+import atexit
 import sys
 import os
 import importlib.util
+import json
 
 import SCons.Action
 import SCons.Builder
@@ -562,9 +564,9 @@ def CreateJavaClassFileBuilder(env):
     try:
         java_class_file = env['BUILDERS']['JavaClassFile']
     except KeyError:
+        from SCons.Tool.JavaCommon import JavaClassFileAction  # pylint: disable=import-outside-toplevel
         fs = SCons.Node.FS.get_default_fs()
-        javac_com = SCons.Action.Action('$JAVACCOM', '$JAVACCOMSTR')
-        java_class_file = SCons.Builder.Builder(action=javac_com,
+        java_class_file = SCons.Builder.Builder(action=JavaClassFileAction,
                                                 emitter={},
                                                 # suffix = '$JAVACLASSSUFFIX',
                                                 src_suffix='$JAVASUFFIX',
@@ -945,3 +947,123 @@ def find_program_path(env, key_program, default_paths=None, add_path: bool=False
         env.AppendENVPath('PATH', os.path.dirname(path))
 
     return path
+
+
+# SCONS_CACHE_TOOL_CONFIG is public, and is documented.
+TOOL_CONFIG_CACHE = os.environ.get('SCONS_CACHE_TOOL_CONFIG', '')
+if TOOL_CONFIG_CACHE in ('1', 'true', 'True'):
+    TOOL_CONFIG_CACHE = os.path.join(os.path.expanduser('~'), 'scons_tool_cache.json')
+
+# Results of tool detection probes, see cached_tool_probe().
+# None means the persisted cache (if any) has not been read yet.
+_tool_probe_cache: dict | None = None
+# Entries probed in this run, not yet written to TOOL_CONFIG_CACHE.
+_tool_probe_pending: dict = {}
+
+
+def _load_tool_probe_cache() -> dict:
+    """Return the entries of the tool probe cache file, if any."""
+    try:
+        with open(TOOL_CONFIG_CACHE) as f:
+            entries = json.load(f)
+        return {tuple(d['key']): d['data'] for d in entries}
+    except (OSError, ValueError, TypeError, KeyError):
+        # missing, corrupt or incompatible: proceed without it,
+        # the next write replaces it.
+        return {}
+
+
+def _read_tool_probe_cache() -> dict:
+    """Fetch the persisted tool probe results, if requested."""
+    if not TOOL_CONFIG_CACHE:
+        return {}
+    try:
+        with SCons.Util.FileLock(TOOL_CONFIG_CACHE, timeout=5, writer=False):
+            return _load_tool_probe_cache()
+    except SCons.Util.SConsLockFailure:
+        return {}
+
+
+def _write_tool_probe_cache() -> None:
+    """Write out the tool probe results of this run, if any.
+
+    Registered to run at exit on the first cache miss, so the file is
+    rewritten once per run rather than once per probe.
+    """
+    if not TOOL_CONFIG_CACHE or not _tool_probe_pending:
+        return
+    try:
+        with SCons.Util.FileLock(TOOL_CONFIG_CACHE, timeout=5, writer=True):
+            # Merge in entries written by other scons processes since
+            # we read the file, so parallel invocations don't lose work.
+            merged = _load_tool_probe_cache()
+            merged.update(_tool_probe_pending)
+            entries = [{'key': list(k), 'data': v} for k, v in merged.items()]
+            with open(TOOL_CONFIG_CACHE, 'w') as f:
+                json.dump(entries, f, indent=2)
+        _tool_probe_pending.clear()
+    except (OSError, TypeError, SCons.Util.SConsLockFailure):
+        # can't write the file, or data not serializable: skip
+        pass
+
+
+def cached_tool_probe(env, name: str, command, probe):
+    """Return the result of a tool detection probe, using a cache.
+
+    Tool modules often run the program they configure to learn about it
+    (``gcc --version``, ``clang -dumpversion``), and do so from both
+    ``exists()`` and ``generate()``. Such probes are the bulk of the
+    time taken to create a default :class:`~SCons.Environment.Environment`.
+
+    The result of calling *probe* is cached keyed by *name*, the expanded
+    *command*, the execution ``PATH`` and the location and modification
+    time of the program found on it, so a different or updated program
+    is probed again. The cache lives for the duration of the run; if the
+    ``SCONS_CACHE_TOOL_CONFIG`` environment variable is set, it is also
+    persisted (written once, when SCons exits) so later runs can skip
+    the probe entirely.
+
+    If the program cannot be found, *probe* is called without caching.
+
+    Args:
+        env: Current Construction Environment.
+        name: identifies the probe, usually the tool module name.
+        command: command line of the probe, whose first word names the
+           program being probed.
+        probe: callable taking no arguments which returns a JSON
+           serializable result.
+
+    .. versionadded:: 4.12.0
+    """
+    global _tool_probe_cache
+    command = SCons.Util.CLVar(env.subst(command))
+    if not command:
+        return probe()
+    try:
+        path = env['ENV']['PATH']
+    except KeyError:
+        path = None
+    if SCons.Util.is_List(path):
+        path = os.pathsep.join(path)
+    prog = SCons.Util.WhereIs(command[0], path)
+    if not prog:
+        return probe()
+    try:
+        mtime = os.stat(prog).st_mtime_ns
+    except OSError:
+        return probe()
+
+    if _tool_probe_cache is None:
+        _tool_probe_cache = _read_tool_probe_cache()
+    key = (name, ' '.join(map(str, command)), path or '', prog, mtime)
+    try:
+        return _tool_probe_cache[key]
+    except KeyError:
+        pass
+    result = probe()
+    _tool_probe_cache[key] = result
+    if TOOL_CONFIG_CACHE:
+        if not _tool_probe_pending:
+            atexit.register(_write_tool_probe_cache)
+        _tool_probe_pending[key] = result
+    return result
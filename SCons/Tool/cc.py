@@ -31,6 +31,9 @@ It will usually be imported through the generic SCons.Tool.Tool()
 selection method.
 """
 
+import os
+
+import SCons.Action
 import SCons.Tool
 import SCons.Defaults
 import SCons.Util
@@ -39,6 +42,106 @@ CSuffixes = ['.c', '.m']
 if not SCons.Util.case_sensitive_suffixes('.c', '.C'):
     CSuffixes.append('.C')
 
+def cc_batch_key(action, env, target, source):
+    """
+    Returns a key to identify unique batches of sources for compilation.
+
+    If batching is enabled (via the $CC_BATCH setting), then all
+    target+source pairs that use the same action, defined by the same
+    environment, with the same target directory and source suffix,
+    will be batched.
+
+    A compiler given several sources with -c, and no -o, writes each
+    object file to the current directory, named after its source with a
+    .o suffix, so only targets named that way can be batched.
+
+    Returning None specifies that the specified target+source should not
+    be batched with other compilations.
+    """
+    if 'CC_BATCH' not in env or env.subst('$CC_BATCH') in ('0', 'False', '', None):
+        return None
+    t = target[0]
+    s = source[0]
+    base, ext = os.path.splitext(s.name)
+    if t.name != base + '.o':
+        return None
+    return (id(action), id(env), t.dir, ext)
+
+def _batch_action(action, batchcom, comstr):
+    """Return an Action which compiles in batches when $CC_BATCH is set.
+
+    The batched command runs in the target directory, so it passes the
+    sources and the CPPPATH directories as absolute paths, and only the
+    out-of-date sources (via $CHANGED_SOURCES).  Otherwise *action*,
+    the usual per-object command, is used.
+    """
+    batch = SCons.Action.Action(batchcom, comstr,
+                                batch_key=cc_batch_key,
+                                targets='$CHANGED_TARGETS')
+    def generator(target, source, env, for_signature):
+        if target and source and cc_batch_key(batch, env, target, source):
+            return batch
+        return action
+    return SCons.Action.Action(generator, generator=1)
+
+_RDirs = SCons.Defaults.Variable_Method_Caller('TARGET', 'RDirs')
+
+def _batch_dirs(dirs):
+    """Return the absolute paths of *dirs*, and their repository copies."""
+    return [d.get_abspath() for d in _RDirs(dirs)]
+
+def _batch_sources(target, source, env, for_signature):
+    """Return the absolute paths of the out-of-date sources of a batch.
+
+    This is ``${CHANGED_SOURCES.abspath}``, looked up through the
+    executor because $TEMPFILE expands its command without one.
+    """
+    if for_signature:
+        return ''
+    try:
+        changed = target[0].get_executor().get_lvars()['CHANGED_SOURCES']
+    except (AttributeError, IndexError):
+        changed = source
+    return [s.rfile().get_abspath() for s in changed]
+
+CBatchAction = _batch_action(SCons.Defaults.CAction, '$_CCBATCHCOM', '$CCCOMSTR')
+ShCBatchAction = _batch_action(SCons.Defaults.ShCAction, '$_SHCCBATCHCOM', '$SHCCCOMSTR')
+CXXBatchAction = _batch_action(SCons.Defaults.CXXAction, '$_CXXBATCHCOM', '$CXXCOMSTR')
+ShCXXBatchAction = _batch_action(SCons.Defaults.ShCXXAction, '$_SHCXXBATCHCOM', '$SHCXXCOMSTR')
+
+def add_batch_actions(env, suffixes, cplusplus: bool = False) -> None:
+    """
+    Let the object Builders compile *suffixes* sources in batches,
+    for compilers which accept several sources with -c (see $CC_BATCH).
+
+    .. versionadded:: 4.12.0
+    """
+    static_obj, shared_obj = SCons.Tool.createObjBuilders(env)
+    for suffix in suffixes:
+        if cplusplus:
+            static_obj.add_action(suffix, CXXBatchAction)
+            shared_obj.add_action(suffix, ShCXXBatchAction)
+        else:
+            static_obj.add_action(suffix, CBatchAction)
+            shared_obj.add_action(suffix, ShCBatchAction)
+
+    cd = 'cd /d' if env['PLATFORM'] == 'win32' else 'cd'
+    env['_CCBATCHDIRS'] = _batch_dirs
+    env['_CCBATCHINCFLAGS'] = '${_concat(INCPREFIX, CPPPATH, INCSUFFIX, __env__, _CCBATCHDIRS, TARGET, SOURCE, affect_signature=False)}'
+    env['_CCBATCHCOMCOM'] = '$CPPFLAGS $_CPPDEFFLAGS $_CCBATCHINCFLAGS'
+    env['_CCBATCHSOURCES'] = _batch_sources
+    for var, compiler, flags, comstr in (
+        ('_CCBATCHCOM', '$CC', '$CFLAGS $CCFLAGS', '$CCCOMSTR'),
+        ('_SHCCBATCHCOM', '$SHCC', '$SHCFLAGS $SHCCFLAGS', '$SHCCCOMSTR'),
+        ('_CXXBATCHCOM', '$CXX', '$CXXFLAGS $CCFLAGS', '$CXXCOMSTR'),
+        ('_SHCXXBATCHCOM', '$SHCXX', '$SHCXXFLAGS $SHCCFLAGS', '$SHCXXCOMSTR'),
+    ):
+        env[var] = (
+            f'$( {cd} ${{TARGET.dir.abspath}} && $) '
+            f'${{TEMPFILE("{compiler} -c {flags} $_CCBATCHCOMCOM '
+            f'$_CCBATCHSOURCES","{comstr}")}}'
+        )
+
 def add_common_cc_variables(env) -> None:
     """
     Add underlying common "C compiler" variables that
@@ -48,6 +48,7 @@ compilers = ['clang']
 def generate(env) -> None:
     """Add Builders and construction variables for clang to an Environment."""
     SCons.Tool.cc.generate(env)
+    SCons.Tool.cc.add_batch_actions(env, SCons.Tool.cc.CSuffixes)
 
     if env['PLATFORM'] == 'win32':
         # Ensure that we have a proper path for clang
@@ -74,8 +75,12 @@ def generate(env) -> None:
             'stderr': DEVNULL,
             'universal_newlines': True,
         }
-        cp = SCons.Action.scons_subproc_run(env, [env['CC'], '-dumpversion'], **kw)
-        line = cp.stdout
+        line = SCons.Tool.cached_tool_probe(
+            env, 'clang', env['CC'],
+            lambda: SCons.Action.scons_subproc_run(
+                env, [env['CC'], '-dumpversion'], **kw
+            ).stdout,
+        )
         if line:
             env['CCVERSION'] = line
 
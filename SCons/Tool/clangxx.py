@@ -38,6 +38,7 @@ from subprocess import DEVNULL, PIPE
 
 import SCons.Tool
 import SCons.Util
+import SCons.Tool.cc
 import SCons.Tool.cxx
 from SCons.Tool.clangCommon import get_clang_install_dirs
 from SCons.Tool.MSCommon import msvc_setup_env_once
@@ -50,6 +51,7 @@ def generate(env) -> None:
     static_obj, shared_obj = SCons.Tool.createObjBuilders(env)
 
     SCons.Tool.cxx.generate(env)
+    SCons.Tool.cc.add_batch_actions(env, SCons.Tool.cxx.CXXSuffixes, cplusplus=True)
 
     env['CXX'] = env.Detect(compilers) or 'clang++'
 
@@ -81,8 +83,12 @@ def generate(env) -> None:
             'stderr': DEVNULL,
             'universal_newlines': True,
         }
-        cp = SCons.Action.scons_subproc_run(env, [env['CXX'], '-dumpversion'], **kw)
-        line = cp.stdout
+        line = SCons.Tool.cached_tool_probe(
+            env, 'clangxx', env['CXX'],
+            lambda: SCons.Action.scons_subproc_run(
+                env, [env['CXX'], '-dumpversion'], **kw
+            ).stdout,
+        )
         if line:
             env['CXXVERSION'] = line
 
@@ -33,12 +33,18 @@ the compilation database, otherwise, the file defaults to
 ``compile_commands.json``, the name that most clang tools search for by default.
 """
 
+import contextlib
 import fnmatch
 import itertools
 import json
+import os
+import types
 
+import SCons.Node
+import SCons.Util
 from SCons.Action import Action
 from SCons.Builder import Builder, ListEmitter
+from SCons.Environment import OverrideEnvironment
 from SCons.Platform import TempFileMunge
 from SCons.Tool import createObjBuilders
 from SCons.Tool.asm import ASPPSuffixes, ASSuffixes
@@ -47,6 +53,8 @@ from SCons.Tool.cxx import CXXSuffixes
 
 DEFAULT_DB_NAME = "compile_commands.json"
 
+_SCONS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
 # TODO: Is there a better way to do this than this global? Right now this exists so that the
 # emitter we add can record all of the things it emits, so that the scanner for the top level
 # compilation database can access the complete list, and also so that the writer has easy
@@ -60,42 +68,201 @@ class CompDBTEMPFILE(TempFileMunge):
         return self.cmd
 
 
+def _value_fingerprint(value, depth: int = 0) -> str:
+    """Return a string which changes when *value* would expand differently.
+
+    Used to tell whether a construction variable is the same as in an
+    earlier run.  Values we know nothing about (or nested too deeply)
+    are represented by their string form, which for most objects
+    includes their address and thus never matches, so they are never
+    wrongly taken to be unchanged.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return repr(value)
+    if isinstance(value, SCons.Node.Node):
+        return 'node:' + str(value)
+    if depth > 10:
+        return str(value)
+    depth += 1
+    if SCons.Util.is_Dict(value):
+        return '{%s}' % ','.join(
+            '%r:%s' % (k, _value_fingerprint(v, depth))
+            for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))
+        )
+    if SCons.Util.is_Sequence(value):
+        return '[%s]' % ','.join(_value_fingerprint(v, depth) for v in value)
+    if isinstance(value, types.MethodType):
+        return '%s.%s' % (
+            _value_fingerprint(value.__self__, depth),
+            _value_fingerprint(value.__func__, depth),
+        )
+    if isinstance(value, types.FunctionType):
+        # A function is identified by its code, as in the signature of
+        # a function Action, and what it does also depends on its
+        # defaults, what it closes over and the globals it refers to.
+        # The globals of SCons' own functions only change with SCons
+        # itself, so they are not followed.
+        code = value.__code__
+        cells = value.__closure__ or ()
+        if code.co_filename.startswith(_SCONS_DIR):
+            names = []
+        else:
+            names = sorted(set(code.co_names) & set(value.__globals__))
+        return 'func:%s(%s)(%s)(%s)' % (
+            SCons.Util.hash_signature(bytes(Action(value).get_presig(None, None, None))),
+            _value_fingerprint(value.__defaults__, depth),
+            ','.join(_value_fingerprint(c.cell_contents, depth) for c in cells),
+            ','.join(
+                '%s=%s' % (name, _global_fingerprint(value, name, depth))
+                for name in names
+            ),
+        )
+    if isinstance(value, type):
+        # A class: what its instances do depends on its methods.
+        return 'class:%s.%s%s' % (
+            value.__module__,
+            value.__qualname__,
+            _value_fingerprint(
+                {k: v for k, v in vars(value).items() if isinstance(v, types.FunctionType)},
+                depth,
+            ),
+        )
+    if isinstance(value, types.BuiltinFunctionType):
+        return '%s.%s' % (value.__module__, value.__qualname__)
+    if type(value).__repr__ is object.__repr__ and type(value).__str__ is object.__str__:
+        # A plain object: what it does depends on its class and attributes.
+        return '%s%s' % (
+            _value_fingerprint(type(value), depth),
+            _value_fingerprint(getattr(value, '__dict__', None), depth),
+        )
+    return str(value)
+
+
+def _global_fingerprint(func, name, depth: int) -> str:
+    """Return the fingerprint of the global *name* referred to by *func*."""
+    value = func.__globals__[name]
+    if value is func:
+        # A recursive function: its own code is already accounted for.
+        return 'self'
+    if isinstance(value, types.ModuleType):
+        return 'module:' + value.__name__
+    return _value_fingerprint(value, depth)
+
+
+def _env_fingerprint(env, cache) -> str:
+    """Return a signature of the construction variables of *env*.
+
+    Override environments share the signature of the environment they
+    override, so each distinct construction environment is only
+    fingerprinted once per *cache*.
+    """
+    try:
+        return cache[id(env)][1]
+    except KeyError:
+        pass
+    if isinstance(env, OverrideEnvironment):
+        d = env.__dict__
+        contents = '%s%s%s' % (
+            _env_fingerprint(d['__subject'], cache),
+            _value_fingerprint(d['overrides']),
+            _value_fingerprint(d['__deleted']),
+        )
+    else:
+        # Builders and scanners are not expanded in command lines.
+        contents = _value_fingerprint(
+            {k: v for k, v in env._dict.items() if k not in ('BUILDERS', 'SCANNERS')}
+        )
+    sig = SCons.Util.hash_signature(contents)
+    # keep env alive so its id is not reused while cached
+    cache[id(env)] = (env, sig)
+    return sig
+
+
+def _read_compilation_db(path) -> dict:
+    """Return the entries of an existing compilation database by output."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    try:
+        return {entry["output"]: entry for entry in entries}
+    except (KeyError, TypeError):
+        return {}
+
+
 def write_compilation_db(target, source, env) -> None:
+    """Write the compilation database.
+
+    The entries are written out one at a time.  Expanding the command
+    lines is what takes the time, so the signature of each entry (its
+    construction environment, command, source and output, and the
+    repositories include paths are looked up in) is kept in the
+    .sconsign entry of the database, and the entry from the existing
+    database is reused as long as its signature did not change.
+    """
     directory = env.Dir("#").get_abspath()
     overrides = {"TEMPFILE": CompDBTEMPFILE}
     use_abspath = env["COMPILATIONDB_USE_ABSPATH"] in [True, 1, "True", "true"]
     use_path_filter = env.subst("$COMPILATIONDB_PATH_FILTER")
 
-    entries = []
-    for db_target, db_source, db_env, db_action in __COMPILATION_DB_ENTRIES:
-        # Parse command before filtering.
-        command = db_action.strfunction(db_target, db_source, db_env, None, overrides)
-
-        if not db_source.is_derived():
-            db_source = db_source.srcnode()
-
-        if use_abspath:
-            file = db_source.get_abspath()
-            output = db_target.get_abspath()
-        else:
-            file = db_source.get_path()
-            output = db_target.get_path()
-
-        if use_path_filter and not fnmatch.fnmatch(output, use_path_filter):
-            continue
-
-        entries.append(
-            {
-                "command": command,
-                "directory": directory,
-                "file": file,
-                "output": output,
-            }
-        )
-
-    with open(target[0].get_path(), "w", encoding="utf-8", newline="\n") as output_file:
-        json.dump(entries, output_file, sort_keys=True, indent=4)
-        output_file.write("\n")
+    db = target[0]
+    stored_sigs = db.get_emitter_cache('compilation_db', directory) or {}
+    old_entries = _read_compilation_db(db.get_abspath()) if stored_sigs else {}
+    sigs = {}
+    env_fingerprints = {}
+    # Repository() adds the repository copies of path variables
+    # (CPPPATH and the like) to the command lines.
+    repositories = ','.join(r.get_abspath() for r in env.Dir('#').getRepositories())
+
+    path = db.get_path()
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as output_file:
+            sep = "[\n"
+            for db_target, db_source, db_env, db_action in __COMPILATION_DB_ENTRIES:
+                # The command uses the source as given, the entry the
+                # source directory's file.
+                file_node = db_source
+                if not file_node.is_derived():
+                    file_node = file_node.srcnode()
+
+                if use_abspath:
+                    file = file_node.get_abspath()
+                    output = db_target.get_abspath()
+                else:
+                    file = file_node.get_path()
+                    output = db_target.get_path()
+
+                if use_path_filter and not fnmatch.fnmatch(output, use_path_filter):
+                    continue
+
+                sig = SCons.Util.hash_signature('\0'.join([
+                    _env_fingerprint(db_env, env_fingerprints),
+                    str(db_action), file, output, repositories,
+                ]))
+                sigs[output] = sig
+                entry = old_entries.get(output)
+                if entry is None or stored_sigs.get(output) != sig or entry.get("file") != file:
+                    entry = {
+                        "command": db_action.strfunction(db_target, db_source, db_env, None, overrides),
+                        "directory": directory,
+                        "file": file,
+                        "output": output,
+                    }
+
+                output_file.write(sep)
+                sep = ",\n"
+                output_file.write("    " + json.dumps(entry, sort_keys=True, indent=4).replace("\n", "\n    "))
+            output_file.write("[]\n" if sep == "[\n" else "\n]\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        # don't leave a partly written database behind
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+    db.set_emitter_cache('compilation_db', directory, sigs)
 
 
 def compilation_db_emitter(target, source, env):
@@ -116,6 +283,8 @@ def compilation_db_emitter(target, source, env):
     #  function as dependencies.
     env.AlwaysBuild(target)
     env.NoCache(target)
+    # Keep the previous database around, its entries are reused.
+    env.Precious(target)
 
     return target, source
 
@@ -36,6 +36,7 @@ from . import cc
 import re
 from subprocess import PIPE
 
+import SCons.Tool
 import SCons.Util
 
 compilers = ['gcc', 'cc']
@@ -48,6 +49,7 @@ def generate(env) -> None:
         env['CC'] = env.Detect(compilers) or compilers[0]
 
     cc.generate(env)
+    cc.add_batch_actions(env, cc.CSuffixes)
 
     if env['PLATFORM'] in ['cygwin', 'win32']:
         env['SHCCFLAGS'] = SCons.Util.CLVar('$CCFLAGS')
@@ -69,11 +71,22 @@ def exists(env):
 
 
 def detect_version(env, cc):
-    """Return the version of the GNU compiler, or None if it is not a GNU compiler."""
-    version = None
+    """Return the version of the GNU compiler, or None if it is not a GNU compiler.
+
+    The result is cached per compiler binary, see
+    :func:`SCons.Tool.cached_tool_probe`.
+    """
     cc = env.subst(cc)
     if not cc:
-        return version
+        return None
+    return SCons.Tool.cached_tool_probe(
+        env, 'gcc', cc, lambda: _detect_version(env, cc)
+    )
+
+
+def _detect_version(env, cc):
+    """Run the GNU compiler to find its version."""
+    version = None
 
     # -dumpversion was added in GCC 3.0.  As long as we're supporting
     # GCC versions older than that, we should use --version and a
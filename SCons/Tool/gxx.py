@@ -36,6 +36,7 @@ selection method.
 import SCons.Tool
 import SCons.Util
 
+from . import cc
 from . import gcc
 from . import cxx
 
@@ -50,6 +51,7 @@ def generate(env) -> None:
         env['CXX'] = env.Detect(compilers) or compilers[0]
 
     cxx.generate(env)
+    cc.add_batch_actions(env, cxx.CXXSuffixes, cplusplus=True)
 
     # platform specific settings
     if env['PLATFORM'] == 'aix':
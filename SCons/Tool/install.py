@@ -31,7 +31,8 @@ selection method.
 
 import os
 import stat
-from shutil import copy2, copystat
+from concurrent.futures import ThreadPoolExecutor
+from shutil import SameFileError, copy2, copystat
 
 import SCons.Action
 import SCons.Tool
@@ -153,6 +154,110 @@ def scons_copytree(src, dst, symlinks: bool=False, ignore=None, copy_function=co
         raise CopytreeError(errors)  # SCons change
     return dst
 
+def parallel_copytree(src, dst, copy_function=copy2, jobs: int = 2):
+    """Recursively copy a directory tree, copying files in parallel.
+
+    Like :func:`scons_copytree` with *dirs_exist_ok* set, except that the
+    files are copied by a pool of *jobs* threads.  The directories are
+    created first, and their metadata copied once all files are in place.
+    Symbolic links are followed.
+
+    .. versionadded:: 4.12.0
+    """
+    dirs = []
+    files = []
+    for root, _, names in os.walk(src, followlinks=True):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_root, exist_ok=True)
+        dirs.append((root, target_root))
+        files.extend((os.path.join(root, name), os.path.join(target_root, name))
+                     for name in names)
+
+    def copy(pair):
+        try:
+            copy_function(*pair)
+        except OSError as why:
+            return pair + (str(why),)
+        return None
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        errors = [error for error in executor.map(copy, files) if error]
+    for srcname, dstname in reversed(dirs):
+        try:
+            copystat(srcname, dstname)
+        except OSError as why:
+            # Copying file access times may fail on Windows
+            if getattr(why, 'winerror', None) is None:
+                errors.append((srcname, dstname, str(why)))
+    if errors:
+        raise CopytreeError(errors)
+    return dst
+
+#
+# How files are put in place.
+#
+INSTALL_STRATEGIES = ('copy', 'hardlink', 'reflink')
+
+# ioctl request to clone a file on Linux (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+def _reflink(source, dest) -> None:
+    """Make *dest* a copy-on-write clone of *source*, or raise OSError."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflink not supported on this platform")
+    with open(source, 'rb') as src, open(dest, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    copystat(source, dest)
+
+def install_file(source, dest, strategy: str = 'copy', writable: bool = True) -> None:
+    """Install the file *source* as *dest* using *strategy*.
+
+    ``'copy'`` copies the file, ``'hardlink'`` makes *dest* a hard link to
+    *source* and ``'reflink'`` a copy-on-write clone of it.  If a link or
+    clone cannot be made, for example across file systems, the file is
+    copied.  Mode/permission bits are copied as well, and unless
+    *writable* is false, a copy is made writable (a hard link is left
+    alone, as it shares the bits with *source*).  An existing *dest* is
+    replaced rather than written to, as it may be a hard link to
+    *source* from an earlier install; if *dest* is *source* itself, it
+    is left alone.
+
+    .. versionadded:: 4.12.0
+    """
+    if strategy not in INSTALL_STRATEGIES:
+        raise SCons.Errors.UserError(
+            "Invalid INSTALL_STRATEGY %r, must be one of %s"
+            % (strategy, ', '.join(INSTALL_STRATEGIES))
+        )
+    if os.path.realpath(source) == os.path.realpath(dest):
+        return
+    if os.path.lexists(dest) and not os.path.isdir(dest):
+        os.unlink(dest)
+    if strategy == 'hardlink':
+        try:
+            os.link(source, dest)
+            return
+        except OSError:
+            pass
+    cloned = False
+    if strategy == 'reflink':
+        try:
+            _reflink(source, dest)
+            cloned = True
+        except OSError:
+            pass
+    if not cloned:
+        try:
+            copy2(source, dest)
+        except SameFileError:
+            # already installed
+            return
+    if writable:
+        st = os.stat(source)
+        os.chmod(dest, stat.S_IMODE(st.st_mode) | stat.S_IWRITE)
+
 #
 # Functions doing the actual work of the Install Builder.
 #
@@ -160,11 +265,14 @@ def copyFunc(dest, source, env) -> int:
     """Install a source file or directory into a destination by copying.
 
     Mode/permissions bits will be copied as well, except that the target
-    will be made writable.
+    will be made writable.  Files are hard linked or cloned instead of
+    copied if requested by ``$INSTALL_STRATEGY``, and the files of a
+    directory are copied by ``$INSTALL_JOBS`` threads.
 
     Returns:
         POSIX-style error code - 0 for success, non-zero for fail
     """
+    strategy = env.subst('$INSTALL_STRATEGY') or 'copy'
     if os.path.isdir(source):
         if os.path.exists(dest):
             if not os.path.isdir(dest):
@@ -173,11 +281,17 @@ def copyFunc(dest, source, env) -> int:
             parent = os.path.split(dest)[0]
             if not os.path.exists(parent):
                 os.makedirs(parent)
-        scons_copytree(source, dest, dirs_exist_ok=True)
+
+        def copy_function(src, dst) -> None:
+            install_file(src, dst, strategy, writable=False)
+
+        jobs = int(env.subst('$INSTALL_JOBS') or 1)
+        if jobs > 1:
+            parallel_copytree(source, dest, copy_function, jobs)
+        else:
+            scons_copytree(source, dest, copy_function=copy_function, dirs_exist_ok=True)
     else:
-        copy2(source, dest)
-        st = os.stat(source)
-        os.chmod(dest, stat.S_IMODE(st.st_mode) | stat.S_IWRITE)
+        install_file(source, dest, strategy)
 
     return 0
 
@@ -353,8 +467,8 @@ class DESTDIR_factory:
 #
 # The Builder Definition
 #
-install_action       = SCons.Action.Action(installFunc, stringFunc)
-installas_action     = SCons.Action.Action(installFunc, stringFunc)
+install_action       = SCons.Action.Action(installFunc, stringFunc, varlist=['INSTALL_STRATEGY'])
+installas_action     = SCons.Action.Action(installFunc, stringFunc, varlist=['INSTALL_STRATEGY'])
 installVerLib_action = SCons.Action.Action(installFuncVersionedLib, stringFunc)
 
 BaseInstallBuilder               = None
@@ -36,13 +36,37 @@ from collections import OrderedDict
 import SCons.Action
 import SCons.Builder
 from SCons.Node.FS import _my_normcase
-from SCons.Tool.JavaCommon import parse_java_file, get_java_install_dirs, get_java_include_paths
+import SCons.Tool.JavaCommon
+from SCons.Tool.JavaCommon import (
+    parse_java_file,
+    get_java_install_dirs,
+    get_java_include_paths,
+    java_batch_sources,
+)
 import SCons.Util
 
 def classname(path):
     """Turn a string (path name) into a Java class name."""
     return os.path.normpath(path).replace(os.sep, '.')
 
+def parse_java_source(f, version):
+    """Return the package directory and class names for source node *f*.
+
+    Parsing the file is comparatively expensive, so the result is cached
+    in the .sconsign entry of the file, keyed by its content signature
+    and *version*, and reused as long as neither changes.
+    """
+    rf = f.rfile()
+    if not SCons.Tool.JavaCommon.java_parsing:
+        return parse_java_file(rf.get_abspath(), version)
+    sig = (rf.get_csig(), version)
+    result = rf.get_emitter_cache('javac', sig)
+    if result is None:
+        pkg_dir, classes = parse_java_file(rf.get_abspath(), version)
+        result = (pkg_dir, list(classes))
+        rf.set_emitter_cache('javac', sig, result)
+    return result
+
 def emit_java_classes(target, source, env):
     """Create and return lists of source java files
     and their corresponding target class files.
@@ -92,7 +116,7 @@ def emit_java_classes(target, source, env):
         source_file_based = True
         pkg_dir = None
         if not f.is_derived():
-            pkg_dir, classes = parse_java_file(f.rfile().get_abspath(), version)
+            pkg_dir, classes = parse_java_source(f, version)
             if classes:
                 source_file_based = False
                 if pkg_dir:
@@ -231,12 +255,13 @@ def generate(env) -> None:
         JAVAPROCESSORPATH=[],
     )
     env['_javapathopt'] = pathopt
+    env['_JAVACSOURCES'] = java_batch_sources
     env['_JAVABOOTCLASSPATH'] = '${_javapathopt("-bootclasspath", "JAVABOOTCLASSPATH")} '
     env['_JAVAPROCESSORPATH'] = '${_javapathopt("-processorpath", "JAVAPROCESSORPATH")} '
     env['_JAVACLASSPATH'] = '${_javapathopt("-classpath", "JAVACLASSPATH")} '
     env['_JAVASOURCEPATH'] = '${_javapathopt("-sourcepath", "JAVASOURCEPATH", "_JAVASOURCEPATHDEFAULT")} '
     env['_JAVASOURCEPATHDEFAULT'] = '${TARGET.attributes.java_sourcedir}'
-    env['_JAVACCOM'] = '$JAVAC $JAVACFLAGS $_JAVABOOTCLASSPATH $_JAVAPROCESSORPATH $_JAVACLASSPATH -d ${TARGET.attributes.java_classdir} $_JAVASOURCEPATH $SOURCES'
+    env['_JAVACCOM'] = '$JAVAC $JAVACFLAGS $_JAVABOOTCLASSPATH $_JAVAPROCESSORPATH $_JAVACLASSPATH -d ${TARGET.attributes.java_classdir} $_JAVASOURCEPATH $_JAVACSOURCES'
     env['JAVACCOM'] = "${TEMPFILE('$_JAVACCOM','$JAVACCOMSTR')}"
 
 def exists(env) -> bool:
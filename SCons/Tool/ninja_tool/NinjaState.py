@@ -23,6 +23,7 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import io
+import json
 import os
 import pathlib
 import signal
@@ -474,36 +475,31 @@ class NinjaState:
         template_builders = []
         scons_compiledb = False
 
-        if SCons.Script._Get_Default_Targets == SCons.Script._Set_Default_Targets_Has_Not_Been_Called:
-            all_targets = set()
-        else:
-            all_targets = None
-
-        for build in [self.builds[key] for key in sorted(self.builds.keys())]:
-            if "compile_commands.json" in build["outputs"]:
-                scons_compiledb = True
-
-            # this is for the no command line targets, no SCons default case. We want this default
-            # to just be all real files in the build.
-            if all_targets is not None and build['rule'] != 'phony':
-                all_targets = all_targets | set(build["outputs"])
-
-            if build["rule"] == "TEMPLATE":
-                template_builders.append(build)
-                continue
-
-            if "implicit" in build:
-                build["implicit"].sort()
-
+        def needs_generated_sources(build):
             # Don't make generated sources depend on each other. We
             # have to check that none of the outputs are generated
             # sources and none of the direct implicit dependencies are
             # generated sources or else we will create a dependency
             # cycle.
-            if (
-                generated_source_files
-                and check_generated_source_deps(build)
-            ):
+            return bool(generated_source_files) and check_generated_source_deps(build)
+
+        def write_depfile(build):
+            # Optionally a rule can specify a depfile, and SCons can generate implicit
+            # dependencies into the depfile. This allows for dependencies to come and go
+            # without invalidating the ninja file. The depfile was created in ninja specifically
+            # for dealing with header files appearing and disappearing across rebuilds, but it can
+            # be repurposed for anything, as long as you have a way to regenerate the depfile.
+            # More specific info can be found here: https://ninja-build.org/manual.html#_depfile
+            rule = self.rules.get(build["rule"])
+            if rule is not None and rule.get('depfile') and build.get('deps_files'):
+                path = build['outputs'] if SCons.Util.is_List(build['outputs']) else [build['outputs']]
+                generate_depfile(self.env, path[0], build.pop('deps_files', []))
+
+        def write_build(writer, build):
+            if "implicit" in build:
+                build["implicit"].sort()
+
+            if needs_generated_sources(build):
                 # Make all non-generated source targets depend on
                 # _generated_sources. We use order_only for generated
                 # sources so that we don't rebuild the world if one
@@ -556,30 +552,73 @@ class NinjaState:
 
                 if remaining_outputs:
                     ninja_sorted_build(
-                        ninja,
+                        writer,
                         outputs=remaining_outputs, rule="phony", implicit=first_output,
                     )
 
                 build["outputs"] = first_output
 
-            # Optionally a rule can specify a depfile, and SCons can generate implicit
-            # dependencies into the depfile. This allows for dependencies to come and go
-            # without invalidating the ninja file. The depfile was created in ninja specifically
-            # for dealing with header files appearing and disappearing across rebuilds, but it can
-            # be repurposed for anything, as long as you have a way to regenerate the depfile.
-            # More specific info can be found here: https://ninja-build.org/manual.html#_depfile
-            if rule is not None and rule.get('depfile') and build.get('deps_files'):
-                path = build['outputs'] if SCons.Util.is_List(build['outputs']) else [build['outputs']]
-                generate_depfile(self.env, path[0], build.pop('deps_files', []))
+            write_depfile(build)
 
             if "inputs" in build:
                 build["inputs"].sort()
 
             ninja_sorted_build(
-                ninja,
+                writer,
                 **build
             )
 
+        # With NINJA_SUBNINJA the build statements go to one fragment
+        # per directory (of the first output), see write_subninja.
+        subninja = self.env.get('NINJA_SUBNINJA', False)
+        directories = {}
+
+        if SCons.Script._Get_Default_Targets == SCons.Script._Set_Default_Targets_Has_Not_Been_Called:
+            all_targets = set()
+        else:
+            all_targets = None
+
+        for build in [self.builds[key] for key in sorted(self.builds.keys())]:
+            if "compile_commands.json" in build["outputs"]:
+                scons_compiledb = True
+
+            # this is for the no command line targets, no SCons default case. We want this default
+            # to just be all real files in the build.
+            if all_targets is not None and build['rule'] != 'phony':
+                all_targets = all_targets | set(build["outputs"])
+
+            if build["rule"] == "TEMPLATE":
+                template_builders.append(build)
+                continue
+
+            if subninja:
+                outputs = build["outputs"]
+                if SCons.Util.is_List(outputs):
+                    outputs = outputs[0]
+                directories.setdefault(os.path.dirname(outputs), []).append(build)
+            else:
+                write_build(ninja, build)
+
+        fragments_changed = False
+        if subninja:
+            # What a fragment holds also depends on the rules and on
+            # the generated sources, besides its own build statements.
+            context = repr((
+                SCons.__version__,
+                sorted(self.rules.items()),
+                generated_sources_alias,
+            ))
+
+            def fragment_key(builds):
+                return SCons.Util.hash_signature(repr((
+                    context,
+                    [(build, needs_generated_sources(build)) for build in builds],
+                )))
+
+            fragments_changed = self.write_subninja(
+                ninja, directories, fragment_key, write_build, write_depfile
+            )
+
         scons_daemon_dirty = str(pathlib.Path(get_path(self.env.get("NINJA_DIR"))) / "scons_daemon_dirty")
         for template_builder in template_builders:
             template_builder["implicit"] += [scons_daemon_dirty]
@@ -674,7 +713,8 @@ class NinjaState:
         with NamedTemporaryFile(delete=False, mode='w') as temp_ninja_file:
             temp_ninja_file.write(content.getvalue())
 
-        if self.env.GetOption('skip_ninja_regen') and os.path.exists(ninja_file_path) and filecmp.cmp(temp_ninja_file.name, ninja_file_path):
+        # ninja only reloads fragments when the main file is replaced.
+        if self.env.GetOption('skip_ninja_regen') and not fragments_changed and os.path.exists(ninja_file_path) and filecmp.cmp(temp_ninja_file.name, ninja_file_path):
             os.unlink(temp_ninja_file.name)
         else:
 
@@ -705,6 +745,59 @@ class NinjaState:
 
         self.__generated = True
 
+    def write_subninja(self, ninja, directories, fragment_key, write_build, write_depfile) -> bool:
+        """Write the build statements of *directories* as fragments and include them.
+
+        Each directory's fragment is written to ``$NINJA_DIR/subninja``,
+        named after the directory, so the main build file only changes
+        when directories come or go. A fragment is only formatted and
+        written again if its *fragment_key* (computed from the build
+        statements before they are written) differs from the one
+        recorded when it was last written; fragments no longer used are
+        removed.
+
+        Returns:
+            whether any fragment was written or removed.
+        """
+        subninja_dir = self.env.Dir(self.env['NINJA_DIR']).Dir('subninja')
+        abspath = subninja_dir.get_abspath()
+        os.makedirs(abspath, exist_ok=True)
+        keys_file = os.path.join(abspath, 'fragments.json')
+        try:
+            with open(keys_file) as f:
+                old_keys = json.load(f)
+        except (OSError, ValueError):
+            old_keys = {}
+
+        changed = False
+        keys = {}
+        for dirname, builds in sorted(directories.items()):
+            name = SCons.Util.hash_signature(dirname) + '.ninja'
+            path = os.path.join(abspath, name)
+            key = fragment_key(builds)
+            keys[name] = key
+            if old_keys.get(name) == key and os.path.exists(path):
+                for build in builds:
+                    write_depfile(build)
+            else:
+                content = io.StringIO()
+                writer = self.writer_class(content, width=100)
+                writer.comment("Generated by scons. DO NOT EDIT.")
+                for build in builds:
+                    write_build(writer, build)
+                with open(path, 'w') as f:
+                    f.write(content.getvalue())
+                changed = True
+            ninja.subninja(get_path(subninja_dir.File(name)))
+        for name in os.listdir(abspath):
+            if name.endswith('.ninja') and name not in keys:
+                os.unlink(os.path.join(abspath, name))
+                changed = True
+        if keys != old_keys:
+            with open(keys_file, 'w') as f:
+                json.dump(keys, f, indent=0, sort_keys=True)
+        return changed
+
 
 class SConsToNinjaTranslator:
     """Translates SCons Actions into Ninja build objects."""
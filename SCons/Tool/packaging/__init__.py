@@ -24,9 +24,18 @@
 
 """SCons Packaging Tool."""
 
+import gzip
 import importlib
+import io
+import os
+import stat
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from inspect import getfullargspec
 
+import SCons.Action
 import SCons.Defaults
 import SCons.Environment
 from SCons.Errors import UserError, SConsEnvironmentError
@@ -284,6 +293,247 @@ def putintopackageroot(target, source, env, pkgroot, honor_install_location: int
     return target, new_source
 
 
+# Size of the uncompressed chunks which are compressed independently of
+# each other by ParallelCompressor.  It is fixed (and not tied to the
+# number of jobs) so that the output does not depend on the machine.
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+def _gzip_compress(data) -> bytes:
+    """ Returns *data* gzip compressed, with no timestamp in the header.
+
+    (gzip.compress only takes an mtime from Python 3.8 on.)
+    """
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', mtime=0) as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+# Each chunk becomes a complete member (stream) of the compressed file.
+# gzip, bzip2 and xz all define a concatenation of members to decompress
+# to the concatenation of their contents.
+def _compressor(compression):
+    """ Returns the function compressing a chunk with *compression*.
+
+    bz2 and lzma are only imported when used: they are optional parts of
+    a Python build, and most packages never need them.
+    """
+    if compression == 'gz':
+        return _gzip_compress
+    if compression == 'bz2':
+        import bz2
+        return bz2.compress
+    if compression == 'xz':
+        import lzma
+        return lambda data: lzma.compress(data, format=lzma.FORMAT_XZ)
+    raise UserError("Unknown compression %r" % compression)
+
+
+class ParallelCompressor:
+    """ A write-only file object which compresses what is written to it.
+
+    The data is cut into chunks of STREAM_CHUNK_SIZE bytes which are
+    compressed in a pool of *jobs* threads (zlib, bz2 and lzma release
+    the GIL while compressing) and written to *fileobj* in order.  At most
+    twice as many chunks as there are jobs are held in memory.
+    """
+
+    def __init__(self, fileobj, compression, jobs: int=1) -> None:
+        self.fileobj = fileobj
+        self.compress = _compressor(compression)
+        self.jobs = max(1, jobs)
+        self.executor = ThreadPoolExecutor(self.jobs)
+        self.pending = []
+        self.buffer = bytearray()
+
+    def write(self, data) -> int:
+        self.buffer.extend(data)
+        while len(self.buffer) >= STREAM_CHUNK_SIZE:
+            self._submit(bytes(self.buffer[:STREAM_CHUNK_SIZE]))
+            del self.buffer[:STREAM_CHUNK_SIZE]
+        return len(data)
+
+    def _submit(self, chunk) -> None:
+        self.pending.append(self.executor.submit(self.compress, chunk))
+        while len(self.pending) > 2 * self.jobs:
+            self.fileobj.write(self.pending.pop(0).result())
+
+    def close(self) -> None:
+        if self.buffer or not self.pending:
+            self._submit(bytes(self.buffer))
+            self.buffer = bytearray()
+        for future in self.pending:
+            self.fileobj.write(future.result())
+        self.pending = []
+        self.executor.shutdown()
+
+
+def _source_date_epoch(env):
+    """ Returns SOURCE_DATE_EPOCH as an int, or None if it is not set.
+
+    When set, it is the modification time of all the members of a
+    streamed archive; otherwise each member keeps its file's own.
+    """
+    epoch = env['ENV'].get('SOURCE_DATE_EPOCH',
+                           os.environ.get('SOURCE_DATE_EPOCH'))
+    if epoch is None or epoch == '':
+        return None
+    return int(epoch)
+
+
+def _member_mtime(st, mtime) -> int:
+    """ Returns the modification time to record for a file with stat *st*. """
+    if mtime is None:
+        return int(st.st_mtime)
+    return mtime
+
+
+def _file_mode(st) -> int:
+    """ Returns normalized permission bits: 0o755 if executable, else 0o644. """
+    if stat.S_ISDIR(st.st_mode) or \
+            st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+        return 0o755
+    return 0o644
+
+
+def _expand_entries(entries):
+    """ Yields (arcname, path, is_dir) for *entries*, sorted by arcname.
+
+    Directories are archived as tar does in the non-streaming packagers:
+    an entry for the directory, followed by its contents.
+    """
+    for arcname, node in sorted(entries, key=lambda e: e[0]):
+        path = node.get_abspath()
+        if not os.path.isdir(path):
+            yield arcname, path, False
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            rel = os.path.relpath(root, path)
+            base = arcname if rel == os.curdir else \
+                arcname + '/' + rel.replace(os.sep, '/')
+            yield base, root, True
+            for name in sorted(files):
+                yield base + '/' + name, os.path.join(root, name), False
+
+
+def write_tar_stream(target, entries, compression, jobs: int=1, mtime=None) -> None:
+    """ Writes a deterministic tar archive of *entries* to *target*.
+
+    *entries* is a sequence of (arcname, node) tuples; directories are
+    archived with their contents.  The size, mode and modification time
+    of each member are taken from its file (the latter unless *mtime* is
+    given, e.g. from SOURCE_DATE_EPOCH), while owner and group are fixed,
+    so the same files always give the same archive.  If *compression* is set, the archive is compressed in
+    parallel by a ParallelCompressor.
+    """
+    with open(target, 'wb') as f:
+        out = f
+        if compression:
+            out = ParallelCompressor(f, compression, jobs)
+        with tarfile.open(fileobj=out, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+            for arcname, path, is_dir in _expand_entries(entries):
+                st = os.stat(path)
+                info = tarfile.TarInfo(arcname)
+                info.mode = _file_mode(st)
+                info.mtime = _member_mtime(st, mtime)
+                if is_dir:
+                    info.type = tarfile.DIRTYPE
+                    tar.addfile(info)
+                    continue
+                info.size = st.st_size
+                with open(path, 'rb') as src:
+                    tar.addfile(info, src)
+        if compression:
+            out.close()
+
+
+def write_zip_stream(target, entries, mtime=None) -> None:
+    """ Writes a deterministic zip archive of *entries* to *target*.
+
+    The zip counterpart of :func:`write_tar_stream`; zip compresses each
+    member on its own, so no chunking is done.  Like the zip packagers,
+    it only stores files, not directories.
+    """
+    with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for arcname, path, is_dir in _expand_entries(entries):
+            if is_dir:
+                continue
+            st = os.stat(path)
+            # zip cannot represent dates before 1980.
+            date_time = max((1980, 1, 1, 0, 0, 0),
+                            tuple(time.gmtime(_member_mtime(st, mtime))[:6]))
+            info = zipfile.ZipInfo(arcname, date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = (stat.S_IFREG | _file_mode(st)) << 16
+            with open(path, 'rb') as src, \
+                 zf.open(info, 'w') as dst:
+                for chunk in iter(lambda: src.read(STREAM_CHUNK_SIZE), b''):
+                    dst.write(chunk)
+
+
+def streamintoarchive(target, source, env, pkgroot, compression, suffix,
+                      honor_install_location: int=1, **kw):
+    """ Archives the source files under pkgroot without copying them.
+
+    This is the streaming counterpart of :func:`putintopackageroot`: the
+    names of the archive members are computed the same way, but the files
+    are read straight from their current location when the archive is
+    built.  *compression* is one of ``'gz'``, ``'bz2'``, ``'xz'`` or
+    ``None`` for tar archives, or ``'zip'``.  *suffix* is appended to
+    target names which lack it.
+
+    Returns the target nodes of the archiving Command.
+
+    .. versionadded:: 4.12.0
+    """
+    target = [SCons.Util.adjustixes(t, '', suffix)
+              if SCons.Util.is_String(t) else t for t in target]
+    if SCons.Util.is_String(pkgroot):
+        pkgroot = env.Dir(pkgroot)
+    if not SCons.Util.is_List(source):
+        source = [source]
+
+    arcnames = []
+    for file in source:
+        if SCons.Util.is_String(file):
+            file = env.File(file)
+        if file.is_under(pkgroot):
+            new_name = file.get_path()
+        else:
+            if file.GetTag('PACKAGING_INSTALL_LOCATION') and \
+                       honor_install_location:
+                new_name = make_path_relative(file.GetTag('PACKAGING_INSTALL_LOCATION'))
+            else:
+                new_name = make_path_relative(file.get_path())
+            new_name = pkgroot.File(new_name).get_path()
+        arcnames.append(new_name.replace(os.sep, '/'))
+    arcnames = tuple(arcnames)
+
+    mtime = _source_date_epoch(env)
+
+    # The member names and SOURCE_DATE_EPOCH are part of the function's
+    # closure and thus of the action signature, so changing either
+    # rebuilds the archive.
+    def stream_archive(target, source, env) -> None:
+        # (the name "zip" is taken by the zip packager module here)
+        entries = [(arcnames[i], node) for i, node in enumerate(source)]
+        if compression == 'zip':
+            write_zip_stream(target[0].get_abspath(), entries, mtime)
+        else:
+            jobs = int(env.subst('$PACKAGEJOBS') or os.cpu_count() or 1)
+            write_tar_stream(target[0].get_abspath(), entries,
+                             compression, jobs, mtime)
+
+    action = SCons.Action.Action(stream_archive, "Package(\"$TARGET\")")
+    # The other keywords describe the package (NAME, VERSION, ...), they
+    # are not construction variables for the archive.
+    overrides = {}
+    if 'PACKAGEJOBS' in kw:
+        overrides['PACKAGEJOBS'] = kw['PACKAGEJOBS']
+    return env.Command(target, source, action, **overrides)
+
+
 def stripinstallbuilder(target, source, env):
     """ Strips the install builder action from the source list and stores
     the final installation location as the "PACKAGING_INSTALL_LOCATION" of
@@ -27,10 +27,13 @@
 The tarbz2 SRC packager.
 """
 
-from SCons.Tool.packaging import putintopackageroot
+from SCons.Tool.packaging import putintopackageroot, streamintoarchive
 
 def package(env, target, source, PACKAGEROOT, **kw):
     bld = env['BUILDERS']['Tar']
     bld.set_suffix('.tar.bz2')
+    if kw.get('PACKAGESTREAM', env.get('PACKAGESTREAM')):
+        return streamintoarchive(target, source, env, PACKAGEROOT, 'bz2',
+                                 '.tar.bz2', honor_install_location=0, **kw)
     target, source = putintopackageroot(target, source, env, PACKAGEROOT, honor_install_location=0)
     return bld(env, target, source, TARFLAGS='-jc')
@@ -27,10 +27,13 @@
 The targz SRC packager.
 """
 
-from SCons.Tool.packaging import putintopackageroot
+from SCons.Tool.packaging import putintopackageroot, streamintoarchive
 
 def package(env, target, source, PACKAGEROOT, **kw):
     bld = env['BUILDERS']['Tar']
     bld.set_suffix('.tar.gz')
+    if kw.get('PACKAGESTREAM', env.get('PACKAGESTREAM')):
+        return streamintoarchive(target, source, env, PACKAGEROOT, 'gz',
+                                 '.tar.gz', honor_install_location=0, **kw)
     target, source = putintopackageroot(target, source, env, PACKAGEROOT, honor_install_location=0)
     return bld(env, target, source, TARFLAGS='-zc')
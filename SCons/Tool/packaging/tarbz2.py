@@ -27,11 +27,16 @@
 The tarbz2 packager.
 """
 
-from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot
+from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot, \
+    streamintoarchive
 
 def package(env, target, source, PACKAGEROOT, **kw):
     bld = env['BUILDERS']['Tar']
     bld.set_suffix('.tar.bz2')
+    if kw.get('PACKAGESTREAM', env.get('PACKAGESTREAM')):
+        target, source = stripinstallbuilder(target, source, env)
+        return streamintoarchive(target, source, env, PACKAGEROOT, 'bz2',
+                                 '.tar.bz2', **kw)
     target, source = putintopackageroot(target, source, env, PACKAGEROOT)
     target, source = stripinstallbuilder(target, source, env)
     return bld(env, target, source, TARFLAGS='-jc')
@@ -27,11 +27,16 @@
 The targz packager.
 """
 
-from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot
+from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot, \
+    streamintoarchive
 
 def package(env, target, source, PACKAGEROOT, **kw):
     bld = env['BUILDERS']['Tar']
     bld.set_suffix('.tar.gz')
+    if kw.get('PACKAGESTREAM', env.get('PACKAGESTREAM')):
+        target, source = stripinstallbuilder(target, source, env)
+        return streamintoarchive(target, source, env, PACKAGEROOT, 'gz',
+                                 '.tar.gz', **kw)
     target, source = stripinstallbuilder(target, source, env)
     target, source = putintopackageroot(target, source, env, PACKAGEROOT)
     return bld(env, target, source, TARFLAGS='-zc')
@@ -27,11 +27,16 @@
 The tarxz packager.
 """
 
-from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot
+from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot, \
+    streamintoarchive
 
 def package(env, target, source, PACKAGEROOT, **kw):
     bld = env['BUILDERS']['Tar']
     bld.set_suffix('.tar.xz')
+    if kw.get('PACKAGESTREAM', env.get('PACKAGESTREAM')):
+        target, source = stripinstallbuilder(target, source, env)
+        return streamintoarchive(target, source, env, PACKAGEROOT, 'xz',
+                                 '.tar.xz', **kw)
     target, source = putintopackageroot(target, source, env, PACKAGEROOT)
     target, source = stripinstallbuilder(target, source, env)
     return bld(env, target, source, TARFLAGS='-Jc')
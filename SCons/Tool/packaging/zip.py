@@ -27,11 +27,16 @@
 The zip SRC packager.
 """
 
-from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot
+from SCons.Tool.packaging import stripinstallbuilder, putintopackageroot, \
+    streamintoarchive
 
 def package(env, target, source, PACKAGEROOT, **kw):
     bld = env['BUILDERS']['Zip']
     bld.set_suffix('.zip')
+    if kw.get('PACKAGESTREAM', env.get('PACKAGESTREAM')):
+        target, source = stripinstallbuilder(target, source, env)
+        return streamintoarchive(target, source, env, PACKAGEROOT, 'zip',
+                                 '.zip', **kw)
     target, source = stripinstallbuilder(target, source, env)
     target, source = putintopackageroot(target, source, env, PACKAGEROOT)
     return bld(env, target, source)
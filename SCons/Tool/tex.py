@@ -70,6 +70,16 @@ openout_bcf_re = re.compile(r"OUTPUT *(.*\.bcf)")
 #printnomenclature_re = re.compile(r"^[^%]*\\printnomenclature", re.MULTILINE)
 #printglossary_re = re.compile(r"^[^%]*\\printglossary", re.MULTILINE)
 
+# search for the lines of an .aux file that BibTeX reads
+bibtex_aux_re = re.compile(r"^\\(?:citation|bibdata|bibstyle|@input)\{.*$", re.MULTILINE)
+
+# search for the other .aux files an .aux file reads
+input_aux_re = re.compile(r"^\\@input\{([^}]*)\}", re.MULTILINE)
+
+# suffixes of the files (besides the .aux/.bcf file) that BibTeX and
+# Biber read
+bib_input_suffixes = ['.bib', '.bst']
+
 # search to find rerun warnings
 warning_rerun_str = r'(^LaTeX Warning:.*Rerun)|(^Package \w+ Warning:.*Rerun)'
 warning_rerun_re = re.compile(warning_rerun_str, re.MULTILINE)
@@ -188,6 +198,30 @@ def FindFile(name,suffixes,paths,env,requireExt: bool=False):
         print(" did not find '%s'" % name)
     return None
 
+def bib_inputs_signature(filename, content, deps):
+    """Return a signature of what BibTeX or Biber reads for *filename*.
+
+    *filename* is an .aux or .bcf file with the given *content*, *deps*
+    are the bibliography database and style nodes of the document.
+    Only the citation related lines of .aux files (and of the .aux files
+    they include) are used, as the rest changes with page numbers.
+    """
+    sigs = [node.get_csig() for node in deps]
+    if not filename.endswith('.aux'):
+        return SCons.Util.hash_collect(sigs + [SCons.Util.hash_signature(content)])
+    seen = set()
+    todo = [(filename, content)]
+    while todo:
+        filename, content = todo.pop(0)
+        seen.add(filename)
+        sigs.append(SCons.Util.hash_signature('\n'.join(bibtex_aux_re.findall(content))))
+        for name in input_aux_re.findall(content):
+            name = os.path.join(os.path.dirname(filename), name)
+            if name not in seen and os.path.isfile(name):
+                with open(name) as f:
+                    todo.append((name, f.read()))
+    return SCons.Util.hash_collect(sigs)
+
 def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None):
     """A builder for LaTeX files that checks the output in the aux file
     and decides how many times to use LaTeXAction, and BibTeXAction."""
@@ -247,20 +281,37 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
     if Verbose:
         print("hashes: ",saved_hashes)
 
+    # The hashes of the auxiliary files at the end of the last build that
+    # reached a fixed point, and for each .aux/.bcf file the signature of
+    # the bibliography inputs and the hash of the .bbl file made from them.
+    # They are kept in the .sconsign entry of the target.
+    stored = target[0].get_emitter_cache('latex', callerSuffix) or {}
+    stored_hashes = stored.get('hashes')
+    stored_bib = stored.get('bib', {})
+    bib_state = {}
+    bib_deps = [n for n in target[0].children()
+                if os.path.splitext(str(n))[1] in bib_input_suffixes]
+
     must_rerun_latex = True
 
     # .aux files already processed by BibTex
     already_bibtexed = []
 
-    def check_content_hash(filenode, suffix) -> bool:
+    def current_csig(filenode):
         """
-        Routine to update content hash and compare
+        Routine to get the content hash of a file that may have changed
         """
-        global must_rerun_latex
         # two calls to clear old csig
         filenode.clear_memoized_values()
         filenode.ninfo = filenode.new_ninfo()
-        new_md5 = filenode.get_csig()
+        return filenode.get_csig()
+
+    def check_content_hash(filenode, suffix) -> bool:
+        """
+        Routine to update content hash and compare
+        """
+        global must_rerun_latex
+        new_md5 = current_csig(filenode)
 
         if saved_hashes[suffix] == new_md5:
             if Verbose:
@@ -272,10 +323,29 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
             print("file %s changed, rerunning Latex, new hash = " % (targetbase+suffix), new_md5)
         return True     # changed
 
+    def run_bibliography(action, filename, content):
+        """
+        Routine to run BibTeX or Biber on the .aux or .bcf file *filename*,
+        unless the .bbl file was made from the same inputs by the last build
+        that reached a fixed point. Returns the action result.
+        """
+        bibfile = env.fs.File(SCons.Util.splitext(filename)[0])
+        bblfile = env.fs.File(SCons.Util.splitext(filename)[0] + '.bbl')
+        sig = bib_inputs_signature(filename, content, bib_deps)
+        if bblfile.exists() and stored_bib.get(filename) == (sig, current_csig(bblfile)):
+            if Verbose:
+                print("inputs of %s not changed, not running %s" % (bblfile, action))
+            bib_state[filename] = stored_bib[filename]
+            return 0
+        result = action(bibfile, bibfile, env)
+        bib_state[filename] = (sig, current_csig(bblfile))
+        return result
+
     # generate the file name that latex will generate
     resultfilename = targetbase + callerSuffix
 
     count = 0
+    fixed_point = False
 
     while must_rerun_latex and count < int(env.subst('$LATEXRETRIES')):
         result = XXXLaTeXAction(target, source, env)
@@ -339,8 +409,7 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
                     if 'bibdata' in content:
                         if Verbose:
                             print("Need to run bibtex on ",auxfilename)
-                        bibfile = env.fs.File(SCons.Util.splitext(target_aux)[0])
-                        result = BibTeXAction(bibfile, bibfile, env)
+                        result = run_bibliography(BibTeXAction, target_aux, content)
                         if result != 0:
                             check_file_error_message(env['BIBTEX'], 'blg')
                         check_content_hash(suffix_nodes[".bbl"], ".bbl")
@@ -363,8 +432,7 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
                     if 'bibdata' in content:
                         if Verbose:
                             print("Need to run biber on ",bcffilename)
-                        bibfile = env.fs.File(SCons.Util.splitext(target_bcf)[0])
-                        result = BiberAction(bibfile, bibfile, env)
+                        result = run_bibliography(BiberAction, target_bcf, content)
                         if result != 0:
                             check_file_error_message(env['BIBER'], 'blg')
                         check_content_hash(suffix_nodes[".bbl"], ".bbl")
@@ -425,7 +493,10 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
 
         # Now decide if latex will need to be run again due to newglossary command.
         for ng in newglossary_suffix:
-            if check_content_hash(suffix_nodes[ng[2]], ng[2]) or (count == 1):
+            made = (stored_hashes is not None
+                    and stored_hashes.get(ng[2]) == saved_hashes[ng[2]]
+                    and os.path.isfile(targetbase + ng[1]))
+            if check_content_hash(suffix_nodes[ng[2]], ng[2]) or (count == 1 and not made):
                 # We must run makeindex
                 if Verbose:
                     print("Need to run makeindex for newglossary")
@@ -443,6 +514,15 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
                     )
                     return result
 
+        # If this pass changed none of the auxiliary files, and they are
+        # what the last build ended with, we are at the same fixed point
+        # and running latex again would not resolve any warnings.
+        fixed_point = not must_rerun_latex
+        if fixed_point and saved_hashes == stored_hashes:
+            if Verbose:
+                print("auxiliary files at the stored fixed point, not rerunning Latex")
+            break
+
         # Now decide if latex needs to be run yet again to resolve warnings.
         if warning_rerun_re.search(logContent):
             must_rerun_latex = True
@@ -463,6 +543,10 @@ def InternalLaTeXAuxAction(XXXLaTeXAction, target = None, source= None, env=None
             print("reached max number of retries on Latex ,",int(env.subst('$LATEXRETRIES')))
 # end of while loop
 
+    if fixed_point:
+        target[0].set_emitter_cache('latex', callerSuffix,
+                                    {'hashes': saved_hashes, 'bib': bib_state})
+
     # rename Latex's output to what the target name is
     if not (str(target[0]) == resultfilename  and  os.path.isfile(resultfilename)):
         if os.path.isfile(resultfilename):
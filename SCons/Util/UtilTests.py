@@ -24,6 +24,7 @@
 from __future__ import annotations
 
 import io
+import json
 import os
 import subprocess
 import sys
@@ -50,6 +51,8 @@ from SCons.Util import (
     flatten,
     get_native_path,
     print_tree,
+    print_tree_dot,
+    print_tree_json,
     render_tree,
     silent_intern,
     splitext,
@@ -274,6 +277,55 @@ class UtilTestCase(unittest.TestCase):
         finally:
             sys.stdout = save_stdout
 
+    def test_print_tree_ids(self) -> None:
+        """Test the print_tree(), print_tree_json() and print_tree_dot() ids"""
+
+        def get_children(node):
+            return node.children
+
+        node, _, _ = self.tree_case_2()
+        save_stdout = sys.stdout
+        try:
+            sys.stdout = io.StringIO()
+            print_tree(node, get_children, ids=True)
+            expect = """\
++-blat.o #1
+  +-blat.c #2
+    +-blat.h #3
+    | +-stdlib.h #5
+    |   +-types.h #6
+    |   +-malloc.h #7
+    +-bar.h #4
+      +-[stdlib.h #5]
+"""
+            self.assertEqual(sys.stdout.getvalue(), expect)
+
+            sys.stdout = io.StringIO()
+            print_tree_json(node, get_children)
+            records = [json.loads(l) for l in sys.stdout.getvalue().splitlines()]
+            self.assertEqual(records, [
+                {'id': 1, 'name': 'blat.o', 'children': [2]},
+                {'id': 2, 'name': 'blat.c', 'children': [3, 4]},
+                {'id': 3, 'name': 'blat.h', 'children': [5]},
+                {'id': 5, 'name': 'stdlib.h', 'children': [6, 7]},
+                {'id': 6, 'name': 'types.h', 'children': []},
+                {'id': 7, 'name': 'malloc.h', 'children': []},
+                {'id': 4, 'name': 'bar.h', 'children': [5]},
+            ])
+
+            sys.stdout = io.StringIO()
+            print_tree_dot(self.Node('a "b"', [self.Node('c')]), get_children)
+            expect = """\
+digraph "a \\"b\\"" {
+  n1 [label="a \\"b\\""];
+  n1 -> n2;
+  n2 [label="c"];
+}
+"""
+            self.assertEqual(sys.stdout.getvalue(), expect)
+        finally:
+            sys.stdout = save_stdout
+
 
     def test_WhereIs(self) -> None:
         test = TestCmd.TestCmd(workdir='')
@@ -329,6 +329,7 @@ def print_tree(
     visited: dict | None = None,
     lastChild: bool = False,
     singleLineDraw: bool = False,
+    ids: bool | dict = False,
 ) -> None:
     """Print a tree of nodes.
 
@@ -350,9 +351,20 @@ def print_tree(
           *prune* is false, or in the whole tree if *prune* is true.
         lastChild: this is the last leaf of a branch
         singleLineDraw: use line-drawing characters rather than ASCII.
+        ids: like *prune*, but number the nodes, and refer back to a
+          subtree already printed by its number.  The numbers are those
+          of :func:`print_tree_json` and :func:`print_tree_dot`.  In
+          recursive calls, this is the dict of numbers given so far.
+
+    .. versionchanged:: 4.12.0
+       The *ids* parameter was added.
     """
 
     rname = str(root)
+    if ids:
+        prune = True
+        if ids is True:
+            ids = {rname: 1}
 
     # Initialize 'visited' dict, if required
     if visited is None:
@@ -418,16 +430,23 @@ def print_tree(
             else:
                 cross += BOX_HORIZ_DOWN
 
+    label = rname
+    if ids:
+        label += ' #%d' % ids[rname]
+
     if prune and rname in visited and children:
-        sys.stdout.write(''.join(tags + margins + [cross, '[', rname, ']']) + '\n')
+        sys.stdout.write(''.join(tags + margins + [cross, '[', label, ']']) + '\n')
         return
 
-    sys.stdout.write(''.join(tags + margins + [cross, rname]) + '\n')
-
     visited[rname] = 1
+    sys.stdout.write(''.join(tags + margins + [cross, label]) + '\n')
 
     # if this item has children:
     if children:
+        if ids:
+            # numbered when first seen, as by _walk_graph()
+            for C in children:
+                ids.setdefault(str(C), len(ids) + 1)
         margin.append(True)  # Initialize margin for vertical bar.
         idx = IDX(showtags)
         _child = 0  # Initialize this for the first child.
@@ -442,14 +461,106 @@ def print_tree(
                 visited,
                 (len(children) - _child) <= 0,
                 singleLineDraw,
+                ids,
             )
         # margins are with space (index 0) because we arrived to the last child.
         margin[-1] = False
         # for this call child and nr of children needs to be set 0, to signal the second phase.
-        print_tree(children[-1], child_func, prune, idx, margin, visited, True, singleLineDraw)
+        print_tree(children[-1], child_func, prune, idx, margin, visited, True, singleLineDraw, ids)
         margin.pop()  # destroy the last margin added
 
 
+def _node_status(node) -> dict:
+    """Returns the status flags shown by print_tree's *showtags* as a dict."""
+    return {
+        'exists': bool(node.exists()),
+        'repository_only': bool(node.rexists() and not node.exists()),
+        'builder': ('explicit' if node.has_explicit_builder() else
+                    'implicit' if node.has_builder() else None),
+        'side_effect': bool(node.side_effect),
+        'precious': bool(node.precious),
+        'always_build': bool(node.always_build),
+        'current': bool(node.is_up_to_date()),
+        'noclean': bool(node.noclean),
+        'nocache': bool(node.nocache),
+    }
+
+
+def _walk_graph(root, child_func):
+    """Walks the graph below *root*, visiting every node once.
+
+    Yields (id, node, child ids) in depth-first pre-order, in the order
+    :func:`print_tree` prints the nodes.  Ids are numbered from 1 and
+    assigned when a node is first seen, as by ``print_tree(ids=True)``,
+    so a node's children have ids before they are visited themselves.
+    """
+    ids = {str(root): 1}
+    done = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        name = str(node)
+        if name in done:
+            continue
+        done.add(name)
+        children = child_func(node)
+        kids = []
+        for child in children:
+            cname = str(child)
+            cid = ids.get(cname)
+            if cid is None:
+                cid = ids[cname] = len(ids) + 1
+            kids.append(cid)
+        yield ids[name], node, list(dict.fromkeys(kids))
+        stack.extend(reversed(children))
+
+
+def print_tree_json(root, child_func, showtags: int = 0) -> None:
+    """Print the graph below a node as JSON lines.
+
+    Each node is printed once, as a JSON object on a line of its own
+    with its ``id``, ``name`` and the ids of its ``children``, so the
+    output grows linearly with the size of the graph.  The root has id 1.
+
+    Args:
+        root: the root node of the tree
+        child_func: the function called to get the children of a node
+        showtags: add the node's status flags (see :func:`print_tree`)
+          as a ``status`` object.
+
+    .. versionadded:: 4.12.0
+    """
+    import json  # pylint: disable=import-outside-toplevel
+
+    write = sys.stdout.write
+    for nid, node, kids in _walk_graph(root, child_func):
+        record = {'id': nid, 'name': str(node), 'children': kids}
+        if showtags:
+            record['status'] = _node_status(node)
+        write(json.dumps(record) + '\n')
+
+
+def print_tree_dot(root, child_func) -> None:
+    """Print the graph below a node in Graphviz DOT format.
+
+    Each node is printed once, as ``nID [label="name"];``, followed by
+    its edges, so the output grows linearly with the size of the graph.
+
+    .. versionadded:: 4.12.0
+    """
+    write = sys.stdout.write
+    write('digraph "%s" {\n' % _dot_escape(str(root)))
+    for nid, node, kids in _walk_graph(root, child_func):
+        write('  n%d [label="%s"];\n' % (nid, _dot_escape(str(node))))
+        for kid in kids:
+            write('  n%d -> n%d;\n' % (nid, kid))
+    write('}\n')
+
+
+def _dot_escape(s: str) -> str:
+    return s.replace('\\', '\\\\').replace('"', '\\"')
+
+
 def do_flatten(  # pylint: disable=redefined-outer-name,redefined-builtin
     sequence,
     result,
@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import codecs
 import os
-import pprint
 import re
 import sys
 
@@ -287,6 +286,7 @@ def to_String_for_signature(  # pylint: disable=redefined-outer-name,redefined-b
             # which was undefined until py3.6 (where it's by insertion order)
             # was not wise.
             # TODO: Change code when floor is raised to PY36
+            import pprint  # pylint: disable=import-outside-toplevel
             return pprint.pformat(obj, width=1000000)
         return to_String_for_subst(obj)
     return f()
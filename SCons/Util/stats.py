@@ -40,20 +40,27 @@ There are basically two types of stats:
 2. Counter. Counting the number of events and/or objects created. This
    would likely only be reported at the end of a given SCons run,
    though it might be useful to query during a run.
+
+Additionally, a trace of timed spans (SConscript reading, scanning,
+signature computation, Taskmaster, cache and sconsign activity) can be
+recorded and written in the Chrome/Perfetto trace-event JSON format.
 """
 
 from abc import ABC
 
+import os
 import platform
 import json
 import sys
-from datetime import datetime
+import threading
+import time
 
 import SCons.Debug
 
 all_stats = {}
 ENABLE_JSON = False
 JSON_OUTPUT_FILE = 'scons_stats.json'
+TRACE_OUTPUT_FILE = 'scons_trace.json'
 
 def add_stat_type(name, stat_object):
     """Add a statistic type to the global collection"""
@@ -154,9 +161,122 @@ class TimeStats(Stats):
                                   'duration': finish_time - start_time}
 
 
+class _NullSpan:
+    """Do-nothing context manager used while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+_null_span = _NullSpan()
+
+
+class _TraceSpan:
+    """Context manager recording one complete ("X") trace event."""
+
+    __slots__ = ('stats', 'cat', 'name', 'node', 'start')
+
+    def __init__(self, stats, cat, name, node) -> None:
+        self.stats = stats
+        self.cat = cat
+        self.name = name
+        self.node = node
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stats.add_span(self.cat, self.name, self.start,
+                            time.perf_counter_ns(), self.node)
+
+
+class TraceStats(Stats):
+    """Timeline of SCons internal activity in trace-event format.
+
+    Spans are recorded per thread, so in a parallel build each worker
+    shows up as its own track when the output is loaded into
+    ``chrome://tracing`` or https://ui.perfetto.dev.  Use as::
+
+        with trace_stats.span('scan', 'children', node):
+            ...
+
+    While not enabled, :meth:`span` returns a shared do-nothing context
+    manager, so instrumented code paths cost only a method call.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+        self.threads = {}
+        self.threads_lock = threading.Lock()
+        self.span = self.null_span
+        self.start = time.perf_counter_ns()
+
+    def enable(self, outfp=None):
+        super().enable(outfp)
+        self.span = self.do_span
+        self.add_thread(threading.current_thread())
+
+    def add_thread(self, thread):
+        """Assign a small, stable track id to *thread*."""
+        with self.threads_lock:
+            tid = self.threads.get(thread.ident)
+            if tid is None:
+                tid = self.threads[thread.ident] = (len(self.threads), thread.name)
+        return tid
+
+    def null_span(self, cat, name, node=None):
+        return _null_span
+
+    def do_span(self, cat, name, node=None):
+        return _TraceSpan(self, cat, name, node)
+
+    def add_span(self, cat, name, start, end, node=None) -> None:
+        """Record a span which ran from *start* to *end* (in ns)."""
+        tid = self.threads.get(threading.get_ident())
+        if tid is None:
+            tid = self.add_thread(threading.current_thread())
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': (start - self.start) / 1000,
+            'dur': (end - start) / 1000,
+            'tid': tid[0],
+        }
+        if node is not None:
+            event['args'] = {'node': str(node)}
+        # list.append is atomic, so no lock is needed for worker threads
+        self.events.append(event)
+
+    def trace_events(self):
+        """Return the complete trace-event structure."""
+        pid = os.getpid()
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+             'args': {'name': 'scons'}},
+        ]
+        for tid, name in self.threads.values():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                           'tid': tid, 'args': {'name': name}})
+        for event in self.events:
+            event['pid'] = pid
+            events.append(event)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def do_print(self):
+        with open(TRACE_OUTPUT_FILE, 'w') as tf:
+            json.dump(self.trace_events(), tf)
+
+
 count_stats = CountStats()
 memory_stats = MemStats()
 time_stats = TimeStats()
+trace_stats = TraceStats()
 
 
 def write_scons_stats_file():
@@ -172,6 +292,8 @@ def write_scons_stats_file():
         ARGUMENTS,
         ARGLIST,
     )
+    import datetime  # pylint: disable=import-outside-toplevel
+
     # print(f"DUMPING JSON FILE: {JSON_OUTPUT_FILE}")
     json_structure = {}
     if count_stats.enabled:
@@ -201,7 +323,7 @@ def write_scons_stats_file():
         'ARGLIST' : [ str(al) for al in ARGLIST],
         'COMMAND_LINE_TARGETS' : [ str(clt) for clt in COMMAND_LINE_TARGETS],
         'ARGV' : sys.argv,
-        'TIME' : datetime.now().isoformat(),
+        'TIME' : datetime.datetime.now().isoformat(),
         'HOST' : platform.node(),
         'PYTHON_VERSION' : {
             'major' : sys.version_info.major,
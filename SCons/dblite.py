@@ -35,6 +35,7 @@ import os
 import pickle
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from SCons.compat import PICKLE_PROTOCOL
 
@@ -53,6 +54,8 @@ def corruption_warning(filename) -> None:
 
 DBLITE_SUFFIX = ".dblite"
 TMP_SUFFIX = ".tmp"
+SHARDS_SUFFIX = ".shards"
+KEYS_INDEX = "keys.index"
 
 
 class _Dblite:
@@ -263,10 +266,216 @@ class _Dblite:
         return len(self._dict)
 
 
+def _shard_name(key) -> str:
+    """Return the name of the shard holding *key*.
+
+    Keys are directory paths relative to the top of the project: they
+    are sharded by their first path component.  The top directory
+    itself and directories outside the project get shards of their own.
+    """
+    if os.path.isabs(key):
+        return 'external'
+    head = key.replace('\\', '/').split('/', 1)[0]
+    if head in ('', '.'):
+        return 'root'
+    if head == '..':
+        return 'external'
+    return 'd_' + head
+
+
+class _ShardedDblite:
+    """Signature database split into one :class:`_Dblite` per shard.
+
+    The shards are kept as separate files in a directory named from
+    *file_base_name* plus ``.shards``.  A shard is only read the first
+    time one of its keys is used, and :meth:`sync` only writes the
+    shards that changed.  Each shard file is an ordinary dblite
+    database.  The changed shards are written by a pool of threads,
+    which overlaps the file I/O; pickling holds the GIL, so it is not
+    sped up.  The keys of each shard are also kept in a small index
+    file, so :meth:`keys` does not read the shards.
+
+    The *flag* and *mode* arguments are as for :class:`_Dblite`.
+    """
+
+    def __init__(self, file_base_name, flag='r', mode=0o666) -> None:
+        assert flag in ("r", "w", "c", "n")
+
+        self._dir_name = file_base_name + SHARDS_SUFFIX
+        self._flag = flag
+        self._mode = mode
+        self._shards = {}
+
+        if flag in ("r", "w"):
+            if not os.path.isdir(self._dir_name):
+                raise FileNotFoundError(
+                    f"No such database directory: '{self._dir_name}'"
+                )
+        else:
+            os.makedirs(self._dir_name, exist_ok=True)
+            if flag == "n":
+                for name in self._shard_names():
+                    os.unlink(self._shard_path(name))
+
+    def _shard_path(self, name) -> str:
+        return os.path.join(self._dir_name, name + DBLITE_SUFFIX)
+
+    def _shard_names(self):
+        return [
+            entry[:-len(DBLITE_SUFFIX)]
+            for entry in os.listdir(self._dir_name)
+            if entry.endswith(DBLITE_SUFFIX)
+        ]
+
+    def _shard(self, name):
+        """Return the named shard, reading it on first use.
+
+        Returns ``None`` for a shard which does not exist in a
+        read-only database.
+        """
+        try:
+            return self._shards[name]
+        except KeyError:
+            pass
+        flag = "r" if self._flag == "r" else "c"
+        try:
+            shard = _Dblite(self._shard_path(name), flag, self._mode)
+        except FileNotFoundError:
+            shard = None
+        self._shards[name] = shard
+        return shard
+
+    def _all_shards(self):
+        for name in self._shard_names():
+            self._shard(name)
+        return [shard for shard in self._shards.values() if shard is not None]
+
+    def _shard_stamp(self, name):
+        """Return what identifies the current contents of a shard file."""
+        st = os.stat(self._shard_path(name))
+        return st.st_mtime_ns, st.st_size
+
+    def _read_keys_index(self) -> dict:
+        """Return the keys index: shard name -> (stamp, keys)."""
+        try:
+            with io.open(os.path.join(self._dir_name, KEYS_INDEX), 'rb') as f:
+                index = pickle.load(f)
+        except Exception:
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_keys_index(self, shards) -> None:
+        """Record the keys of the just written *shards* in the keys index."""
+        index = self._read_keys_index()
+        for name, shard in shards.items():
+            try:
+                index[name] = (self._shard_stamp(name), list(shard.keys()))
+            except OSError:
+                index.pop(name, None)
+        path = os.path.join(self._dir_name, KEYS_INDEX)
+        try:
+            with io.open(path + TMP_SUFFIX, 'wb') as f:
+                pickle.dump(index, f, PICKLE_PROTOCOL)
+            os.replace(path + TMP_SUFFIX, path)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        if self._flag != "r":
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush the changed shards to disk, concurrently if several changed."""
+        self._check_writable()
+        dirty = {
+            name: shard for name, shard in self._shards.items()
+            if shard is not None and shard._needs_sync
+        }
+        if len(dirty) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(dirty), 8)) as pool:
+                for _ in pool.map(_Dblite.sync, dirty.values()):
+                    pass
+        elif dirty:
+            next(iter(dirty.values())).sync()
+        if dirty:
+            self._write_keys_index(dirty)
+
+    def _check_writable(self):
+        if self._flag == "r":
+            raise OSError(f"Read-only database: {self._dir_name}")
+
+    def __getitem__(self, key):
+        shard = self._shard(_shard_name(key))
+        if shard is None:
+            raise KeyError(key)
+        return shard[key]
+
+    def __setitem__(self, key, value):
+        self._check_writable()
+
+        if not isinstance(key, str):
+            raise TypeError(f"key `{key}' must be a string but is {type(key)}")
+
+        self._shard(_shard_name(key))[key] = value
+
+    def __delitem__(self, key):
+        shard = self._shard(_shard_name(key))
+        if shard is None:
+            raise KeyError(key)
+        del shard[key]
+
+    def keys(self):
+        """Return the keys of all shards.
+
+        The keys of shards which are not loaded are taken from the keys
+        index, as long as the shard file did not change since it was
+        recorded, so listing the keys does not read the shards.
+        """
+        index = self._read_keys_index()
+        keys = []
+        for name in set(self._shard_names()) | set(self._shards):
+            if name not in self._shards:
+                try:
+                    stamp, shard_keys = index[name]
+                    if stamp == self._shard_stamp(name):
+                        keys.extend(shard_keys)
+                        continue
+                except (KeyError, TypeError, ValueError, OSError):
+                    pass
+            shard = self._shard(name)
+            if shard is not None:
+                keys.extend(shard.keys())
+        return keys
+
+    def items(self):
+        return [item for shard in self._all_shards() for item in shard.items()]
+
+    def values(self):
+        return [value for shard in self._all_shards() for value in shard.values()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, key) -> bool:
+        shard = self._shard(_shard_name(key))
+        return shard is not None and key in shard
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._all_shards())
+
+
 def open(file, flag="r", mode: int = 0o666):  # pylint: disable=redefined-builtin
     return _Dblite(file, flag, mode)
 
 
+def open_sharded(file, flag="r", mode: int = 0o666):
+    """Open a database sharded by top-level directory.
+
+    .. versionadded:: 4.12.0
+    """
+    return _ShardedDblite(file, flag, mode)
+
+
 def _exercise():
     db = open("tmp", "n")
     assert len(db) == 0
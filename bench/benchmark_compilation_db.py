@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Compilation database benchmark for SCons.
+
+Generates a synthetic tree with many C sources and times writing
+``compile_commands.json`` (the command execution time reported by
+``--debug=time``) in three situations:
+
+1. a fresh build, where every command line is expanded
+2. a rebuild where nothing changed
+3. a rebuild where the construction environment of one object changed
+
+Usage:  python bench/benchmark_compilation_db.py [-n ENTRIES] [-r RUNS]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCONS = os.path.join(ROOT, 'scripts', 'scons.py')
+
+SCONSTRUCT = """\
+DefaultEnvironment(tools=[])
+env = Environment(tools=['gcc'], CC='cc', CPPPATH=['include', 'src'],
+                  CPPDEFINES=['NDEBUG', ('VERSION', 3)], CCFLAGS=['-O2', '-Wall'])
+env.Tool('compilation_db')
+env.CompilationDatabase()
+for i in range(%(entries)d):
+    kw = {}
+    if i == 0:
+        kw['CPPDEFINES'] = ARGUMENTS.get('FIRST', [])
+    env.Object('src/d%%d/f%%d.c' %% (i %% 100, i), **kw)
+"""
+
+COMMAND_TIME_RE = re.compile(r'Total command execution time: ([\d.]+) seconds')
+
+
+def run(cwd, *args):
+    """Run scons, return (wall seconds, command execution seconds)."""
+    start = time.perf_counter()
+    cp = subprocess.run(
+        [sys.executable, SCONS, '-Q', '--debug=time', 'compile_commands.json'] + list(args),
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        universal_newlines=True, check=True,
+    )
+    wall = time.perf_counter() - start
+    return wall, float(COMMAND_TIME_RE.search(cp.stdout).group(1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--entries', type=int, default=50000,
+                        help="number of compilation database entries")
+    parser.add_argument('-r', '--runs', type=int, default=3,
+                        help="runs per situation (best is reported)")
+    args = parser.parse_args()
+
+    print("SCons Compilation Database Benchmark (%d entries)" % args.entries)
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, 'SConstruct'), 'w') as f:
+            f.write(SCONSTRUCT % {'entries': args.entries})
+
+        def fresh():
+            os.unlink(os.path.join(tmpdir, '.sconsign.dblite'))
+            return run(tmpdir)
+
+        def toggle(state=[0]):
+            state[0] += 1
+            return run(tmpdir, 'FIRST=F%d' % state[0])
+
+        run(tmpdir)
+        for name, func in [
+            ("fresh database", fresh),
+            ("nothing changed", lambda: run(tmpdir)),
+            ("one entry changed", toggle),
+        ]:
+            wall, command = min((func() for _ in range(args.runs)),
+                                key=lambda r: r[1])
+            print()
+            print(name)
+            print(f"  Wall time:  {wall:8.2f} s")
+            print(f"  Write time: {command:8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
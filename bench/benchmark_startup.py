@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Startup benchmark for SCons.
+
+Reports the time spent importing modules (via ``python -X importtime``)
+and the total wall-clock time for the common entry points:
+
+1. ``import SCons.Script`` (what every SConstruct-driven run pays)
+2. ``scons --version``
+3. ``scons -h`` on a trivial SConstruct
+4. ``scons -q`` on a trivial, up-to-date SConstruct
+
+Each entry point is run several times and the best result is reported,
+along with the slowest modules (by cumulative import time) of that run.
+
+Usage:  python bench/benchmark_startup.py [-n RUNS] [-t TOP]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCONS = os.path.join(ROOT, 'scripts', 'scons.py')
+
+SCONSTRUCT = """\
+env = Environment(tools=[])
+env.Command('out.txt', 'SConstruct', Copy('$TARGET', '$SOURCE'))
+"""
+
+ENTRY_POINTS = [
+    ("import SCons.Script", ['-c', 'import SCons.Script']),
+    ("scons --version", [SCONS, '--version']),
+    ("scons -h", [SCONS, '-h']),
+    ("scons -q", [SCONS, '-q']),
+]
+
+
+def parse_importtime(text):
+    """Parse ``-X importtime`` output.
+
+    Returns the total import time in microseconds (sum of the top-level
+    cumulative times) and a list of (cumulative_us, module) tuples.
+    """
+    total = 0
+    modules = []
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self_us, cumulative, name = line[len('import time:'):].split('|')
+        cumulative = int(cumulative)
+        if not name.startswith('  '):
+            # top-level import: its cumulative time covers its children
+            total += cumulative
+        modules.append((cumulative, name.strip()))
+    return total, modules
+
+
+def run(args, cwd):
+    """Run one entry point, return (wall seconds, import us, modules)."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    start = time.perf_counter()
+    cp = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, universal_newlines=True,
+    )
+    wall = time.perf_counter() - start
+    total, modules = parse_importtime(cp.stderr)
+    return wall, total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                        help="runs per entry point (best is reported)")
+    parser.add_argument('-t', '--top', type=int, default=10,
+                        help="number of slowest modules to show")
+    args = parser.parse_args()
+
+    print("SCons Startup Benchmark")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, 'SConstruct'), 'w') as f:
+            f.write(SCONSTRUCT)
+        # build once so "scons -q" measures an up-to-date tree, and
+        # so the bytecode caches are populated before timing.
+        run([SCONS, '-Q'], tmpdir)
+
+        for name, cmd in ENTRY_POINTS:
+            best = min((run(cmd, tmpdir) for _ in range(args.runs)),
+                       key=lambda r: r[1])
+            wall, total, modules = best
+            print()
+            print(name)
+            print(f"  Wall time:   {wall * 1000:8.1f} ms")
+            print(f"  Import time: {total / 1000:8.1f} ms")
+            print(f"  Modules:     {len(modules):8d}")
+            print(f"  Slowest {args.top} (cumulative):")
+            for cumulative, module in sorted(modules, reverse=True)[:args.top]:
+                print(f"    {cumulative / 1000:8.1f} ms  {module}")
+
+
+if __name__ == '__main__':
+    main()
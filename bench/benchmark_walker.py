@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Dependency walk benchmark for SCons.
+
+Walks a synthetic dependency graph with ``SCons.Node.Walker`` and
+reports the time taken.  The graph is a tree of lightweight node
+objects (the Walker only needs hashable nodes and a *kids_func*) with
+roughly the requested number of edges; a fraction of the edges can be
+made to point back to shared leaves, as header files are in real builds.
+
+For comparison, the same graph is also walked with a copy of the
+previous Walker algorithm, which copied every child list and popped
+children from its front.
+
+Usage:  python bench/benchmark_walker.py [-e EDGES] [-b BRANCHING] [-n RUNS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from SCons.Node import Walker
+
+
+class FakeNode:
+    """Just enough of a Node for the Walker."""
+
+    __slots__ = ('kids', 'wkids')
+
+    def __init__(self) -> None:
+        self.kids = []
+        self.wkids = None
+
+
+def kids_func(node, parent):
+    return node.kids
+
+
+class LegacyWalker:
+    """The Walker as it was before 4.12.0, kept for comparison."""
+
+    def __init__(self, node, kids_func) -> None:
+        self.kids_func = kids_func
+        node.wkids = list(kids_func(node, None))
+        self.stack = [node]
+        self.history = {node: None}
+
+    def get_next(self):
+        while self.stack:
+            if self.stack[-1].wkids:
+                node = self.stack[-1].wkids.pop(0)
+                if not self.stack[-1].wkids:
+                    self.stack[-1].wkids = None
+                if node in self.history:
+                    pass
+                else:
+                    node.wkids = list(self.kids_func(node, self.stack[-1]))
+                    self.stack.append(node)
+                    self.history[node] = None
+            else:
+                node = self.stack.pop()
+                del self.history[node]
+                return node
+        return None
+
+
+def build_graph(edges, branching, shared):
+    """Return the root of a synthetic graph with about *edges* edges.
+
+    Every interior node gets *branching* children; in addition, each
+    leaf-level parent links to *shared* nodes from a common pool.
+    """
+    root = FakeNode()
+    pool = [FakeNode() for _ in range(shared)]
+    count = 0
+    level = [root]
+    while count < edges:
+        next_level = []
+        for parent in level:
+            for _ in range(branching):
+                child = FakeNode()
+                parent.kids.append(child)
+                next_level.append(child)
+            parent.kids.extend(pool)
+            count += branching + shared
+            if count >= edges:
+                break
+        level = next_level
+    return root, count
+
+
+def walk(walker_class, root):
+    """Walk the graph from *root*, return (seconds, nodes visited)."""
+    start = time.perf_counter()
+    walker = walker_class(root, kids_func)
+    visited = 0
+    while walker.get_next() is not None:
+        visited += 1
+    return time.perf_counter() - start, visited
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-e', '--edges', type=int, default=1_000_000,
+                        help="approximate number of edges in the graph")
+    parser.add_argument('-b', '--branching', type=int, default=8,
+                        help="children per interior node")
+    parser.add_argument('-s', '--shared', type=int, default=2,
+                        help="shared leaves linked from every parent")
+    parser.add_argument('-n', '--runs', type=int, default=3,
+                        help="runs per walker (best is reported)")
+    args = parser.parse_args()
+
+    print("SCons Walker Benchmark")
+    print("=" * 60)
+    root, edges = build_graph(args.edges, args.branching, args.shared)
+    print(f"Edges: {edges}")
+    for name, walker_class in (("Walker", Walker), ("legacy", LegacyWalker)):
+        seconds, visited = min(walk(walker_class, root)
+                               for _ in range(args.runs))
+        print(f"  {name:8s} {seconds * 1000:10.1f} ms  ({visited} nodes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Verify that $BATCH_SIZE limits the number of targets collected into one
+batch, and that long batched command lines are passed through TEMPFILE.
+"""
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+_python_ = TestSCons._python_
+
+test.write('batch_build.py', """\
+import os
+import sys
+dir = sys.argv[1]
+for infile in sys.argv[2:]:
+    inbase = os.path.splitext(os.path.split(infile)[1])[0]
+    outfile = os.path.join(dir, inbase+'.out')
+    with open(outfile, 'wb') as f, open(infile, 'rb') as infp:
+            f.write(infp.read())
+sys.exit(0)
+""")
+
+test.write('SConstruct', """
+DefaultEnvironment(tools=[])
+env = Environment(tools=[], BATCH_SIZE=ARGUMENTS.get('BATCH_SIZE'))
+env['BATCH_BUILD'] = 'batch_build.py'
+env['BATCHCOM'] = r'%(_python_)s $BATCH_BUILD ${TARGET.dir} $CHANGED_SOURCES'
+bb = Action('$BATCHCOM', batch_key=True, targets='CHANGED_TARGETS')
+env['BUILDERS']['Batch'] = Builder(action=bb)
+for name in ['f1', 'f2', 'f3', 'f4', 'f5']:
+    env.Batch('out/%%s.out' %% name, '%%s.in' %% name)
+
+tmp = Environment(tools=[], BATCH_SIZE=2, MAXLINELENGTH=16)
+tmp['_BATCHCOM'] = r'%(_python_)s batch_build.py ${TARGET.dir} $CHANGED_SOURCES'
+tmp['BATCHCOM'] = '${TEMPFILE("$_BATCHCOM")}'
+tb = Action('$BATCHCOM', batch_key=True, targets='CHANGED_TARGETS')
+tmp['BUILDERS']['Batch'] = Builder(action=tb)
+for name in ['t1', 't2', 't3']:
+    tmp.Batch('tmp/%%s.out' %% name, '%%s.in' %% name)
+""" % locals())
+
+for name in ['f1', 'f2', 'f3', 'f4', 'f5', 't1', 't2', 't3']:
+    test.write(name + '.in', name + ".in\n")
+
+test.run(arguments='BATCH_SIZE=2 out')
+test.must_contain_all_lines(test.stdout(), [
+    'batch_build.py out f1.in f2.in\n',
+    'batch_build.py out f3.in f4.in\n',
+    'batch_build.py out f5.in\n',
+])
+for name in ['f1', 'f2', 'f3', 'f4', 'f5']:
+    test.must_match(['out', name + '.out'], name + ".in\n")
+
+test.up_to_date(options='BATCH_SIZE=2', arguments='out')
+
+# Without a limit, everything is in one batch.
+test.run(arguments='-c out')
+test.run(arguments='out')
+test.must_contain_all_lines(test.stdout(), [
+    'batch_build.py out f1.in f2.in f3.in f4.in f5.in\n',
+])
+
+test.run(arguments='BATCH_SIZE=x out', status=2, stderr=None)
+test.must_contain_all_lines(test.stderr(),
+                            ["BATCH_SIZE must be an integer, not 'x'"])
+
+# Long batched command lines go through a temporary file.
+test.run(arguments='-n tmp')
+test.must_contain_all_lines(test.stdout(), [
+    'batch_build.py tmp t1.in t2.in\n',
+    'batch_build.py tmp t3.in\n',
+])
+test.fail_test(test.stdout().count('Using tempfile') != 2)
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Test that CC_BATCH compiles the objects of a directory in one gcc call,
+passing only the out-of-date sources.
+
+This is a live test, uses gcc.
+"""
+
+import TestSCons
+
+_exe = TestSCons._exe
+
+test = TestSCons.TestSCons()
+
+if not test.where_is('gcc'):
+    test.skip_test("Could not find 'gcc', skipping test.\n")
+
+test.subdir('src', ['src', 'include'])
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+env = Environment(tools=['gcc', 'gnulink'], CC_BATCH=1,
+                  BATCH_SIZE=int(ARGUMENTS.get('BATCH_SIZE', 0)),
+                  CPPPATH=['#src/include'], CPPDEFINES=['GREETING=\\\\"hi\\\\"'])
+env.Program('src/prog', ['src/a.c', 'src/b.c', 'src/main.c'])
+""")
+
+test.write(['src', 'include', 'ab.h'], """\
+void a(void);
+void b(void);
+""")
+
+for name in ('a', 'b'):
+    test.write(['src', name + '.c'], f"""\
+#include <stdio.h>
+#include "ab.h"
+void {name}(void) {{ printf("{name}: %s\\n", GREETING); }}
+""")
+
+test.write(['src', 'main.c'], """\
+#include "ab.h"
+int main(void) { a(); b(); return 0; }
+""")
+
+prog = test.workpath('src', 'prog' + _exe)
+
+test.run(arguments='-Q .')
+lines = [l for l in test.stdout().splitlines() if ' -c ' in l]
+test.fail_test(len(lines) != 1, message=test.stdout())
+for name in ('a.c', 'b.c', 'main.c'):
+    test.must_contain_all(lines[0], test.workpath('src', name))
+test.run(program=prog, stdout="a: hi\nb: hi\n")
+
+test.up_to_date(arguments='.')
+
+# Only the changed source is passed to the compiler.
+test.write(['src', 'b.c'], """\
+#include <stdio.h>
+#include "ab.h"
+void b(void) { printf("b: changed\\n"); }
+""")
+test.run(arguments='-Q .')
+lines = [l for l in test.stdout().splitlines() if ' -c ' in l]
+test.fail_test(len(lines) != 1, message=test.stdout())
+test.must_contain_all(lines[0], test.workpath('src', 'b.c'))
+test.must_not_contain_any_line(lines[0], [test.workpath('src', 'a.c')])
+test.run(program=prog, stdout="a: hi\nb: changed\n")
+
+# BATCH_SIZE splits the batch.
+test.run(arguments='-Q -c .')
+test.run(arguments='-Q BATCH_SIZE=2 .')
+lines = [l for l in test.stdout().splitlines() if ' -c ' in l]
+test.fail_test(len(lines) != 2, message=test.stdout())
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test that rebuilding a CompilationDatabase only expands the commands
+of the entries whose construction environment changed.
+"""
+
+import json
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+
+FLAG = ARGUMENTS.get('FLAG', '')
+
+def counted(target, source, env, for_signature):
+    with open('expanded.txt', 'a') as f:
+        f.write('%s\\n' % source[0])
+    return FLAG
+
+if ARGUMENTS.get('REPO'):
+    Repository('repo')
+
+env = Environment(CC='mycc', CCFLAGS='$_COUNTED', _COUNTED=counted,
+                  CPPPATH=['inc'], tools=['gcc'])
+env.Tool('compilation_db')
+env.CompilationDatabase()
+env.Object('foo.c', CPPDEFINES=ARGUMENTS.get('FOO', []))
+env.Object('bar.c')
+""")
+
+test.subdir('inc', 'repo', ['repo', 'inc'])
+test.write('foo.c', "int foo;\n")
+test.write('bar.c', "int bar;\n")
+
+def commands():
+    with open(test.workpath('compile_commands.json')) as f:
+        return {entry['file']: entry['command'] for entry in json.load(f)}
+
+test.run(arguments='compile_commands.json')
+test.must_match('expanded.txt', "foo.c\nbar.c\n", mode='r')
+first = commands()
+test.fail_test('-DFOO' in first['foo.c'])
+test.unlink('expanded.txt')
+
+# Nothing changed: the entries are reused.
+test.run(arguments='compile_commands.json')
+test.must_not_exist('expanded.txt')
+test.fail_test(commands() != first)
+
+# Only the environment of foo.o changed.
+test.run(arguments='compile_commands.json FOO=FOO')
+test.must_match('expanded.txt', "foo.c\n", mode='r')
+second = commands()
+test.fail_test('-DFOO' not in second['foo.c'])
+test.fail_test(second['bar.c'] != first['bar.c'])
+test.unlink('expanded.txt')
+
+# A global the function refers to changed.
+test.run(arguments='compile_commands.json FOO=FOO FLAG=-O2')
+test.must_match('expanded.txt', "foo.c\nbar.c\n", mode='r')
+third = commands()
+test.fail_test('-O2' not in third['bar.c'])
+test.unlink('expanded.txt')
+
+# The code of the function changed.
+test.write('SConstruct', test.read('SConstruct', mode='r').replace(
+    'return FLAG', "return FLAG + ' -g'"))
+test.run(arguments='compile_commands.json FOO=FOO FLAG=-O2')
+test.must_match('expanded.txt', "foo.c\nbar.c\n", mode='r')
+test.fail_test('-O2 -g' not in commands()['bar.c'])
+test.unlink('expanded.txt')
+
+# A Repository adds its include directories.
+test.run(arguments='compile_commands.json FOO=FOO FLAG=-O2 REPO=1')
+test.must_match('expanded.txt', "foo.c\nbar.c\n", mode='r')
+test.fail_test('-Irepo' not in commands()['bar.c'].replace('-I ', '-I'))
+
+test.pass_test()
+
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
+
+"""
+Test that the checks queued in a Configure Batch() give the same
+results, output, log and config.h as checks run one after another,
+and that a result cannot be read before its batch has run.
+"""
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.write("SConstruct", """\
+import SCons.Errors
+
+DefaultEnvironment(tools=[])
+env = Environment()
+conf = Configure(env, config_h='config.h')
+with conf.Batch(num_jobs=4) as b:
+    r1 = b.CheckCHeader('math.h')
+    r2 = b.CheckCHeader('no_such_header_here.h')
+    r3 = b.CheckFunc('strlen')
+    r4 = b.CheckTypeSize('char')
+    try:
+        r1.result
+    except SCons.Errors.UserError as e:
+        print("early: %s" % e)
+print("math.h: %s" % r1.result)
+print("missing.h: %s" % r2.result)
+print("strlen: %s" % r3.result)
+print("char: %s" % r4.result)
+env = conf.Finish()
+""")
+
+expect = [
+    "early: The result of CheckCHeader is not available until its batch has run",
+    "math.h: True",
+    "missing.h: False",
+    "strlen: True",
+    "char: 1",
+]
+
+checks = [
+    "Checking for C header file math.h... ",
+    "Checking for C header file no_such_header_here.h... ",
+    "Checking for C function strlen()... ",
+    "Checking size of char ... ",
+]
+
+test.run(arguments='.')
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_not_contain_any_line(test.stdout(), ['(cached)'])
+test.must_contain_all_lines(test.stdout(), checks)
+positions = [test.stdout().find(c) for c in checks]
+test.fail_test(positions != sorted(positions),
+               message="checks ran out of order")
+
+config_h = test.read('config.h', mode='r')
+defines = ["#define HAVE_MATH_H 1",
+           "/* #undef HAVE_NO_SUCH_HEADER_HERE_H */",
+           "#define HAVE_STRLEN 1",
+           "#define SIZEOF_CHAR 1"]
+test.must_contain_all_lines(config_h, defines)
+positions = [config_h.find(d) for d in defines]
+test.fail_test(positions != sorted(positions),
+               message="config.h is out of order:\n%s" % config_h)
+
+log = test.read('config.log', mode='r')
+positions = [log.find(c.rstrip('. ')) for c in checks]
+test.fail_test(-1 in positions or positions != sorted(positions),
+               message="config.log is out of order:\n%s" % log)
+test.must_contain('config.log', "no_such_header_here.h")
+
+# the second run finds all the results up to date, and says so only
+# after each check
+for arguments in ['.', '-j4 .']:
+    test.run(arguments=arguments)
+    test.must_contain_all_lines(test.stdout(), expect)
+    test.must_contain_all_lines(test.stdout(), [c + "(cached) " for c in checks])
+    test.must_not_contain_any_line(test.stdout(), ["(cached) Checking"])
+
+test.pass_test()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
+"""
+Test that configure check results are replayed from the results cache
+given by $CONFIGURECACHE in a fresh checkout, without running any tool,
+also when the checks are run in a Batch().
+"""
+
+import glob
+import shutil
+
+import TestSCons
+
+_obj = TestSCons._obj
+
+test = TestSCons.TestSCons()
+
+test.write("SConstruct", """\
+DefaultEnvironment(tools=[])
+env = Environment(CONFIGURECACHE='#confcache', CPPPATH=['inc'],
+                  CCFLAGS=ARGUMENTS.get('CCFLAGS', ''))
+
+def CheckOutput(context):
+    context.Message('Checking program output ... ')
+    ok, out = context.TryRun('''
+#include <stdio.h>
+int main(void) { printf("hello"); return 0; }
+''', '.c')
+    context.Result(out)
+    return out
+
+def CheckAction(context):
+    context.Message('Checking action output ... ')
+    ok, out = context.TryAction(Copy('$TARGET', '$SOURCE'), 'copied', '.in')
+    context.Result(out)
+    return out
+
+def CheckDisplay(context):
+    context.Display('Checking without Message ... ')
+    ok = context.TryCompile('int displayed;', '.c')
+    context.Result(ok)
+    return bool(ok)
+
+conf = Configure(env, custom_tests={'CheckOutput': CheckOutput,
+                                    'CheckAction': CheckAction,
+                                    'CheckDisplay': CheckDisplay})
+if ARGUMENTS.get('BATCH'):
+    checks = conf.Batch(num_jobs=2)
+else:
+    checks = conf
+results = [
+    ("math.h", checks.CheckCHeader('math.h')),
+    ("missing.h", checks.CheckCHeader('no_such_header_here.h')),
+    ("local.h", checks.CheckCHeader('local.h')),
+    ("LOCAL_OK", checks.CheckDeclaration('LOCAL_OK', '#include "local.h"')),
+    ("output", checks.CheckOutput()),
+    ("action", checks.CheckAction()),
+    ("display", checks.CheckDisplay()),
+    ("lib", checks.CheckLib(['m', 'no_such_library_here'], autoadd=False)),
+]
+if checks is not conf:
+    checks.run()
+    results = [(name, r.result) for name, r in results]
+for name, result in results:
+    print("%s: %s" % (name, result))
+env = conf.Finish()
+""")
+
+test.subdir('inc')
+
+expect = [
+    "math.h: True",
+    "missing.h: False",
+    "local.h: False",
+    "LOCAL_OK: False",
+    "output: hello",
+    "action: copied",
+    "display: True",
+    "lib: True",
+]
+
+def fresh_checkout():
+    test.unlink_files('.', ['config.log', test.get_sconsignname() + '.dblite'])
+    shutil.rmtree(test.workpath('.sconf_temp'))
+
+def objects():
+    return glob.glob(test.workpath('.sconf_temp', '*' + _obj))
+
+test.run(arguments='.')
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_not_contain_any_line(test.stdout(), ['(cached)'])
+test.must_exist('confcache')
+test.fail_test(not objects())
+
+fresh_checkout()
+test.run(arguments='.')
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_contain_all_lines(test.stdout(), [
+    "Checking for C header file math.h... (cached) yes",
+    "Checking for C header file no_such_header_here.h... (cached) no",
+    "Checking program output ... (cached) hello",
+    "Checking action output ... (cached) copied",
+    "Checking without Message ... (cached) yes",
+    "Checking for C library m... (cached) yes",
+])
+test.fail_test(objects(), message="a tool was run: %s" % objects())
+test.must_contain('config.log', "replayed from the results cache")
+
+# in a batch, the replayed checks build nothing, not even the test
+# programs of fallbacks they do not get to
+fresh_checkout()
+test.run(arguments='BATCH=1 .')
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_contain_all_lines(test.stdout(), [
+    "Checking for C header file math.h... (cached) yes",
+    "Checking program output ... (cached) hello",
+    "Checking without Message ... (cached) yes",
+    "Checking for C library m... (cached) yes",
+])
+test.must_not_contain_any_line(test.stdout(), ['no_such_library_here'])
+test.fail_test(objects(), message="a tool was run: %s" % objects())
+
+# different construction variables give different checks
+fresh_checkout()
+test.run(arguments='CCFLAGS=-DCONFIGURECACHE .')
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_contain_all_lines(test.stdout(), [
+    "Checking for C header file math.h... yes",
+    "Checking program output ... hello",
+    "Checking action output ... (cached) copied",
+])
+test.fail_test(not objects())
+
+# a header added to a searched directory: the failed checks are redone
+test.write(['inc', 'local.h'], "#define LOCAL_OK 1\n")
+fresh_checkout()
+test.run(arguments='.')
+test.must_contain_all_lines(test.stdout(), [
+    "Checking for C header file math.h... (cached) yes",
+    "Checking for C header file local.h... yes",
+    "Checking whether LOCAL_OK is declared... yes",
+])
+
+# a header the checks found changes: the checks using it are redone
+test.write(['inc', 'local.h'], "#define LOCAL_NOT_OK 1\n")
+fresh_checkout()
+test.run(arguments='.')
+test.must_contain_all_lines(test.stdout(), [
+    "Checking for C header file math.h... (cached) yes",
+    "Checking for C header file local.h... yes",
+    "Checking whether LOCAL_OK is declared... no",
+])
+
+test.pass_test()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Verify that an object using a Fortran module depends on the module
+file produced by another object, even when the module directory is
+not on the search path, and that a rebuild is up to date.
+"""
+
+import os
+
+import TestSCons
+
+_python_ = TestSCons._python_
+
+test = TestSCons.TestSCons()
+
+test.write('myfortran.py', r"""
+import os.path
+import re
+import sys
+mod_regex = "(?im)^\\s*MODULE\\s+(\\w+)"
+with open(sys.argv[2]) as f:
+    contents = f.read()
+modules = re.findall(mod_regex, contents)
+moddir = sys.argv[1]
+for m in modules:
+    with open(os.path.join(moddir, m.lower() + '.mod'), 'w') as f:
+        f.write('module %s\n' % m)
+with open(sys.argv[3], 'w') as f:
+    f.write(contents)
+""")
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+env = Environment(F90COM=r'%(_python_)s myfortran.py $FORTRANMODDIR $SOURCE $TARGET',
+                  FORTRANMODDIR='modules')
+env.Object(target='b.obj', source='b.f90')
+env.Object(target='a.obj', source='a.f90')
+""" % locals())
+
+test.write('a.f90', """\
+module mod_a
+end module mod_a
+""")
+
+test.write('b.f90', """\
+program b
+  use mod_a
+end
+""")
+
+test.subdir('modules')
+
+test.run(arguments='-Q --tree=prune b.obj')
+test.must_contain_all_lines(test.stdout(), [os.path.join('modules', 'mod_a.mod')])
+test.must_exist(['modules', 'mod_a.mod'])
+test.must_exist('a.obj')
+
+test.up_to_date(arguments='.')
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test the --glob-cache option: directory listings read by Glob are saved
+between runs, reused while the directory is unchanged, and read again
+once it changes.
+"""
+
+import os
+import pickle
+import time
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.subdir('src')
+
+test.write('SConstruct', """\
+if ARGUMENTS.get('setoption'):
+    SetOption('glob_cache', True)
+for variant in ('build1', 'build2'):
+    VariantDir(variant, 'src', duplicate=False)
+    print("%s: %s" % (variant, sorted(n.get_internal_path() for n in Glob(variant + '/*.c'))))
+print("strings: %s" % Glob('src/*.c', strings=True))
+""")
+
+test.write(['src', 'a.c'], "a.c\n")
+test.write(['src', 'b.c'], "b.c\n")
+test.write(['src', 'b.h'], "b.h\n")
+src = test.workpath('src')
+past = time.time() - 60
+os.utime(src, (past, past))
+
+cache = test.workpath('.glob_cache')
+expect = [
+    "build1: ['build1/a.c', 'build1/b.c']".replace('/', os.sep),
+    "build2: ['build2/a.c', 'build2/b.c']".replace('/', os.sep),
+    "strings: ['src/a.c', 'src/b.c']".replace('/', os.sep),
+]
+
+# without the option, no cache is written
+test.run(arguments=['-Q', '.'])
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_not_exist(cache)
+
+test.run(arguments=['--glob-cache', '-Q', '.'])
+test.must_contain_all_lines(test.stdout(), expect)
+test.must_exist(cache)
+with open(cache, 'rb') as f:
+    version, entries = pickle.load(f)
+test.fail_test(sorted(entries[src][2]['*.c']) != ['a.c', 'b.c'])
+
+# unchanged: the cache isn't rewritten
+mtime = os.path.getmtime(cache)
+test.run(arguments=['--glob-cache', '-Q', '.'])
+test.must_contain_all_lines(test.stdout(), expect)
+test.fail_test(os.path.getmtime(cache) != mtime)
+
+# a new file changes the directory, which is listed again
+test.write(['src', 'c.c'], "c.c\n")
+test.run(arguments=['-Q', 'setoption=1', '.'])
+test.must_contain_all_lines(test.stdout(), [
+    "build1: ['build1/a.c', 'build1/b.c', 'build1/c.c']".replace('/', os.sep),
+    "strings: ['src/a.c', 'src/b.c', 'src/c.c']".replace('/', os.sep),
+])
+
+# a damaged cache file is ignored and replaced
+os.utime(src, (past, past))
+test.write(cache, "not a cache")
+test.run(arguments=['--glob-cache', '-Q', '.'])
+test.must_contain_all_lines(test.stdout(), [
+    "strings: ['src/a.c', 'src/b.c', 'src/c.c']".replace('/', os.sep),
+])
+test.fail_test(test.read(cache) == b"not a cache")
+
+test.pass_test()
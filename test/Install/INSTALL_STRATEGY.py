@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# MIT Licenxe
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test the INSTALL_STRATEGY and INSTALL_JOBS construction variables.
+"""
+
+import os
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.subdir('src', ['src', 'tree'], ['src', 'tree', 'sub'])
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+env = Environment(tools=['install'])
+env.Install('copy', 'src/f1', INSTALL_STRATEGY='copy')
+env.Install('hardlink', 'src/f1', INSTALL_STRATEGY='hardlink')
+env.Install('reflink', 'src/f1', INSTALL_STRATEGY='reflink')
+tree = env.Install('parallel', 'src/tree', INSTALL_JOBS='$NJOBS', NJOBS=4,
+                   INSTALL_STRATEGY='$HOW', HOW=ARGUMENTS.get('HOW', 'hardlink'))
+if 'HOW' in ARGUMENTS:
+    # directories are only installed again when missing
+    AlwaysBuild(tree)
+env.Install('switch', 'src/f1', INSTALL_STRATEGY=ARGUMENTS.get('HOW', 'hardlink'))
+env.Install('invalid', 'src/f1', INSTALL_STRATEGY='symlink')
+""")
+
+test.write(['src', 'f1'], "f1\n")
+for i in range(20):
+    test.write(['src', 'tree', 'f%d' % i], "tree/f%d\n" % i)
+    test.write(['src', 'tree', 'sub', 's%d' % i], "tree/sub/s%d\n" % i)
+
+test.run(arguments='copy hardlink reflink parallel switch')
+
+test.must_match(['copy', 'f1'], "f1\n")
+test.must_match(['hardlink', 'f1'], "f1\n")
+test.must_match(['reflink', 'f1'], "f1\n")
+for i in range(20):
+    test.must_match(['parallel', 'tree', 'f%d' % i], "tree/f%d\n" % i)
+    test.must_match(['parallel', 'tree', 'sub', 's%d' % i], "tree/sub/s%d\n" % i)
+
+src_ino = os.stat(test.workpath('src', 'f1')).st_ino
+test.fail_test(os.stat(test.workpath('copy', 'f1')).st_ino == src_ino)
+if os.name == 'posix':
+    test.fail_test(os.stat(test.workpath('hardlink', 'f1')).st_ino != src_ino)
+    test.fail_test(os.stat(test.workpath('parallel', 'tree', 'sub', 's0')).st_ino
+                   != os.stat(test.workpath('src', 'tree', 'sub', 's0')).st_ino)
+
+test.up_to_date(arguments='copy hardlink reflink parallel')
+
+# A changed source is installed again.
+os.unlink(test.workpath('src', 'f1'))
+test.write(['src', 'f1'], "f1 changed\n")
+test.run(arguments='copy hardlink reflink')
+test.must_match(['copy', 'f1'], "f1 changed\n")
+test.must_match(['hardlink', 'f1'], "f1 changed\n")
+test.must_match(['reflink', 'f1'], "f1 changed\n")
+
+# Changing the strategy installs a file again.  A directory installed
+# again replaces the hard links rather than writing through them to the
+# sources.
+for how in ('reflink', 'copy'):
+    test.not_up_to_date(arguments='HOW=%s switch' % how)
+    test.fail_test(os.stat(test.workpath('switch', 'f1')).st_ino
+                   == os.stat(test.workpath('src', 'f1')).st_ino)
+    test.run(arguments='HOW=%s parallel' % how)
+    for i in range(20):
+        test.must_match(['src', 'tree', 'sub', 's%d' % i], "tree/sub/s%d\n" % i)
+        test.must_match(['parallel', 'tree', 'sub', 's%d' % i], "tree/sub/s%d\n" % i)
+    test.fail_test(os.stat(test.workpath('parallel', 'tree', 'sub', 's0')).st_ino
+                   == os.stat(test.workpath('src', 'tree', 'sub', 's0')).st_ino)
+
+expect = """\
+scons: *** [invalid/f1] Invalid INSTALL_STRATEGY 'symlink', must be one of copy, hardlink, reflink
+"""
+test.run(arguments='invalid', status=2, stderr=expect)
+
+test.pass_test()
+
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test batching JavaClassFile compilations into one javac call with
+$JAVAC_BATCH.
+
+This test does not require a JDK to operate.
+"""
+
+import TestSCons
+
+_python_ = TestSCons._python_
+
+test = TestSCons.TestSCons()
+
+test.write('fake_javac.py', """\
+import os
+import sys
+
+args = sys.argv[1:]
+classdir = '.'
+sources = []
+while args:
+    arg = args.pop(0)
+    if arg == '-d':
+        classdir = args.pop(0)
+    elif arg == '-sourcepath':
+        args.pop(0)
+    else:
+        sources.append(arg)
+with open('javac.log', 'a') as log:
+    log.write(' '.join(sorted(os.path.basename(s) for s in sources)) + '\\n')
+for s in sources:
+    base = os.path.splitext(os.path.basename(s))[0]
+    with open(os.path.join(classdir, base + '.class'), 'w') as f:
+        f.write(s + '\\n')
+""")
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+env = Environment(tools=['javac'],
+                  JAVAC=r'%(_python_)s fake_javac.py',
+                  JAVAC_BATCH=ARGUMENTS.get('JAVAC_BATCH'))
+env.Java(target='classes', source=['src/A.java', 'src/B.java', 'src/C.java'])
+""" % locals())
+
+test.subdir('src')
+for name in 'ABC':
+    test.write(['src', name + '.java'], "public class %s {}\\n" % name)
+
+def javac_calls():
+    calls = test.read('javac.log', mode='r').splitlines()
+    test.unlink('javac.log')
+    return sorted(calls)
+
+# Without batching, there is a javac call per source.
+test.run(arguments='.')
+test.fail_test(javac_calls() != ['A.java', 'B.java', 'C.java'])
+
+test.run(arguments='-c .')
+
+# With batching, all sources go to one javac call.
+test.run(arguments='JAVAC_BATCH=1 .')
+test.fail_test(javac_calls() != ['A.java B.java C.java'])
+for name in 'ABC':
+    test.must_exist(['classes', name + '.class'])
+
+test.up_to_date(options='JAVAC_BATCH=1', arguments='.')
+
+# Only the changed sources are recompiled.
+test.write(['src', 'B.java'], "public class B { int x; }\\n")
+test.run(arguments='JAVAC_BATCH=1 .')
+test.fail_test(javac_calls() != ['B.java'])
+
+test.up_to_date(options='JAVAC_BATCH=1', arguments='.')
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
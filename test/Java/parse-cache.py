@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test that the class names parsed out of .java files are cached in
+the .sconsign file and only re-parsed when the file or JAVAVERSION
+changes.
+
+This test does not require a JDK to operate.
+"""
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.write('SConstruct', """\
+import os
+import SCons.Tool.javac
+
+parse_java_file = SCons.Tool.javac.parse_java_file
+
+def counting_parse(fn, version):
+    print("parsing %s" % os.path.basename(fn))
+    return parse_java_file(fn, version)
+
+SCons.Tool.javac.parse_java_file = counting_parse
+
+def fake_javac(target, source, env):
+    for t in target:
+        with open(str(t), 'w') as f:
+            f.write(str(t))
+
+DefaultEnvironment(tools=[])
+env = Environment(tools=['javac'],
+                  JAVACCOM=Action(fake_javac),
+                  JAVAVERSION=ARGUMENTS.get('JAVAVERSION', '1.8'))
+env.Java(target='classes', source='src')
+""")
+
+test.subdir('src')
+
+test.write(['src', 'Example1.java'], """\
+package com.sub;
+
+public class Example1 {
+    class Inner {}
+}
+""")
+
+test.write(['src', 'Example2.java'], """\
+package com.sub;
+
+public class Example2 {}
+""")
+
+test.run(arguments='-Q .')
+test.must_contain_all_lines(test.stdout(), ['parsing Example1.java',
+                                            'parsing Example2.java'])
+test.must_exist(['classes', 'com', 'sub', 'Example1.class'])
+test.must_exist(['classes', 'com', 'sub', 'Example1$Inner.class'])
+test.must_exist(['classes', 'com', 'sub', 'Example2.class'])
+
+# Nothing changed: the cached parse results are used.
+test.run(arguments='-Q .')
+test.must_not_contain_any_line(test.stdout(), ['parsing'])
+test.must_contain_all_lines(test.stdout(), ["is up to date"])
+
+# Only the changed file is parsed again.
+test.write(['src', 'Example2.java'], """\
+package com.sub;
+
+public class Example2 {}
+class Example3 {}
+""")
+
+test.run(arguments='-Q .')
+test.must_contain_all_lines(test.stdout(), ['parsing Example2.java'])
+test.must_not_contain_any_line(test.stdout(), ['parsing Example1.java'])
+test.must_exist(['classes', 'com', 'sub', 'Example3.class'])
+
+test.run(arguments='-Q .')
+test.must_not_contain_any_line(test.stdout(), ['parsing'])
+
+# A different JAVAVERSION can yield different class names.
+test.run(arguments='-Q JAVAVERSION=1.4 .')
+test.must_contain_all_lines(test.stdout(), ['parsing Example1.java',
+                                            'parsing Example2.java'])
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Test Repository(manifest=...): lookups in the repository, including
+those of Glob, are answered from a manifest file, which must exist.
+"""
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.subdir('work', 'repository', ['repository', 'src'])
+
+test.write(['work', 'SConstruct'], """\
+def cat(env, source, target):
+    with open(str(target[0]), "w") as ofp:
+        for src in source:
+            with open(str(src), "r") as ifp:
+                ofp.write(ifp.read())
+
+manifest = ARGUMENTS.get('manifest', True)
+Repository('../repository', manifest=manifest)
+env = Environment(BUILDERS={'Build': Builder(action=cat)})
+env.Build('aaa.out', 'aaa.in')
+env.Build('src/xxx.out', 'src/xxx.in')
+env.Build('bbb.out', 'bbb.in')
+if ARGUMENTS.get('ccc'):
+    env.Build('ccc.out', 'ccc.in')
+env.Build('all.out', sorted(Glob('*.in')))
+""")
+
+test.write(['repository', 'aaa.in'], "repository/aaa.in\n")
+test.write(['repository', 'src', 'xxx.in'], "repository/src/xxx.in\n")
+test.write(['work', 'bbb.in'], "work/bbb.in\n")
+
+manifest = test.workpath('repository', '.scons_manifest')
+
+# the manifest is not generated
+test.run(chdir='work', arguments='.', status=2, stderr=None)
+test.must_contain_all_lines(test.stderr(), [
+    "Repository manifest `%s' not found." % manifest
+])
+
+test.write(manifest, """\
+f 18 0 aaa.in
+d 0 0 src
+f 22 0 src/xxx.in
+""")
+
+test.run(chdir='work', arguments='.')
+test.must_match(['work', 'aaa.out'], "repository/aaa.in\n", mode='r')
+test.must_match(['work', 'src', 'xxx.out'], "repository/src/xxx.in\n", mode='r')
+test.must_match(['work', 'bbb.out'], "work/bbb.in\n", mode='r')
+test.must_match(['work', 'all.out'], "repository/aaa.in\nwork/bbb.in\n", mode='r')
+test.up_to_date(chdir='work', arguments='.')
+
+# a file the manifest doesn't list is not found in the repository,
+# neither by Glob (also with the cache of directory listings)
+test.write(['repository', 'ccc.in'], "repository/ccc.in\n")
+test.run(chdir='work', arguments='ccc=1 ccc.out', status=2, stderr=None)
+test.must_contain_all_lines(test.stderr(), ["Source `ccc.in' not found"])
+test.up_to_date(chdir='work', options='--glob-cache', arguments='all.out')
+
+# until the manifest lists it
+test.write(manifest, """\
+f 18 0 aaa.in
+f 18 0 ccc.in
+d 0 0 src
+f 22 0 src/xxx.in
+""")
+test.run(chdir='work', arguments='--glob-cache ccc=1 .')
+test.must_match(['work', 'ccc.out'], "repository/ccc.in\n", mode='r')
+test.must_match(['work', 'all.out'],
+                "repository/aaa.in\nwork/bbb.in\nrepository/ccc.in\n", mode='r')
+
+# a manifest can also be named, and written by other tools
+test.write('manifest.txt', "f 18 0 aaa.in\n")
+test.unlink(['work', 'aaa.out'])
+test.run(chdir='work', arguments=['manifest=../manifest.txt', 'aaa.out'])
+test.must_match(['work', 'aaa.out'], "repository/aaa.in\n", mode='r')
+test.run(chdir='work', arguments=['manifest=../manifest.txt', 'src/xxx.out'],
+         status=2, stderr=None)
+
+test.pass_test()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Verify SConsignFile(sharded=True): one database file per top-level
+directory, and a targeted build only rewrites the shard it touches.
+"""
+
+import os
+
+import TestSCons
+
+_python_ = TestSCons._python_
+
+test = TestSCons.TestSCons()
+
+test.subdir('sub1', 'sub2')
+
+test.write('build.py', r"""
+import sys
+with open(sys.argv[1], 'wb') as ofp, open(sys.argv[2], 'rb') as ifp:
+    ofp.write(ifp.read())
+sys.exit(0)
+""")
+
+test.write('SConstruct', """
+SConsignFile(sharded=True)
+DefaultEnvironment(tools=[])
+B = Builder(action=r'%(_python_)s build.py $TARGETS $SOURCES')
+env = Environment(BUILDERS={'B': B}, tools=[])
+env.B(target='f1.out', source='f1.in')
+env.B(target='sub1/f2.out', source='sub1/f2.in')
+env.B(target='sub2/f3.out', source='sub2/f3.in')
+""" % locals())
+
+test.write('f1.in', "f1.in\n")
+test.write(['sub1', 'f2.in'], "sub1/f2.in\n")
+test.write(['sub2', 'f3.in'], "sub2/f3.in\n")
+
+test.run(arguments='.')
+
+database_name = test.get_sconsignname()
+shards = test.workpath(database_name + '.shards')
+test.must_not_exist(test.workpath(database_name + '.dblite'))
+test.must_exist([shards, 'root.dblite'])
+test.must_exist([shards, 'd_sub1.dblite'])
+test.must_exist([shards, 'd_sub2.dblite'])
+
+test.must_match('f1.out', "f1.in\n")
+test.must_match(['sub1', 'f2.out'], "sub1/f2.in\n")
+test.must_match(['sub2', 'f3.out'], "sub2/f3.in\n")
+
+test.up_to_date(arguments='.')
+
+# rebuilding in sub1 leaves the sub2 shard alone
+sub2_mtime = os.path.getmtime(os.path.join(shards, 'd_sub2.dblite'))
+test.sleep()
+test.write(['sub1', 'f2.in'], "sub1/f2.in 2\n")
+test.run(arguments='sub1')
+test.must_match(['sub1', 'f2.out'], "sub1/f2.in 2\n")
+test.fail_test(
+    os.path.getmtime(os.path.join(shards, 'd_sub2.dblite')) != sub2_mtime,
+    message="the sub2 shard was rewritten",
+)
+
+test.up_to_date(arguments='.')
+
+test.pass_test()
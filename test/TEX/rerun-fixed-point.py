@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Verify that the state of the auxiliary files is remembered from the last
+build which reached a fixed point: rebuilding a document for a reason
+that does not change them (here, an explicit dependency) runs LaTeX only
+once and skips BibTeX, while a changed bibliography still runs both.
+"""
+
+import TestSCons
+
+_python_ = TestSCons._python_
+
+test = TestSCons.TestSCons()
+
+test.write('mylatex.py', r"""
+import os
+import sys
+args = [a for a in sys.argv[1:] if not a.startswith('-')]
+base = os.path.splitext(args[0])[0]
+with open(args[0]) as f:
+    contents = f.read()
+bbl = ''
+if os.path.exists(base + '.bbl'):
+    with open(base + '.bbl') as f:
+        bbl = f.read()
+with open('figure.txt') as f:
+    figure = f.read()
+with open(base + '.aux', 'w') as f:
+    f.write('\\relax\n\\citation{knuth}\n\\bibdata{refs}\n')
+with open(base + '.fls', 'w') as f:
+    f.write('OUTPUT %s.aux\n' % base)
+with open(base + '.log', 'w') as f:
+    f.write('LaTeX Warning: There were undefined references.\n')
+with open(base + '.dvi', 'w') as f:
+    f.write(contents + bbl + figure)
+with open('runs.txt', 'a') as f:
+    f.write('latex\n')
+""")
+
+test.write('mybibtex.py', r"""
+import sys
+base = sys.argv[-1]
+with open('refs.bib') as f:
+    refs = f.read()
+with open(base + '.bbl', 'w') as f:
+    f.write(refs)
+with open('runs.txt', 'a') as f:
+    f.write('bibtex\n')
+""")
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+env = Environment(tools=['latex'],
+                  LATEX=r'%(_python_)s mylatex.py',
+                  BIBTEX=r'%(_python_)s mybibtex.py')
+dvi = env.DVI(target='test.dvi', source='test.ltx')
+env.Depends(dvi, 'figure.txt')
+""" % locals())
+
+test.write('test.ltx', r"""\documentclass{article}
+\begin{document}
+\cite{knuth}
+\bibliography{refs}
+\end{document}
+""")
+
+test.write('refs.bib', "@book{knuth, title={TeX}}\n")
+test.write('figure.txt', "figure 1\n")
+
+# The reference never resolves, so the first build reruns LaTeX until
+# it runs out of retries.
+test.run(arguments='.', stdout=None)
+test.must_match('runs.txt', "latex\nbibtex\nlatex\nlatex\nlatex\n", mode='r')
+test.unlink('runs.txt')
+
+test.up_to_date(arguments='.')
+
+# Only the figure changed: one LaTeX pass, no BibTeX.
+test.write('figure.txt', "figure 2\n")
+test.run(arguments='.')
+test.must_match('runs.txt', "latex\n", mode='r')
+test.must_contain('test.dvi', "figure 2\n", mode='r')
+test.unlink('runs.txt')
+
+# The bibliography changed: BibTeX runs, and LaTeX again until it runs
+# out of retries, as this is a new fixed point.
+test.write('refs.bib', "@book{knuth, title={The TeXbook}}\n")
+test.run(arguments='.', stdout=None)
+test.must_match('runs.txt', "latex\nbibtex\nlatex\nlatex\nlatex\n", mode='r')
+test.must_contain('test.dvi', "The TeXbook", mode='r')
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Verify that with NINJA_SUBNINJA the build statements are written to
+per-directory fragments, and that regenerating the ninja file only
+writes the fragments which changed.
+"""
+
+import os
+
+import TestSCons
+from TestCmd import IS_WINDOWS
+
+test = TestSCons.TestSCons()
+
+try:
+    import ninja
+except ImportError:
+    test.skip_test("Could not find module in python")
+
+_exe = TestSCons._exe
+
+ninja_bin = TestSCons.NINJA_BINARY
+
+test.dir_fixture('ninja-fixture')
+
+test.file_fixture('ninja_test_sconscripts/sconstruct_subninja', 'SConstruct')
+
+subninja_dir = test.workpath('.ninja', 'subninja')
+
+def fragments():
+    return {name: os.path.getmtime(os.path.join(subninja_dir, name))
+            for name in os.listdir(subninja_dir) if name.endswith('.ninja')}
+
+# generate and build
+test.run(stdout=None)
+test.must_contain_all_lines(test.stdout(), ['Generating: build.ninja'])
+test.must_contain('build.ninja', 'subninja .ninja/subninja/', mode='r')
+test.run(program=test.workpath('foo' + _exe), stdout="foo.c")
+test.run(program=test.workpath('build', 'bar' + _exe), stdout="bar.c")
+test.run(arguments='--disable-execute-ninja', stdout=None)
+first = fragments()
+test.fail_test(len(first) != 2, message="expected 2 fragments, got %s\n" % first)
+build_ninja = test.read('build.ninja', mode='r')
+
+# change only the top-level directory: the other fragment is kept as is,
+# and the main file still includes the same fragments
+test.write('defines.txt', "FOO\n")
+test.run(arguments='--disable-execute-ninja', stdout=None)
+test.must_contain_all_lines(test.stdout(), ['Generating: build.ninja'])
+second = fragments()
+test.fail_test(set(second) != set(first), message="expected the same fragments, got %s\n" % second)
+test.fail_test(test.read('build.ninja', mode='r') != build_ninja,
+               message="build.ninja changed\n")
+rewritten = [name for name in first if first[name] != second[name]]
+test.fail_test(len(rewritten) != 1, message="expected 1 rewritten fragment, got %s\n" % rewritten)
+test.must_contain(os.path.join(subninja_dir, rewritten[0]), '-DFOO', mode='r')
+
+# nothing changed: no fragment is written
+test.run(arguments='--disable-execute-ninja', stdout=None)
+test.fail_test(fragments() != second, message="a fragment was rewritten\n")
+
+# run ninja independently
+program = test.workpath('run_ninja_env.bat') if IS_WINDOWS else ninja_bin
+test.run(program=program, stdout=None)
+test.run(program=test.workpath('foo' + _exe), stdout="foo.c")
+
+test.pass_test()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Test the --changed-files option.
+"""
+
+import os
+
+import TestSCons
+
+_python_ = TestSCons._python_
+
+test = TestSCons.TestSCons()
+
+test.write('SConstruct', """\
+import re
+
+include_re = re.compile(r'^include\\s+(\\S+)$', re.M)
+
+def scan(node, env, path):
+    return env.File(include_re.findall(node.get_text_contents()))
+
+def cat(target, source, env):
+    # include the implicit dependencies, so their changes propagate
+    with open(str(target[0]), 'w') as ofp:
+        for s in target[0].children():
+            ofp.write(s.get_text_contents())
+
+env = Environment(tools=[], SCANNERS=[Scanner(scan, skeys=['.in'])])
+env.Command('a.out', 'a.in', cat)
+env.Command('b.out', 'b.in', cat)
+env.Command('all.out', ['a.out', 'b.out'], cat)
+env.Command('c.out', 'c.in', cat)
+Alias('ab', ['a.out', 'b.out'])
+env.Command('glob.out', Glob('g*.txt'), cat)
+""")
+
+test.write('a.in', "include common.h\n")
+test.write('b.in', "include other.h\n")
+test.write('c.in', "c\n")
+test.write('common.h', "common\n")
+test.write('other.h', "other\n")
+test.write('g1.txt', "g1\n")
+test.subdir('site_scons')
+test.write(['site_scons', 'helper.py'], "")
+
+test.run(arguments='-Q .')
+
+test.write('common.h', "common 2\n")
+test.write('changes.txt', "# changed files\ncommon.h\n")
+
+expect = test.wrap_stdout("""\
+cat(["a.out"], ["a.in"])
+cat(["all.out"], ["a.out", "b.out"])
+""")
+test.run(arguments='--changed-files=changes.txt', stdout=expect)
+test.must_exist('.sconsign.rdeps')
+test.up_to_date(arguments='.')
+
+# only the requested targets are considered
+test.write('common.h', "common 3\n")
+test.run(arguments='-Q --changed-files=changes.txt b.out',
+         stdout="No targets are affected by the changed files\n")
+test.run(arguments='-Q --changed-files=changes.txt ab',
+         stdout='cat(["a.out"], ["a.in"])\n')
+test.run(arguments='-Q --changed-files=changes.txt',
+         stdout='cat(["all.out"], ["a.out", "b.out"])\n')
+
+# several changes, one of them a source
+test.write('other.h', "other 2\n")
+test.write('c.in', "c 2\n")
+test.write('changes.txt', "other.h\nc.in\n")
+test.run(arguments='-Q --changed-files=changes.txt', stdout="""\
+cat(["b.out"], ["b.in"])
+cat(["all.out"], ["a.out", "b.out"])
+cat(["c.out"], ["c.in"])
+""")
+
+# a source the last build didn't know about, picked up by Glob
+test.write('g2.txt', "g2\n")
+test.write('changes.txt', "g2.txt\n")
+test.run(arguments='-Q --changed-files=changes.txt',
+         stdout='cat(["glob.out"], ["g1.txt", "g2.txt"])\n')
+
+# a target added by a changed SConstruct is built
+test.write('SConstruct', test.read('SConstruct', mode='r') +
+           "env.Command('d.out', 'c.in', cat)\n")
+test.write('changes.txt', "other.h\nSConstruct\n")
+test.run(arguments='-Q --changed-files=changes.txt',
+         stdout='cat(["d.out"], ["c.in"])\n')
+
+# the index follows dependencies which changed in the last build
+test.write('b.in', "include common.h\n")
+test.run(arguments='-Q .')
+test.write('common.h', "common 4\n")
+test.write('changes.txt', "common.h\n")
+test.run(arguments='-Q --changed-files=changes.txt b.out',
+         stdout='cat(["b.out"], ["b.in"])\n')
+test.write('other.h', "other 3\n")
+test.write('changes.txt', "other.h\n")
+test.run(arguments='--changed-files=changes.txt b.out')
+test.must_contain_all_lines(test.stdout(), [
+    "scons: other.h is not a known dependency, considering all targets.\n",
+])
+test.run(arguments='.')
+
+# files which are not known dependencies consider all the requested targets
+for changed in ('nonesuch.h', 'site_scons/helper.py'):
+    test.write('changes.txt', changed + "\n")
+    test.run(arguments='--changed-files=changes.txt')
+    test.must_contain_all_lines(test.stdout(), [
+        "scons: %s is not a known dependency, considering all targets.\n"
+        % os.path.normpath(changed),
+        "scons: `.' is up to date.\n",
+    ])
+
+# a changed SConstruct considers all the requested targets
+test.write('changes.txt', "SConstruct\n")
+test.run(arguments='-Q --changed-files=changes.txt',
+         stdout="scons: `.' is up to date.\n")
+
+test.run(arguments='-Q --changed-files=nonesuch.txt', status=2, stderr=None)
+test.must_contain_all(test.stderr(),
+                      "scons: *** Cannot read changed files list nonesuch.txt")
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+
+"""
+Verify that --checkpoint-tasks and --checkpoint-interval save the
+signatures of built targets, so a build killed before it could write
+the .sconsign database does not rebuild them next time.
+"""
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.write('SConstruct', """\
+import os
+
+DefaultEnvironment(tools=[])
+
+def build(target, source, env):
+    if ARGUMENTS.get('die') == str(target[0]):
+        os._exit(1)
+    with open(str(target[0]), 'w') as f:
+        f.write(source[0].get_text_contents())
+
+env = Environment(tools=[], BUILDERS={'B': Builder(action=build)})
+env.B('a.out', 'a.in')
+env.B('b.out', 'b.in')
+env.B('c.out', 'c.in')
+""")
+
+test.write('a.in', "a.in\n")
+test.write('b.in', "b.in\n")
+test.write('c.in', "c.in\n")
+
+journal = test.get_sconsignname() + '.journal'
+
+def built(stdout):
+    return sorted(
+        line.split('"')[1] for line in stdout.splitlines()
+        if line.startswith('build(')
+    )
+
+# without checkpoints, a killed build loses everything
+test.run(arguments='-Q die=c.out .', status=1, stderr=None)
+test.must_not_exist(test.workpath(journal))
+test.run(arguments='-Q .')
+test.fail_test(built(test.stdout()) != ['a.out', 'b.out', 'c.out'], message=test.stdout())
+
+test.run(arguments='-c .')
+test.run(arguments='-Q --checkpoint-tasks=1 die=c.out .', status=1, stderr=None)
+test.must_exist(test.workpath(journal))
+test.run(arguments='-Q .')
+test.fail_test(built(test.stdout()) != ['c.out'], message=test.stdout())
+test.must_not_exist(test.workpath(journal))
+test.up_to_date(arguments='.')
+
+test.run(arguments='-c .')
+test.run(arguments='-Q --checkpoint-interval=0 --checkpoint-tasks=2 die=c.out .',
+         status=1, stderr=None)
+test.run(arguments='-Q .')
+test.fail_test(built(test.stdout()) != ['c.out'], message=test.stdout())
+
+test.pass_test()
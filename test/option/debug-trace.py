@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test that the --debug=trace option writes a trace-event file.
+"""
+
+import json
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.subdir('sub')
+
+test.write('SConstruct', """\
+DebugOptions(trace=ARGUMENTS.get('TRACE', 'scons_trace.json'))
+env = Environment(tools=[])
+SConscript('sub/SConscript', exports='env')
+""")
+
+test.write(['sub', 'SConscript'], """\
+Import('env')
+env.Command('f1.out', 'f1.in', Copy('$TARGET', '$SOURCE'))
+env.Command('f2.out', 'f1.out', Copy('$TARGET', '$SOURCE'))
+""")
+
+test.write(['sub', 'f1.in'], "f1.in\n")
+
+
+def check_trace_file(filename, built=True):
+    with open(filename, 'r') as tf:
+        trace = json.load(tf)
+    events = trace['traceEvents']
+    threads = [e for e in events if e['ph'] == 'M' and e['name'] == 'thread_name']
+    test.fail_test(not threads, message="No thread_name metadata in trace")
+    spans = [e for e in events if e['ph'] == 'X']
+    for e in spans:
+        for key in ('name', 'cat', 'ts', 'dur', 'pid', 'tid'):
+            test.fail_test(key not in e, message=f"Span missing {key}: {e}")
+    cats = {e['cat'] for e in spans}
+    for cat in ('phase', 'sconscript', 'scan', 'signature', 'taskmaster', 'sconsign'):
+        test.fail_test(cat not in cats, message=f"No {cat} spans in trace")
+    sconscripts = {e['name'] for e in spans if e['cat'] == 'sconscript'}
+    test.fail_test(sconscripts != {'SConstruct', 'sub/SConscript'},
+                   message=f"Unexpected sconscript spans {sconscripts}")
+    nodes = {e['args']['node'] for e in spans if e['cat'] == 'execute'}
+    test.fail_test(('sub/f2.out' in nodes) != built,
+                   message=f"Unexpected execute spans: {nodes}")
+
+
+test.run(arguments='-j2 --debug=trace .')
+test.must_exist('scons_trace.json')
+check_trace_file('scons_trace.json')
+
+test.run(arguments='--debug=trace TRACE=build/output/trace.json .')
+test.must_exist(['build', 'output', 'trace.json'])
+check_trace_file(test.workpath('build', 'output', 'trace.json'), built=False)
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Test the --query option.
+"""
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.write('SConstruct', """\
+import re
+
+include_re = re.compile(r'^include\\s+(\\S+)$', re.M)
+
+def scan(node, env, path):
+    print("scanning %s" % node)
+    return env.File(include_re.findall(node.get_text_contents()))
+
+def cat(target, source, env):
+    with open(str(target[0]), 'w') as ofp:
+        for s in source:
+            ofp.write(s.get_text_contents())
+
+env = Environment(tools=[], SCANNERS=[Scanner(scan, skeys=['.in'])])
+env.Command('a.out', 'a.in', cat)
+env.Command('b.out', 'b.in', cat)
+env.Command('all.out', ['a.out', 'b.out'], cat)
+""")
+
+test.write('a.in', "include common.h\n")
+test.write('b.in', "include other.h\n")
+test.write('common.h', "common\n")
+test.write('other.h', "other\n")
+
+
+def query(expression, expected, scanning=None, ordered=False):
+    test.run(arguments=['-Q', '--query=' + expression])
+    lines = test.stdout().splitlines()
+    scans = sorted(l for l in lines if l.startswith('scanning '))
+    nodes = [l for l in lines if not l.startswith('scanning ')]
+    if not ordered:
+        nodes = sorted(nodes)
+        expected = sorted(expected)
+    test.fail_test(nodes != expected, message=expression)
+    if scanning is not None:
+        test.fail_test(scans != scanning, message=expression)
+
+
+query('kind(file, rdeps(//common.h))', ['a.out', 'all.out', 'common.h'],
+      scanning=['scanning a.in', 'scanning b.in'])
+query('rdeps(common.h, 1)', ['.', 'a.out', 'common.h'])
+query('deps(all.out, 1)', ['a.out', 'all.out', 'b.out'])
+query('deps(all.out) - kind(derived, deps(all.out))',
+      ['a.in', 'b.in', 'common.h', 'other.h'])
+query('somepath(all.out, other.h)', ['all.out', 'b.out', 'other.h'],
+      ordered=True)
+query('allpaths(all.out, *.h)',
+      ['a.out', 'all.out', 'b.out', 'common.h', 'other.h'])
+query('allpaths(a.out, other.h)', [])
+query('kind("^derived", //*.out) ^ rdeps(other.h)', ['all.out', 'b.out'])
+query('filter("^a", deps(all.out)) + b.in', ['a.in', 'a.out', 'all.out', 'b.in'])
+
+# querying doesn't build anything
+test.must_not_exist('all.out')
+
+# after a build, the stored implicit dependencies are used
+test.run(arguments='-Q .')
+query('kind(file, rdeps(//common.h))', ['a.out', 'all.out', 'common.h'],
+      scanning=[])
+
+# errors
+expect = "scons: *** query: 'nonesuch.h' is not in the dependency graph\n"
+test.run(arguments=['-Q', '--query=rdeps(nonesuch.h)'], status=2, stderr=None)
+test.must_contain_all(test.stderr(), expect)
+test.run(arguments=['-Q', '--query=deps(a.out'], status=2, stderr=None)
+test.must_contain_all(test.stderr(), "scons: *** query: unexpected end of query")
+test.run(arguments=['-Q', '--query=deps(a.out, x)'], status=2, stderr=None)
+test.must_contain_all(test.stderr(),
+                      "scons: *** query: deps() depth must be an integer, not 'x'")
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
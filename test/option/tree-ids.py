@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Test the ids, json and dot formats of the --tree option, which print
+each shared subtree of the dependency graph only once.
+"""
+
+import json
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.write('SConstruct', """
+DefaultEnvironment(tools=[])
+env = Environment(tools=[])
+
+def cat(target, source, env):
+    with open(str(target[0]), 'w') as ofp:
+        for s in source:
+            ofp.write(s.get_text_contents())
+
+env.Command('shared.out', ['x.in', 'y.in'], cat)
+env.Command('a.out', ['shared.out', 'a.in'], cat)
+env.Command('b.out', ['shared.out', 'b.in'], cat)
+env.Command('top.out', ['a.out', 'b.out'], cat)
+""")
+
+for name in ['x.in', 'y.in', 'a.in', 'b.in']:
+    test.write(name, name + "\n")
+
+tree = """
++-top.out #1
+  +-a.out #2
+  | +-shared.out #4
+  | | +-x.in #6
+  | | +-y.in #7
+  | +-a.in #5
+  +-b.out #3
+    +-[shared.out #4]
+    +-b.in #8
+"""
+test.run(arguments='-Q --tree=ids top.out')
+test.must_contain_all_lines(test.stdout(), [tree])
+
+tree = """
++-top.out #1
+  +-a.out #2
+  | +-shared.out #4
+  +-b.out #3
+    +-shared.out #4
+"""
+test.run(arguments='-Q --tree=derived,ids top.out')
+test.must_contain_all_lines(test.stdout(), [tree])
+
+test.run(arguments='-Q --tree=json top.out')
+records = [json.loads(line) for line in test.stdout().splitlines()
+           if line.startswith('{')]
+expect = [
+    {'id': 1, 'name': 'top.out', 'children': [2, 3]},
+    {'id': 2, 'name': 'a.out', 'children': [4, 5]},
+    {'id': 4, 'name': 'shared.out', 'children': [6, 7]},
+    {'id': 6, 'name': 'x.in', 'children': []},
+    {'id': 7, 'name': 'y.in', 'children': []},
+    {'id': 5, 'name': 'a.in', 'children': []},
+    {'id': 3, 'name': 'b.out', 'children': [4, 8]},
+    {'id': 8, 'name': 'b.in', 'children': []},
+]
+test.fail_test(records != expect)
+
+test.run(arguments='-Q --tree=json,status top.out')
+records = [json.loads(line) for line in test.stdout().splitlines()
+           if line.startswith('{')]
+status = records[0]['status']
+test.fail_test(not status['exists'] or status['builder'] != 'explicit'
+               or not status['current'])
+
+dot = """\
+digraph "top.out" {
+  n1 [label="top.out"];
+  n1 -> n2;
+  n1 -> n3;
+  n2 [label="a.out"];
+  n2 -> n4;
+  n4 [label="shared.out"];
+  n3 [label="b.out"];
+  n3 -> n4;
+}
+"""
+test.run(arguments='-Q --tree=derived,dot top.out')
+test.must_contain_all_lines(test.stdout(), [dot])
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Test PACKAGESTREAM: the tar packagers write the archive straight from
+the installed files' sources, without copying them into PACKAGEROOT,
+compress it in independent chunks, and produce identical archives
+when built again.  Installed directories are archived with their
+contents.
+"""
+
+import os
+import tarfile
+
+import TestSCons
+
+test = TestSCons.TestSCons()
+
+test.subdir('src', ['src', 'd'])
+
+test.write(['src', 'small.txt'], "small\n")
+test.write(['src', 'd', 'in_d.txt'], "in d\n")
+# big enough to be compressed in several chunks
+test.write(['src', 'big.txt'], ''.join('line %d\n' % i for i in range(1500000)))
+
+test.write('SConstruct', """
+env = Environment(tools=['default', 'packaging'])
+if 'epoch' in ARGUMENTS:
+    env['ENV']['SOURCE_DATE_EPOCH'] = ARGUMENTS['epoch']
+files = env.Install('/usr/share/foo', ['src/small.txt', 'src/big.txt', 'src/d'])
+env.Package(NAME='foo', VERSION='1.0', PACKAGETYPE=['targz', 'tarxz', 'zip'],
+            PACKAGESTREAM=True, PACKAGEJOBS=int(ARGUMENTS.get('jobs', 4)),
+            source=files)
+""")
+
+test.run(arguments='package', stderr=None)
+
+test.must_not_exist('foo-1.0')
+test.must_exist('foo-1.0.zip')
+test.must_not_exist('foo-1.0.zip.zip')
+
+big = test.read(['src', 'big.txt'])
+mtimes = [int(os.path.getmtime(test.workpath('src', *f)))
+          for f in [['big.txt'], ['d'], ['d', 'in_d.txt'], ['small.txt']]]
+
+def check_tars(mtimes):
+    for name in ['foo-1.0.tar.gz', 'foo-1.0.tar.xz']:
+        with tarfile.open(test.workpath(name)) as tar:
+            members = tar.getmembers()
+            test.fail_test([m.name for m in members] !=
+                           ['foo-1.0/usr/share/foo/big.txt',
+                            'foo-1.0/usr/share/foo/d',
+                            'foo-1.0/usr/share/foo/d/in_d.txt',
+                            'foo-1.0/usr/share/foo/small.txt'], message=name)
+            test.fail_test([m.mtime for m in members] != mtimes, message=name)
+            test.fail_test(not members[1].isdir(), message=name)
+            for m in members:
+                test.fail_test(m.uid != 0 or m.gid != 0 or
+                               m.mode != (0o755 if m.isdir() else 0o644),
+                               message=name)
+            test.fail_test(tar.extractfile(members[0]).read() != big, message=name)
+
+# without SOURCE_DATE_EPOCH the members keep the files' mtime
+check_tars(mtimes)
+
+# the gzip archive consists of several members
+gz = test.read('foo-1.0.tar.gz')
+test.fail_test(gz.count(b'\x1f\x8b\x08\x00\x00\x00\x00\x00') < 2)
+
+test.up_to_date(arguments='package')
+
+# a clean rebuild gives identical archives, whatever the number of jobs
+old = [test.read(n) for n in ['foo-1.0.tar.gz', 'foo-1.0.tar.xz', 'foo-1.0.zip']]
+test.run(arguments='-c package', stderr=None)
+test.run(arguments='package jobs=1', stderr=None)
+new = [test.read(n) for n in ['foo-1.0.tar.gz', 'foo-1.0.tar.xz', 'foo-1.0.zip']]
+test.fail_test(old != new)
+
+# setting SOURCE_DATE_EPOCH rebuilds the archives with that mtime
+test.run(arguments='package epoch=1000000000', stderr=None)
+check_tars([1000000000] * 4)
+test.run(arguments='package epoch=1000000000', stderr=None)
+test.must_contain_all_lines(test.stdout(), ["`package' is up to date."])
+
+test.pass_test()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
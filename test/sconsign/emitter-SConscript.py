@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# MIT License
+#
+# Copyright The SCons Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+
+"""
+Verify that an emitter reading the signature database while a
+subsidiary SConscript is read uses the database in the top directory,
+so the following build is up to date.
+"""
+
+import TestSCons
+
+_python_ = TestSCons._python_
+
+test = TestSCons.TestSCons()
+
+test.subdir('sub')
+
+test.write('myfortran.py', r"""
+import sys
+with open(sys.argv[1]) as f:
+    contents = f.read()
+with open(sys.argv[2], 'w') as f:
+    f.write(contents)
+""")
+
+test.write('SConstruct', """\
+DefaultEnvironment(tools=[])
+env = Environment(F90COM=r'%(_python_)s myfortran.py $SOURCE $TARGET')
+Export('env')
+SConscript('sub/SConscript')
+""" % locals())
+
+test.write(['sub', 'SConscript'], """\
+Import('env')
+env.Object(target='s.obj', source='s.f90')
+env.Command('copy.out', 'copy.in', Copy('$TARGET', '$SOURCE'))
+""")
+
+test.write(['sub', 's.f90'], """\
+subroutine s
+end subroutine s
+""")
+test.write(['sub', 'copy.in'], "copy.in\n")
+
+test.run(arguments='.')
+test.must_exist(['sub', 's.obj'])
+test.must_not_exist(['sub', '.sconsign.dblite'])
+test.must_exist('.sconsign.dblite')
+test.up_to_date(arguments='.')
+test.must_not_exist(['sub', '.sconsign.dblite'])
+
+test.pass_test()